@@ -0,0 +1,23 @@
+import sys
+from src.repositories.actionBar.locators import getLeftArrowsPosition
+from src.utils.image import loadFromRGBToGray, save
+
+
+# Refresh the slot count digit templates from a screenshot where `slot` shows a
+# known `count`, e.g. python -m builders.repositories.actionBar.buildDigits shot.png 1 801
+def main(screenshotPath: str, slot: int, count: int):
+    screenshot = loadFromRGBToGray(screenshotPath)
+    leftSideArrowsPos = getLeftArrowsPosition(screenshot)
+    if leftSideArrowsPos is None:
+        raise ValueError('action bar arrows not found')
+    x0 = leftSideArrowsPos[0] + leftSideArrowsPos[2] + \
+        (slot * 2) + ((slot - 1) * 34)
+    slotImage = screenshot[leftSideArrowsPos[1]:leftSideArrowsPos[1] + 34, x0:x0 + 34]
+    for i, digit in enumerate(reversed(str(count))):
+        cellCenterX = 29 - (6 * i)
+        save(slotImage[25:31, cellCenterX - 2:cellCenterX + 3].copy(),
+             f'src/repositories/actionBar/images/digits/glyphs/{digit}.png')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]))
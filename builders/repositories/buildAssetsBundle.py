@@ -0,0 +1,15 @@
+from src.utils.assets import assetsBundlePath, buildAssetsBundle, getAssetKey, getSourceStamp, getTemplatesPaths
+from src.utils.image import load, RGBtoGray
+import numpy as np
+
+
+def main():
+    images = {}
+    for path in getTemplatesPaths():
+        images[getAssetKey(path)] = (np.array(RGBtoGray(load(path)), dtype=np.uint8), getSourceStamp(path))
+    buildAssetsBundle(images, assetsBundlePath)
+    print(f'{len(images)} templates bundled in {assetsBundlePath}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+import numpy as np
+from src.repositories.radar.floorsMaps import buildFloorsMaps, floorsMapsVersion
+from src.utils.image import load, loadFromRGBToGray
+
+
+def main():
+    floors = range(16)
+    floorsImgs = [
+        loadFromRGBToGray(f'src/repositories/radar/images/floor-{floor}.png') for floor in floors
+    ]
+    floorsPathsImgs = [
+        loadFromRGBToGray(f'src/repositories/radar/images/paths/floor-{floor}.png') for floor in floors
+    ]
+    floorsPathsSqms = np.stack([
+        load(f'src/repositories/radar/images/paths/floor-{floor}.png')[:, :, 0] for floor in floors
+    ])
+    buildFloorsMaps(floorsImgs, floorsPathsImgs, floorsPathsSqms, f'src/repositories/radar/npys/floorsMaps.v{floorsMapsVersion}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+from src.repositories.radar.config import floorsImgs, walkableFloorsSqms
+from src.repositories.radar.regions import buildFloorsRegionsGraph
+
+
+def main():
+    buildFloorsRegionsGraph(walkableFloorsSqms, floorsImgs, 'src/repositories/radar/npys/floorsRegionsGraph.npz')
+
+
+if __name__ == '__main__':
+    main()
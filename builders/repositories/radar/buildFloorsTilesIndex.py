@@ -0,0 +1,13 @@
+from src.repositories.radar.tilesIndex import buildFloorsTilesIndex
+from src.utils.image import loadFromRGBToGray
+
+
+def main():
+    floorsImgs = [
+        loadFromRGBToGray(f'src/repositories/radar/images/floor-{floor}.png') for floor in range(16)
+    ]
+    buildFloorsTilesIndex(floorsImgs, 'src/repositories/radar/npys/floorsTilesIndex.npz')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,14 +6,23 @@ import time
 from threading import Thread
 
 from src.gameplay.context import context
+from src.gameplay.jitWarmup import warmupJitKernels
+from src.gameplay.threads.healing import HealingThread
 from src.gameplay.threads.pilotNG import PilotNGThread
 from src.gameplay.threads.alert import AlertThread
 from src.ui.context import Context
+from src.utils.assets import rebuildAssetsBundleIfStale
 from src.utils.esc_stop import install_esc_stop
 from src.utils.insert_toggle import install_insert_toggle
+from src.utils.runtime_settings import get_bool
 
 def main() -> None:
     contextInstance = Context(context)
+    # Templates decoded from PNG at import (new or changed): bundle them for the next start.
+    rebuildAssetsBundleIfStale()
+    # Compile (or load from the numba cache) every kernel before the pilot starts.
+    if get_bool(contextInstance.context, 'ng_runtime.jit_warmup', env_var='FENRIL_JIT_WARMUP', default=True):
+        warmupJitKernels()
     # Emergency stop: press ESC anytime to stop the bot.
     install_esc_stop(contextInstance, exit_process=True)
     # Toggle pause/play: press INSERT anytime to toggle bot state.
@@ -23,6 +32,9 @@ def main() -> None:
     pilotNGThreadInstance = PilotNGThread(contextInstance)
     pilotThread = Thread(target=pilotNGThreadInstance.mainloop, daemon=True)
     pilotThread.start()
+    healingThreadInstance = HealingThread(contextInstance)
+    healingThread = Thread(target=healingThreadInstance.mainloop, daemon=True)
+    healingThread.start()
     
     print("[run_bot_persistent] Bot threads started. Press ESC to stop.")
     print("[run_bot_persistent] Bot running without GUI (headless mode)")
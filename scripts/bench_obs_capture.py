@@ -0,0 +1,214 @@
+"""Latency/throughput benchmark of the OBS WebSocket capture path.
+
+Starts a local fake OBS WebSocket v5 server that answers GetSourceScreenshot
+by encoding a frame on every request (like OBS does) and measures
+src.utils.core._grab_obs_source_gray against it for every transport/format:
+
+    python scripts/bench_obs_capture.py --frames 60 --width 1920 --height 1080
+    python scripts/bench_obs_capture.py --image debug/screenshot.png
+
+The legacy transport needs obsws_python, the fast one websocket-client.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+_WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = conn.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError('client closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_frame(conn: socket.socket) -> tuple:
+    b0, b1 = _recv_exact(conn, 2)
+    length = b1 & 0x7F
+    if length == 126:
+        length = int.from_bytes(_recv_exact(conn, 2), 'big')
+    elif length == 127:
+        length = int.from_bytes(_recv_exact(conn, 8), 'big')
+    mask = _recv_exact(conn, 4) if b1 & 0x80 else None
+    payload = _recv_exact(conn, length)
+    if mask is not None:
+        payload = (np.frombuffer(payload, dtype=np.uint8) ^ np.resize(np.frombuffer(mask, dtype=np.uint8), length)).tobytes()
+    return b0 & 0x0F, payload
+
+
+def _send_frame(conn: socket.socket, payload: bytes, opcode: int = 0x1) -> None:
+    length = len(payload)
+    if length < 126:
+        header = bytes([0x80 | opcode, length])
+    elif length < 1 << 16:
+        header = bytes([0x80 | opcode, 126]) + length.to_bytes(2, 'big')
+    else:
+        header = bytes([0x80 | opcode, 127]) + length.to_bytes(8, 'big')
+    conn.sendall(header + payload)
+
+
+class FakeObsServer(threading.Thread):
+    """Just enough of OBS WebSocket v5 for GetSourceScreenshot, without authentication."""
+
+    def __init__(self, frame: np.ndarray, formats: Optional[List[str]] = None) -> None:
+        super().__init__(name='fake-obs', daemon=True)
+        self.frame = frame
+        self.formats = formats or ['png', 'bmp', 'jpg']
+        self.encodeTimes: List[float] = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(4)
+        self.port = self.sock.getsockname()[1]
+
+    def run(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.serve, args=(conn,), daemon=True).start()
+
+    def handshake(self, conn: socket.socket) -> None:
+        request = b''
+        while b'\r\n\r\n' not in request:
+            request += conn.recv(4096)
+        key = next(line.split(b':', 1)[1].strip() for line in request.split(b'\r\n')
+                   if line.lower().startswith(b'sec-websocket-key'))
+        accept = base64.b64encode(hashlib.sha1(key + _WS_GUID).digest())
+        conn.sendall(b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                     b'Sec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+
+    def screenshot(self, request: Dict[str, Any]) -> bytes:
+        requestData = request.get('requestData') or {}
+        imageFormat = str(requestData.get('imageFormat', 'png')).lower()
+        response: Dict[str, Any] = {'requestType': request.get('requestType'), 'requestId': request.get('requestId')}
+        if imageFormat not in self.formats:
+            response['requestStatus'] = {'result': False, 'code': 400, 'comment': f'Unsupported image format {imageFormat}'}
+            return json.dumps({'op': 7, 'd': response}).encode()
+        response['requestStatus'] = {'result': True, 'code': 100}
+        startedAt = time.perf_counter()
+        _, encoded = cv2.imencode(f'.{imageFormat}', self.frame)
+        self.encodeTimes.append(time.perf_counter() - startedAt)
+        # OBS builds this message in C++; json.dumps of a multi-MB string would
+        # make the fake server the bottleneck.
+        head = json.dumps({'op': 7, 'd': response})[:-2]
+        return (f'{head},"responseData":{{"imageData":"data:image/{imageFormat};base64,'.encode()
+                + base64.b64encode(encoded.tobytes()) + b'"}}}')
+
+    def serve(self, conn: socket.socket) -> None:
+        try:
+            self.handshake(conn)
+            _send_frame(conn, json.dumps({'op': 0, 'd': {'obsWebSocketVersion': '5.0.0', 'rpcVersion': 1}}).encode())
+            while True:
+                opcode, payload = _recv_frame(conn)
+                if opcode == 0x8:
+                    return
+                message = json.loads(payload)
+                if message.get('op') == 1:
+                    _send_frame(conn, json.dumps({'op': 2, 'd': {'negotiatedRpcVersion': 1}}).encode())
+                elif message.get('op') == 6:
+                    _send_frame(conn, self.screenshot(message['d']))
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            conn.close()
+
+    def stop(self) -> None:
+        self.sock.close()
+
+
+def _make_frame(args: argparse.Namespace) -> np.ndarray:
+    if args.image:
+        frame = cv2.imread(args.image, cv2.IMREAD_UNCHANGED)
+        if frame is None:
+            raise SystemExit(f'cannot read {args.image}')
+        # OBS screenshots are opaque; Qt writes them as 24-bit BMPs.
+        return frame[:, :, :3] if frame.ndim == 3 else cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+    # Flat panels with some noise: compresses like a game client, not like noise.
+    rng = np.random.default_rng(0)
+    blocks = rng.integers(0, 255, (args.height // 10 + 1, args.width // 10 + 1, 3), dtype=np.uint8)
+    frame = cv2.resize(blocks, (args.width, args.height), interpolation=cv2.INTER_NEAREST)
+    frame[::7] += rng.integers(0, 3, frame[::7].shape, dtype=np.uint8)
+    return frame
+
+
+def _bench(core: Any, server: FakeObsServer, fastTransport: bool, imageFormat: str, frames: int) -> Optional[Dict[str, float]]:
+    core._obs_client = None
+    core._last_obs_valid_frame = None
+    core._CAPTURE_CFG['obs_fast_transport'] = fastTransport
+    core._CAPTURE_CFG['obs_image_format'] = imageFormat
+    core._CAPTURE_CFG['obs_cache_valid_frame'] = False
+    server.encodeTimes.clear()
+    if core._grab_obs_source_gray() is None:
+        print(f'  skipped: {core._last_obs_error}')
+        return None
+    server.encodeTimes.clear()
+    latencies = []
+    startedAt = time.perf_counter()
+    for _ in range(frames):
+        frameStartedAt = time.perf_counter()
+        core._grab_obs_source_gray()
+        latencies.append(time.perf_counter() - frameStartedAt)
+    elapsed = time.perf_counter() - startedAt
+    latencies.sort()
+    client = core._obs_client
+    if hasattr(client, 'close'):
+        client.close()
+    elif hasattr(client, 'base_client'):
+        client.base_client.ws.close()
+    return {
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        'fps': frames / elapsed,
+        'server_encode_ms': statistics.mean(server.encodeTimes) * 1000 if server.encodeTimes else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frames', type=int, default=30)
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--image', help='image served as the OBS source')
+    parser.add_argument('--formats', default='png,bmp')
+    args = parser.parse_args()
+
+    server = FakeObsServer(_make_frame(args))
+    server.start()
+    os.environ['FENRIL_OBS_SOURCE'] = 'bench'
+    os.environ['FENRIL_OBS_HOST'] = '127.0.0.1'
+    os.environ['FENRIL_OBS_PORT'] = str(server.port)
+    from src.utils import core
+
+    print(f'frame {server.frame.shape[1]}x{server.frame.shape[0]}, {args.frames} frames per run')
+    for fastTransport in (False, True):
+        for imageFormat in args.formats.split(','):
+            print(f"{'fast' if fastTransport else 'obsws_python'} transport, {imageFormat}:")
+            result = _bench(core, server, fastTransport, imageFormat.strip(), args.frames)
+            if result is not None:
+                print('  p50={p50_ms:.1f}ms p95={p95_ms:.1f}ms {fps:.1f} fps (server encode {server_encode_ms:.1f}ms)'.format(**result))
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -162,6 +162,7 @@ context = {
         'hp': None,
         'manaPercentage': None,
         'mana': None,
+        'speed': None,
     },
     'ng_targeting': {
         'enabled': False,
@@ -196,6 +197,7 @@ context = {
     'ignorable_creatures': [],
     'ng_tasksOrchestrator': TasksOrchestrator(),
     'ng_screenshot': None,
+    'ng_screenshotSeq': 0,
     'way': None,
     'window': None,
     'ng_lastLootIndex': None,
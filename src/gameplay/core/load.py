@@ -2,7 +2,7 @@
 # TODO: add unit tests
 from typing import Any, Dict
 
-from src.utils.runtime_settings import get_bool
+from src.utils.runtime_settings import RuntimeSettings, get_bool
 
 
 def loadContextFromConfig(config: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
@@ -131,7 +131,7 @@ def loadContextFromConfig(config: Dict[str, Any], context: Dict[str, Any]) -> Di
     runtime_cfg = config.get('ng_runtime')
     if not isinstance(runtime_cfg, dict):
         runtime_cfg = {}
-    context['ng_runtime'] = {**runtime_defaults, **runtime_cfg}
+    context['ng_runtime'] = RuntimeSettings({**runtime_defaults, **runtime_cfg})
 
     # Startup pause behavior: prefer profile config; allow env override for supervised/headless runs.
     context['ng_pause'] = get_bool(
@@ -282,7 +282,7 @@ def loadNgCfgs(config: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any
     runtime_cfg = config.get('ng_runtime')
     if not isinstance(runtime_cfg, dict):
         runtime_cfg = {}
-    context['ng_runtime'] = {**runtime_defaults, **runtime_cfg}
+    context['ng_runtime'] = RuntimeSettings({**runtime_defaults, **runtime_cfg})
     try:
         context['ng_pause'] = bool(context.get('ng_runtime', {}).get('start_paused', True))
     except Exception:
@@ -5,7 +5,7 @@ from datetime import datetime
 
 import cv2
 
-from src.repositories.battleList.core import getCreatures, isAttackingSomeCreature
+from src.repositories.battleList.core import isAttackingSomeCreature, readCreatures
 from src.repositories.battleList.extractors import getContent, getCreaturesNamesImages
 from src.repositories.battleList.locators import getBattleListIconPosition, getContainerBottomBarPosition
 from src.repositories.battleList.typings import Creature
@@ -155,7 +155,7 @@ def setBattleListMiddleware(context: Context) -> Context:
         content_diag = {'want_images': bool(dump_on_empty)}
 
     content = getContent(screenshot, diag=content_diag) if screenshot is not None else None
-    creatures = getCreatures(content) if content is not None else np.array([], dtype=Creature)
+    creatures = readCreatures(content) if content is not None else np.array([], dtype=Creature)
 
     # If names are coming back as "Unknown" (common on different Tibia themes/capture gamma),
     # try a fuzzy resolution for preferred targets so name-based targeting still works.
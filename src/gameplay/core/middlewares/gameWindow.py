@@ -2,7 +2,7 @@ from src.repositories.battleList.core import getBeingAttackedCreatureCategory
 from src.repositories.chat.core import hasNewLoot
 from src.repositories.gameWindow.config import gameWindowSizes
 from src.repositories.gameWindow.core import getCoordinate, getImageByCoordinate
-from src.repositories.gameWindow.creatures import getCreatures, getCreaturesByType, getDifferentCreaturesBySlots, getTargetCreature
+from src.repositories.gameWindow.creatures import getCreatures, getCreaturesByType, getDifferentCreaturesBySlots, getTargetCreature, pinScriptCreaturesNames
 from ...comboSpells.core import spellsPath
 from ...typings import Context
 from ..tasks.selectChatTab import SelectChatTabTask
@@ -317,6 +317,7 @@ def setGameWindowMiddleware(context: Context) -> Context:
 
 # TODO: add unit tests
 def setGameWindowCreaturesMiddleware(context: Context) -> Context:
+    pinScriptCreaturesNames(context)
     context['ng_battleList']['beingAttackedCreatureCategory'] = getBeingAttackedCreatureCategory(
         context['ng_battleList']['creatures'])
     # TODO: func to check if coord is none
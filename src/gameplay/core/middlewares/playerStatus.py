@@ -1,4 +1,4 @@
-from src.repositories.skills.core import getHp, getMana
+from src.repositories.skills.core import getHp, getMana, getSpeed
 from src.repositories.statusBar.core import getManaPercentage, getHpPercentage
 from ...typings import Context
 
@@ -9,4 +9,6 @@ def setMapPlayerStatusMiddleware(context: Context) -> Context:
     context['ng_statusBar']['hpPercentage'] = getHpPercentage(context['ng_screenshot'])
     context['ng_statusBar']['mana'] = getMana(context['ng_screenshot'])
     context['ng_statusBar']['manaPercentage'] = getManaPercentage(context['ng_screenshot'])
+    # Read once per tick: walk tasks are built per path step and reuse it.
+    context['ng_statusBar']['speed'] = getSpeed(context['ng_screenshot'])
     return context
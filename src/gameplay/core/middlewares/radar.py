@@ -1,4 +1,4 @@
-from src.repositories.radar.core import getClosestWaypointIndexFromCoordinate, getCoordinate, getFloorLevel
+from src.repositories.radar.core import getClosestWaypointIndexFromCoordinate, getCoordinate, getFloorLevel, maskRadarImage
 from src.repositories.radar.extractors import getRadarImage
 from src.repositories.radar.config import images as radarImages
 from src.repositories.radar.config import dimensions as radarDimensions
@@ -118,6 +118,9 @@ def setRadarMiddleware(context: Context) -> Context:
         if tools_now is not None:
             radar_now = getRadarImage(context['ng_screenshot'], tools_now)
             if getattr(radar_now, 'size', 0) != 0:
+                # A masked copy: radar_now is a view of a capture buffer that gets reused,
+                # and it is compared next tick with the crop getCoordinate masks.
+                radar_now = maskRadarImage(radar_now)
                 context['ng_radar']['radarImage'] = radar_now
                 context['ng_radar']['previousRadarImage'] = radar_now
     except Exception:
@@ -1,19 +1,63 @@
 from src.utils.core import (
+    get_capture_config,
+    getLatestScreenshot,
     getMonitorRectForPoint,
     getOutputIdxForPoint,
     getScreenshot,
     getScreenshotDebugInfo,
+    setCaptureRoi,
     setScreenshotOutputIdx,
 )
 from src.gameplay.typings import Context
+from src.utils.layout import beginFrame, getCaptureRegions, getRelayoutAnchors, setCaptureGeometry
 from src.utils.mouse import set_window_transform
-from src.utils.runtime_settings import get_bool, get_float, get_int
+from src.utils.frameBus import readFrameBus
+from src.utils.runtime_settings import get_bool, get_float, get_int, get_str
 
 import cv2
 import numpy as np
 import pathlib
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+
+# Root tasks that only read the panels registered with setCaptureRegion
+# (radar, battle list, game window, bars, action bar, chat). Anything else
+# (containers, depot, trade windows...) gets full frames.
+roiCaptureTasks = {
+    'attackClosestCreature',
+    'clickInClosestCreature',
+    'resetSpellIndex',
+    'setNextSpell',
+    'setNextWaypoint',
+    'singleWalk',
+    'singleWalkPress',
+    'unknown',
+    'useComboHotkey',
+    'useHotkey',
+    'useSpellHealHotkey',
+    'walk',
+    'walkToCoordinate',
+    'walkToTargetCreature',
+    'walkToWaypoint',
+}
+_roiState = {'frames': 0}
+
+
+def _getCaptureRoi(context: Context) -> Optional[List[Tuple[int, int, int, int]]]:
+    """Regions to convert in the next grab, or None when a full frame is needed."""
+    if not get_bool(context, 'ng_runtime.capture_roi', env_var='FENRIL_CAPTURE_ROI', default=False):
+        return None
+    fullEvery = get_int(context, 'ng_runtime.capture_roi_full_every', env_var='FENRIL_CAPTURE_ROI_FULL_EVERY', default=30)
+    try:
+        taskName = context['ng_tasksOrchestrator'].getCurrentTaskName(context)
+    except Exception:
+        taskName = None
+    # Full frame when the layout moved in the last frame, on a task that
+    # reads outside the panels, and every `fullEvery` frames.
+    if taskName not in roiCaptureTasks or getRelayoutAnchors() or _roiState['frames'] >= fullEvery:
+        return None
+    return getCaptureRegions(maxAge=max(1, fullEvery)) or None
 
 
 def _get_client_rect_screen(window: object) -> Optional[Tuple[int, int, int, int]]:
@@ -186,6 +230,13 @@ def setScreenshotMiddleware(context: Context) -> Context:
         context['ng_capture_output_idx'] = getScreenshotDebugInfo().get('output_idx')
     except Exception:
         context['ng_capture_output_idx'] = None
+    # Anchors are cached in screenshot coordinates: moving the window keeps
+    # them, a resize or another output/window would only fail their checksums.
+    setCaptureGeometry((
+        getattr(capture_window, '_hWnd', None),
+        capture_rect[2:] if capture_rect is not None else None,
+        context['ng_capture_output_idx'],
+    ))
     action_hwnd = getattr(action_window, '_hWnd', None) if action_window is not None else None
     action_title = getattr(action_window, 'title', None) if action_window is not None else None
     set_window_transform(
@@ -196,7 +247,32 @@ def setScreenshotMiddleware(context: Context) -> Context:
         action_rect_is_client=action_rect_is_client,
     )
 
-    context['ng_screenshot'] = getScreenshot(region=region, absolute_region=absolute_region)
+    roi = _getCaptureRoi(context)
+    _roiState['frames'] = _roiState['frames'] + 1 if roi else 0
+    setCaptureRoi(roi)
+    context['ng_capture_roi'] = roi
+
+    busSeq, busFrame = 0, None
+    busClient = get_str(context, 'ng_runtime.frame_bus_client', env_var='FENRIL_FRAME_BUS_CLIENT', default='')
+    if busClient and region is not None:
+        # Shared capture process: read our region of its grab, without copying.
+        # Falls back to our own capture while it is not running.
+        busSeq, busFrame = readFrameBus(
+            busClient,
+            (region[0], region[1], region[2] - region[0], region[3] - region[1]),
+            wait=float(get_capture_config().get('pipelined_wait_s', 0.05)),
+        )
+    if busFrame is not None:
+        context['ng_screenshotSeq'] = busSeq
+        context['ng_screenshot'] = busFrame
+    elif get_capture_config().get('pipelined'):
+        # The capture thread grabs while we analyze; just take the newest frame.
+        context['ng_screenshotSeq'], context['ng_screenshot'] = getLatestScreenshot(
+            region=region, absolute_region=absolute_region)
+    else:
+        context['ng_screenshot'] = getScreenshot(region=region, absolute_region=absolute_region)
+    # Open a new layout frame: anchors are verified at most once against it.
+    beginFrame(context['ng_screenshot'])
 
     # If we are capturing via OBS WebSocket, the screenshot is not tied to the
     # projector window geometry. Use the screenshot dimensions as the
@@ -230,8 +306,15 @@ def setScreenshotMiddleware(context: Context) -> Context:
     screenshot = context.get('ng_screenshot')
     if screenshot is not None:
         try:
-            mean_val = float(np.mean(screenshot))
-            std_val = float(np.std(screenshot))
+            captureStats = getScreenshotDebugInfo().get('last_stats') or {}
+            if captureStats.get('roi'):
+                # ROI frames are black outside the regions: use the capture stats
+                # taken on the regions only.
+                mean_val = float(captureStats['mean'])
+                std_val = float(captureStats['std'])
+            else:
+                mean_val = float(np.mean(screenshot))
+                std_val = float(np.std(screenshot))
             diag['capture_mean'] = mean_val
             diag['capture_std'] = std_val
             std_thr = get_float(context, 'ng_runtime.black_std_threshold', env_var='FENRIL_BLACK_STD_THRESHOLD', default=1.0)
@@ -239,7 +322,10 @@ def setScreenshotMiddleware(context: Context) -> Context:
             mean_force_thr = get_float(context, 'ng_runtime.black_mean_force_threshold', env_var='FENRIL_BLACK_MEAN_FORCE_THRESHOLD', default=2.0)
             dark_px_thr = get_int(context, 'ng_runtime.black_dark_pixel_threshold', env_var='FENRIL_BLACK_DARK_PIXEL_THRESHOLD', default=8)
             dark_frac_thr = get_float(context, 'ng_runtime.black_dark_fraction_threshold', env_var='FENRIL_BLACK_DARK_FRACTION_THRESHOLD', default=0.98)
-            dark_fraction = float(np.mean(screenshot <= dark_px_thr))
+            if captureStats.get('roi'):
+                dark_fraction = float(captureStats['dark_fraction'])
+            else:
+                dark_fraction = float(np.mean(screenshot <= dark_px_thr))
             diag['capture_dark_fraction'] = dark_fraction
             is_black = (mean_val < mean_thr) and (
                 mean_val <= mean_force_thr or std_val < std_thr or dark_fraction >= dark_frac_thr
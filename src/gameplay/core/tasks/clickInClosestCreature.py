@@ -8,6 +8,7 @@ from src.repositories.battleList import extractors as battlelist_extractors
 from src.repositories.battleList.selection import choose_target_index
 from src.shared.typings import XYCoordinate
 from src.utils.console_log import log_throttled
+from src.utils.inputQueue import inputQueue
 from src.utils.runtime_settings import get_bool, get_float, get_int, get_str
 
 class ClickInClosestCreatureTask(BaseTask):
@@ -313,13 +314,15 @@ class ClickInClosestCreatureTask(BaseTask):
             return
 
         # Tibia default (non-classic controls) usually requires Ctrl+Click to attack.
-        # Keep it configurable for different control schemes.
-        keyboard.keyDown(modifier)
-        if button == 'right':
-            mouse.rightClick(None if click_at_cursor else coord)
-        else:
-            mouse.leftClick(None if click_at_cursor else coord)
-        keyboard.keyUp(modifier)
+        # Keep it configurable for different control schemes. Hold the input
+        # queue so a heal hotkey is not pressed with the modifier down.
+        with inputQueue.hold():
+            keyboard.keyDown(modifier)
+            if button == 'right':
+                mouse.rightClick(None if click_at_cursor else coord)
+            else:
+                mouse.leftClick(None if click_at_cursor else coord)
+            keyboard.keyUp(modifier)
 
         if get_bool(context, 'ng_runtime.input_diag', env_var='FENRIL_INPUT_DIAG', default=False, prefer_env=True):
             try:
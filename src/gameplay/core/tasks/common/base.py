@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import threading
 from time import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from src.gameplay.typings import Context
 from src.shared.typings import Coordinate
 from src.utils.runtime_settings import get_float
 
 
+# Bumped on every change that can move the active leaf of a task tree, so
+# TasksOrchestrator can keep the leaf it resolved until the tree changes.
+taskTreeFields = frozenset(('status', 'currentTaskIndex', 'tasks', 'parentTask'))
+_taskTree: Dict[str, int] = {'version': 0}
+_taskTreeLock = threading.Lock()
+_missing = object()
+
+
+def getTaskTreeVersion() -> int:
+    return _taskTree['version']
+
+
+def bumpTaskTreeVersion() -> None:
+    with _taskTreeLock:
+        _taskTree['version'] += 1
+
+
 class BaseTask:
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in taskTreeFields and self.__dict__.get(name, _missing) is not value:
+            bumpTaskTreeVersion()
+        object.__setattr__(self, name, value)
+
     def __init__(
         self,
         delayBeforeStart: float = 0,
@@ -7,10 +7,10 @@ from typing import Any
 
 import cv2
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.gameplay.typings import Context
-from .common.base import BaseTask
+from .common.base import BaseTask, getTaskTreeVersion
 from .common.vector import VectorTask
 from src.utils.runtime_settings import get_bool
 
@@ -18,6 +18,9 @@ from src.utils.runtime_settings import get_bool
 class TasksOrchestrator:
     def __init__(self) -> None:
         self.rootTask: Optional[BaseTask] = None
+        # (rootTask, task tree version, leaf): the leaf resolved by getCurrentTask,
+        # valid until the root is replaced or any task status/children change.
+        self._currentTask: Optional[Tuple[Optional[BaseTask], int, Optional[BaseTask]]] = None
 
     # TODO: add unit tests
     def setRootTask(self, context: Context, task: BaseTask) -> None:
@@ -41,10 +44,26 @@ class TasksOrchestrator:
         # terminate all tasks in the tree
 
     def getCurrentTask(self, context: Context) -> Optional[BaseTask]:
-        return self.getNestedTask(self.rootTask, context)
+        cached = self._currentTask
+        if cached is not None and cached[0] is self.rootTask and cached[1] == getTaskTreeVersion():
+            return cached[2]
+        rootTask = self.rootTask
+        currentTask = self.getNestedTask(rootTask, context)
+        # Read after resolving: starting vector tasks on the way down bumps the version.
+        self._currentTask = (rootTask, getTaskTreeVersion(), currentTask)
+        return currentTask
+
+    def getCurrentTaskPath(self, context: Context) -> Tuple[str, ...]:
+        """Names from the root task down to the current task."""
+        path = []
+        task = self.getCurrentTask(context)
+        while task is not None:
+            path.append(task.name)
+            task = task.parentTask
+        return tuple(reversed(path))
 
     def getCurrentTaskName(self, context: Context) -> str:
-        currentTask = self.getNestedTask(self.rootTask, context)
+        currentTask = self.getCurrentTask(context)
         if currentTask is None:
             return 'unknown'
         if currentTask.isRootTask:
@@ -1,4 +1,5 @@
 from src.utils.keyboard import keyDown, keyUp, press
+from src.utils.inputQueue import inputQueue
 from ...typings import Context
 from .common.base import BaseTask
 
@@ -12,7 +13,8 @@ class PressLogoutKeys(BaseTask):
 
     # TODO: add unit tests
     def do(self, context: Context) -> Context:
-        keyDown('ctrl')
-        press(['q'])
-        keyUp('ctrl')
+        with inputQueue.hold():
+            keyDown('ctrl')
+            press(['q'])
+            keyUp('ctrl')
         return context
@@ -1,19 +1,19 @@
 import numpy as np
 import src.gameplay.utils as gameplayUtils
 from src.repositories.radar.core import getBreakpointTileMovementSpeed, getTileFrictionByCoordinate
-from src.repositories.skills.core import getSpeed
 from src.shared.typings import Coordinate
 from src.utils.coordinate import getDirectionBetweenCoordinates
 from src.utils.keyboard import press
 from ...typings import Context
 from .common.base import BaseTask
+from .walk import getCharSpeed
 
 
 class SingleWalkPressTask(BaseTask):
     def __init__(self: "SingleWalkPressTask", context: Context, coordinate: Coordinate) -> None:
         super().__init__()
         self.name = 'singleWalkPress'
-        charSpeed = getSpeed(context['ng_screenshot']) or 0
+        charSpeed = getCharSpeed(context)
         tileFriction = getTileFrictionByCoordinate(coordinate)
         movementSpeed = getBreakpointTileMovementSpeed(
             charSpeed, tileFriction)
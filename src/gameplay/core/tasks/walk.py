@@ -9,13 +9,26 @@ from ...utils import releaseKeys
 from .common.base import BaseTask
 
 
+# TODO: add unit tests
+def getCharSpeed(context: Context) -> int:
+    # setMapPlayerStatusMiddleware reads the speed once per tick; only parse the
+    # screenshot here when running outside the regular middleware chain.
+    statusBar = context.get('ng_statusBar')
+    if isinstance(statusBar, dict) and 'speed' in statusBar:
+        return statusBar['speed'] or 0
+    charSpeed = getSpeed(context['ng_screenshot'])
+    if isinstance(statusBar, dict):
+        statusBar['speed'] = charSpeed
+    return charSpeed or 0
+
+
 class WalkTask(BaseTask):
     walkpoint: Coordinate
 
     def __init__(self: "WalkTask", context: Context, coordinate: Coordinate, passinho: bool = False) -> None:
         super().__init__()
         self.name = 'walk'
-        charSpeed = getSpeed(context['ng_screenshot']) or 0
+        charSpeed = getCharSpeed(context)
         tileFriction = getTileFrictionByCoordinate(coordinate)
         movementSpeed = getBreakpointTileMovementSpeed(
             charSpeed, tileFriction)
@@ -1,7 +1,7 @@
 import src.gameplay.utils as gameplayUtils
 from src.shared.typings import Coordinate
 from src.gameplay.typings import Context
-from ..waypoint import generateFloorWalkpoints
+from ..waypoint import FloorWalkpointsPlanner
 from .common.vector import VectorTask
 from .walk import WalkTask
 from .attackMonstersBox import AttackMonstersBoxTask
@@ -19,6 +19,7 @@ class WalkToCoordinateTask(VectorTask):
         self.isTrapped = False
         self.coordinateHistory = []  # Track last coordinates to detect loops
         self.stuckAttempts = 0  # Counter for failed reach attempts
+        self.planner = FloorWalkpointsPlanner(coordinate)
 
     def shouldRestartAfterAllChildrensComplete(self, context: Context) -> bool:
         currentCoord = context['ng_radar']['coordinate']
@@ -60,6 +61,7 @@ class WalkToCoordinateTask(VectorTask):
                     context[progress_key] = 0  # Reset
                     # Force recalculation by clearing tasks
                     self.tasks = []
+                    self.planner.reset()
                     return True  # Restart to recalculate
             else:
                 # Making progress, reset counter
@@ -94,9 +96,8 @@ class WalkToCoordinateTask(VectorTask):
                 if is_valid_coordinate(coord):
                     nonWalkableCoordinates.append(coord)
             
-            walkpoints = generateFloorWalkpoints(
+            walkpoints = self.planner.plan(
                 context['ng_radar']['coordinate'], 
-                self.coordinate, 
                 nonWalkableCoordinates=nonWalkableCoordinates
             )
             
@@ -141,8 +142,8 @@ class WalkToCoordinateTask(VectorTask):
                 if is_valid_coordinate(coord):
                     nonWalkableCoordinates.append(coord)
         self.tasks = []
-        walkpoints = generateFloorWalkpoints(
-                context['ng_radar']['coordinate'], self.coordinate, nonWalkableCoordinates=nonWalkableCoordinates)
+        walkpoints = self.planner.plan(
+                context['ng_radar']['coordinate'], nonWalkableCoordinates=nonWalkableCoordinates)
         if len(walkpoints) == 0 and not gameplayUtils.coordinatesAreEqual(context['ng_radar']['coordinate'], self.coordinate):
             self.isTrapped = True
             if any(creature[0] != 'Unknown' for creature in context['ng_battleList']['creatures']):
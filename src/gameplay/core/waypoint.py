@@ -1,9 +1,11 @@
+import numpy as np
 import tcod
 from src.repositories.radar.config import walkableFloorsSqms
+from src.repositories.radar.regions import getRoute, isRegionsGraphLoading
 from src.shared.typings import Coordinate, CoordinateList
 from src.utils.coordinate import getAvailableAroundCoordinates, getClosestCoordinate, getPixelFromCoordinate
 from .typings import Checkpoint
-from typing import Any, Optional, cast
+from typing import Any, Optional, Set, Tuple, cast
 
 
 # TODO: add unit tests
@@ -36,6 +38,131 @@ def generateFloorWalkpoints(
     ]
 
 
+def isInFloorWindow(coordinate: Coordinate, otherCoordinate: Coordinate) -> bool:
+    return otherCoordinate[2] == coordinate[2] and 0 <= otherCoordinate[0] - coordinate[0] + 53 < 106 and 0 <= otherCoordinate[1] - coordinate[1] + 54 < 109
+
+
+class FloorWalkpointsPlanner:
+    """Per walk task planner that keeps its walkability window and last path.
+
+    Runs the same search as generateFloorWalkpoints, but between calls:
+    - while the player stays on the last path and no new obstacle lies on the
+      rest of it, that rest is returned without searching again;
+    - when searching from the same window, only the obstacle cells that
+      changed are patched instead of copying and stamping the window again;
+    - a trapped answer (empty path) is kept until the player or the
+      obstacles change.
+    Goals outside the radar window (or on another floor) are reached through
+    the map route, walking to its farthest checkpoint still in the window.
+    While the map route is loading they are trapped, but not kept.
+    """
+
+    def __init__(self, goalCoordinate: Coordinate) -> None:
+        self.goalCoordinate = goalCoordinate
+        self.origin: Optional[Tuple[int, int, int]] = None
+        self.baseWalkableSqms: Optional[np.ndarray] = None
+        self.walkableSqms: Optional[np.ndarray] = None
+        self.stampedCells: Set[Tuple[int, int]] = set()
+        self.obstacles: Set[Tuple[int, int]] = set()
+        self.start: Optional[Coordinate] = None
+        self.path: CoordinateList = []
+        self.searches = 0
+        self.reuses = 0
+
+    def reset(self) -> None:
+        self.origin = None
+        self.baseWalkableSqms = None
+        self.walkableSqms = None
+        self.stampedCells = set()
+        self.obstacles = set()
+        self.start = None
+        self.path = []
+
+    def getRemainingPath(self, coordinate: Coordinate) -> Optional[CoordinateList]:
+        if self.start is None or self.start[2] != coordinate[2]:
+            return None
+        if self.start == coordinate:
+            return self.path
+        for index, walkpoint in enumerate(self.path):
+            if walkpoint == coordinate:
+                return self.path[index + 1:]
+        return None
+
+    def plan(self, coordinate: Coordinate, nonWalkableCoordinates: Optional[CoordinateList] = None) -> CoordinateList:
+        coordinate = cast(Coordinate, tuple(coordinate))
+        obstacles = {
+            (nonWalkableCoordinate[0], nonWalkableCoordinate[1])
+            for nonWalkableCoordinate in (nonWalkableCoordinates or [])
+            if nonWalkableCoordinate[2] == coordinate[2]
+        }
+        remainingPath = self.getRemainingPath(coordinate)
+        if remainingPath is not None:
+            if len(remainingPath) > 0:
+                if not any((walkpoint[0], walkpoint[1]) in obstacles for walkpoint in remainingPath):
+                    self.obstacles = obstacles
+                    self.reuses += 1
+                    return list(remainingPath)
+            elif self.start == coordinate and obstacles == self.obstacles:
+                self.reuses += 1
+                return []
+        self.obstacles = obstacles
+        return self.search(coordinate)
+
+    def setWalkableSqms(self, coordinate: Coordinate) -> np.ndarray:
+        pixelCoordinate = getPixelFromCoordinate(coordinate)
+        origin = (pixelCoordinate[0] - 53, pixelCoordinate[1] - 54, coordinate[2])
+        if origin != self.origin or self.walkableSqms is None or self.baseWalkableSqms is None:
+            self.origin = origin
+            self.baseWalkableSqms = walkableFloorsSqms[coordinate[2]][
+                origin[1]:origin[1] + 109, origin[0]:origin[0] + 106]
+            self.walkableSqms = self.baseWalkableSqms.copy()
+            self.stampedCells = set()
+        height, width = self.walkableSqms.shape
+        stampedCells: Set[Tuple[int, int]] = set()
+        for obstacle in self.obstacles:
+            leX = obstacle[0] - coordinate[0] + 53
+            leY = obstacle[1] - coordinate[1] + 54
+            if 0 <= leX < width and 0 <= leY < height:
+                stampedCells.add((leY, leX))
+        for (leY, leX) in self.stampedCells - stampedCells:
+            self.walkableSqms[leY, leX] = self.baseWalkableSqms[leY, leX]
+        for (leY, leX) in stampedCells - self.stampedCells:
+            self.walkableSqms[leY, leX] = 0
+        self.stampedCells = stampedCells
+        return self.walkableSqms
+
+    def getSubGoalCoordinate(self, coordinate: Coordinate) -> Optional[Coordinate]:
+        if isInFloorWindow(coordinate, self.goalCoordinate):
+            return self.goalCoordinate
+        route = getRoute(coordinate, self.goalCoordinate)
+        subGoalCoordinate = None
+        for checkpoint in route or []:
+            if not isInFloorWindow(coordinate, checkpoint):
+                break
+            if checkpoint != coordinate:
+                subGoalCoordinate = checkpoint
+        return subGoalCoordinate
+
+    def search(self, coordinate: Coordinate) -> CoordinateList:
+        self.searches += 1
+        self.start = coordinate
+        subGoalCoordinate = self.getSubGoalCoordinate(coordinate)
+        if subGoalCoordinate is None:
+            if isRegionsGraphLoading():
+                # Search again once the route is known.
+                self.start = None
+            self.path = []
+            return []
+        walkableSqms = self.setWalkableSqms(coordinate)
+        x = subGoalCoordinate[0] - coordinate[0] + 53
+        y = subGoalCoordinate[1] - coordinate[1] + 54
+        self.path = [
+            (coordinate[0] + x - 53, coordinate[1] + y - 54, coordinate[2])
+            for y, x in tcod.path.AStar(walkableSqms, 0).get_path(54, 53, y, x)
+        ]
+        return list(self.path)
+
+
 # TODO: add unit tests
 def resolveFloorCoordinate(_context: Any, nextCoordinate: Coordinate) -> Checkpoint:
     return {
@@ -0,0 +1,91 @@
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from src.repositories.battleList.core import getBeingAttackedCreatureCategory, getBeingAttackedCreatures, getFilledSlotsCount, isAttackingSomeCreature
+from src.repositories.battleList.extractors import getCreaturesNamesImages
+from src.repositories.battleList.typings import Creature as BattleListCreature
+from src.repositories.gameWindow.creatures import getCreaturesBars, isCreatureBeingAttacked, matchCreaturesNames, nonCreatureNamePixels
+from src.repositories.statusBar.config import hpBarAllowedPixelsColors
+from src.repositories.statusBar.core import getFilledBarPercentage
+from src.utils.console_log import log
+from src.utils.coordinate import getPixelFromCoordinate
+from src.utils.image import convertGraysToBlack
+from src.utils.matrix import hasMatrixInsideOther
+
+
+# Numba kernels warmup.
+#
+# Every @njit kernel compiles (or loads from the numba disk cache) on its
+# first call, which used to happen mid-hunt the first time its code path
+# ran: the first creature on screen, the first attack, the first bar read.
+# The main scripts run every kernel once at startup on dummy frames, before
+# the pilot starts. Numba specializes on the array layout, so image kernels
+# get both a contiguous frame and a crop of a larger one (like the regions
+# cut from the screenshot), writable and read-only (frames of the frame bus
+# are read-only views). With cache=True on every kernel only the first start
+# after an update pays the compilation.
+
+
+def getDummyImages(height: int, width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """A contiguous image, a non-contiguous crop of the same shape and a read-only crop."""
+    frame = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    readOnlyFrame = frame.copy()
+    readOnlyFrame.flags.writeable = False
+    return frame[1:-1, 1:-1].copy(), frame[1:-1, 1:-1], readOnlyFrame[1:-1, 1:-1]
+
+
+def warmupBattleList() -> None:
+    creatures = np.array([('Rat', True)], dtype=BattleListCreature)
+    getBeingAttackedCreatureCategory(creatures)
+    isAttackingSomeCreature(creatures)
+    for content in getDummyImages(44, 160):
+        getFilledSlotsCount(content)
+        list(getBeingAttackedCreatures(content, 2))
+        getCreaturesNamesImages(content, 2)
+
+
+def warmupGameWindow() -> None:
+    bars = np.array([[20, 20]], dtype=np.int64)
+    namesImgs = np.full((1, 11, 20), 255, dtype=np.uint8)
+    namesWidths = np.array([20], dtype=np.int64)
+    for gameWindowImage in getDummyImages(88, 120):
+        getCreaturesBars(gameWindowImage)
+        matchCreaturesNames(gameWindowImage, nonCreatureNamePixels, bars, namesImgs, namesWidths)
+        isCreatureBeingAttacked(gameWindowImage, 10, 10, 32)
+
+
+def warmupStatusBar() -> None:
+    # Bars are one row of the screenshot: read-only on frames of the frame bus.
+    for image in getDummyImages(1, 94):
+        getFilledBarPercentage(image[0], hpBarAllowedPixelsColors)
+
+
+def warmupUtils() -> None:
+    getPixelFromCoordinate((32000, 32000, 7))
+    for image in getDummyImages(8, 14):
+        convertGraysToBlack(image)
+        hasMatrixInsideOther(image, image)
+
+
+jitWarmups: List[Tuple[str, Callable[[], Any]]] = [
+    ('battleList', warmupBattleList),
+    ('gameWindow', warmupGameWindow),
+    ('statusBar', warmupStatusBar),
+    ('utils', warmupUtils),
+]
+
+
+def warmupJitKernels() -> Dict[str, float]:
+    """Run every kernel once and return the seconds spent per group."""
+    timings: Dict[str, float] = {}
+    for name, warmup in jitWarmups:
+        startedAt = perf_counter()
+        try:
+            warmup()
+        except Exception as e:
+            log('warn', f"JIT warmup of {name} failed: {type(e).__name__}: {e}")
+        timings[name] = perf_counter() - startedAt
+    log('info', f"JIT kernels ready in {sum(timings.values()):.2f}s")
+    return timings
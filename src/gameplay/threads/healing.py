@@ -0,0 +1,105 @@
+import threading
+import traceback
+from collections import ChainMap
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+
+from src.gameplay.healing.observers.healingByMana import healingByMana
+from src.gameplay.healing.observers.healingByPotions import healingByPotions
+from src.gameplay.healing.observers.healingBySpells import healingBySpells
+from src.gameplay.typings import Context as GameplayContext
+from src.repositories.skills.core import getHp, getMana
+from src.repositories.statusBar.core import getHpPercentage, getManaPercentage
+from src.shared.typings import GrayImage
+from src.utils.console_log import log, log_throttled
+from src.utils.core import healingFrameReader, peekLatestScreenshot
+from src.utils.inputQueue import inputQueue, urgentPriority
+from src.utils.runtime_settings import get_bool, get_float
+
+if TYPE_CHECKING:
+    from src.ui.context import Context as UIContext
+
+
+# Healing loop.
+#
+# Potions, mana and healing spells used to run at the end of the pilot tick,
+# after perception and the cavebot, so a slow tick (radar relocalization,
+# pathfinding, looting) delayed every heal. This loop reads the newest frame
+# of the pipelined capture thread on its own ring slot, only looks at the
+# hp/mana numbers and bars and the action bar, and sends its hotkeys with
+# urgent priority on the input queue. The pilot keeps running the observers
+# itself whenever the loop is disabled or has no frames.
+
+# Keys the healing observers read from the healing frame instead of the pilot tick.
+healingFrameKeys = ('ng_screenshot', 'ng_statusBar')
+# The pilot heals on its own tick when the loop has not ticked for this long.
+activeTimeout = 0.5
+
+_healingLoop: Dict[str, float] = {'lastTickAt': float('-inf')}
+# Held while the observers run, so the pilot and the loop never run them together.
+healingLock = threading.Lock()
+
+
+def isHealingLoopActive() -> bool:
+    return perf_counter() - _healingLoop['lastTickAt'] < activeTimeout
+
+
+def getHealingStatusBar(screenshot: GrayImage) -> Dict[str, Any]:
+    return {
+        'hp': getHp(screenshot),
+        'hpPercentage': getHpPercentage(screenshot),
+        'mana': getMana(screenshot),
+        'manaPercentage': getManaPercentage(screenshot),
+    }
+
+
+class HealingThread:
+    def __init__(self, context: "UIContext") -> None:
+        self.context = context
+        self.frameSeq = 0
+        self.statusBar: Optional[Dict[str, Any]] = None
+
+    def mainloop(self) -> None:
+        inputQueue.setThreadPriority(urgentPriority)
+        while True:
+            try:
+                context = self.context.context
+                if context.get('ng_should_stop'):
+                    break
+                enabled = get_bool(context, 'ng_runtime.healing_loop', env_var='FENRIL_HEALING_LOOP', default=False)
+                if not enabled or context.get('ng_pause'):
+                    sleep(0.1)
+                    continue
+                interval = get_float(context, 'ng_runtime.healing_loop_interval_s', env_var='FENRIL_HEALING_LOOP_INTERVAL_S', default=0.02)
+                startedAt = perf_counter()
+                if not self.tick(context, interval):
+                    log_throttled('healing.loop.no_frames', 'warn', 'Healing loop has no frames yet (pipelined capture not running); healing on the pilot tick', 30.0)
+                    sleep(0.1)
+                    continue
+                sleep(max(interval - (perf_counter() - startedAt), 0))
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                log('error', f"Healing loop exception: {type(e).__name__}: {e}")
+                log('error', traceback.format_exc())
+                sleep(0.1)
+
+    def tick(self, context: GameplayContext, timeout: float = 0.0) -> bool:
+        seq, screenshot = peekLatestScreenshot(healingFrameReader, self.frameSeq, timeout)
+        if screenshot is None:
+            return False
+        if seq != self.frameSeq or self.statusBar is None:
+            self.frameSeq = seq
+            self.statusBar = getHealingStatusBar(screenshot)
+        overrides: Dict[str, Any] = {'ng_screenshot': screenshot, 'ng_statusBar': self.statusBar}
+        healingContext = cast(GameplayContext, ChainMap(overrides, cast(Dict[str, Any], context)))
+        with healingLock:
+            healingByPotions(healingContext)
+            healingByMana(healingContext)
+            healingBySpells(healingContext)
+            _healingLoop['lastTickAt'] = perf_counter()
+        # Writes of the heal tasks (e.g. healCount) belong to the pilot context.
+        for key, value in overrides.items():
+            if key not in healingFrameKeys:
+                context[key] = value  # type: ignore[literal-required]
+        return True
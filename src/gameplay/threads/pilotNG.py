@@ -1,5 +1,5 @@
 import pyautogui
-from time import sleep, time
+from time import perf_counter, sleep, time
 import traceback
 import sys
 import os
@@ -28,13 +28,15 @@ from src.gameplay.healing.observers.healingByMana import healingByMana
 from src.gameplay.healing.observers.swapAmulet import swapAmulet
 from src.gameplay.healing.observers.swapRing import swapRing
 from src.gameplay.targeting import hasCreaturesToAttack
+from src.gameplay.threads.healing import healingLock, isHealingLoopActive
 from src.repositories.battleList import extractors as battlelist_extractors
 from src.repositories.battleList.selection import choose_target_index
 from src.repositories.gameWindow.creatures import getClosestCreature, getTargetCreature
 from src.gameplay.core.tasks.attackClosestCreature import AttackClosestCreatureTask
 
-from src.utils.console_log import log, log_throttled
-from src.utils.runtime_settings import get_bool, get_float
+from src.utils.console_log import is_log_due, log, log_throttled
+from src.utils.profiler import TickProfiler
+from src.utils.runtime_settings import get_bool, get_float, get_str
 
 if TYPE_CHECKING:
     from src.ui.context import Context as UIContext
@@ -47,6 +49,8 @@ class PilotNGThread:
     def __init__(self, context: "UIContext") -> None:
         self.context = context
         self._last_reason = None
+        self.profiler = TickProfiler()
+        self._lastProfileDumpAt = 0.0
 
     def mainloop(self) -> None:
         try:
@@ -69,11 +73,13 @@ class PilotNGThread:
                         sleep(1)
                         continue
                     startTime = time()
-                    self.context.context = self.handleGameData(
+                    self.profiler.enabled = get_bool(self.context.context, 'ng_runtime.tick_profiler', env_var='FENRIL_TICK_PROFILER', default=False)
+                    run = self.profiler.run
+                    self.context.context = run('gameData', self.handleGameData,
                         self.context.context)
-                    self.context.context = self.handleGameplayTasks(
+                    self.context.context = run('gameplayTasks', self.handleGameplayTasks,
                         self.context.context)
-                    self.context.context = self.context.context['ng_tasksOrchestrator'].do(
+                    self.context.context = run('orchestrator', self.context.context['ng_tasksOrchestrator'].do,
                         self.context.context)
 
                     # Periodic status line to make it obvious why cavebot isn't acting.
@@ -133,23 +139,33 @@ class PilotNGThread:
                             f" cap_rect={self.context.context.get('ng_capture_rect')}"
                             f" act_rect={self.context.context.get('ng_action_rect')}"
                         )
-                    log_throttled('pilot.status', 'info', status_msg, interval)
+                    if self.profiler.enabled:
+                        self.dumpProfile(interval)
+                    if is_log_due('pilot.status', interval):
+                        if self.profiler.enabled:
+                            status_msg += f" tick={self.profiler.getSummary(top=1, only=['tick'])} slowest={self.profiler.getSummary(exclude=['tick', 'gameData', 'gameplayTasks'])}"
+                        log('info', status_msg)
                     if reason != self._last_reason and reason is not None:
                         self._last_reason = reason
                         log('info', f"Tick reason changed: {reason}")
 
                     self.context.context['ng_radar']['lastCoordinateVisited'] = self.context.context['ng_radar']['coordinate']
-                    healingByPotions(self.context.context)
-                    healingByMana(self.context.context)
-                    healingBySpells(self.context.context)
-                    comboSpells(self.context.context)
-                    swapAmulet(self.context.context)
-                    swapRing(self.context.context)
-                    clearPoison(self.context.context)
-                    autoHur(self.context.context)
-                    eatFood(self.context.context)
+                    with healingLock:
+                        # The healing loop heals on its own frames while it is running.
+                        if not isHealingLoopActive():
+                            run('healing.healingByPotions', healingByPotions, self.context.context)
+                            run('healing.healingByMana', healingByMana, self.context.context)
+                            run('healing.healingBySpells', healingBySpells, self.context.context)
+                    run('healing.comboSpells', comboSpells, self.context.context)
+                    run('healing.swapAmulet', swapAmulet, self.context.context)
+                    run('healing.swapRing', swapRing, self.context.context)
+                    run('healing.clearPoison', clearPoison, self.context.context)
+                    run('healing.autoHur', autoHur, self.context.context)
+                    run('healing.eatFood', eatFood, self.context.context)
                     endTime = time()
                     diff = endTime - startTime
+                    if self.profiler.enabled:
+                        self.profiler.record('tick', diff)
                     sleep(max(0.045 - diff, 0))
                 except KeyboardInterrupt:
                     sys.exit()
@@ -168,20 +184,31 @@ class PilotNGThread:
             except Exception:
                 pass
 
+    def dumpProfile(self, interval: float) -> None:
+        path = get_str(self.context.context, 'ng_runtime.tick_profiler_path', env_var='FENRIL_TICK_PROFILER_PATH', default='')
+        if not path or perf_counter() - self._lastProfileDumpAt < interval:
+            return
+        self._lastProfileDumpAt = perf_counter()
+        try:
+            self.profiler.dumpJson(path)
+        except Exception as e:
+            log_throttled('pilot.profile.dump', 'warn', f"Tick profile dump failed: {type(e).__name__}: {e}", 60.0)
+
     def handleGameData(self, context: GameplayContext) -> GameplayContext:
         if context['ng_pause']:
             return context
+        run = self.profiler.run
         # Resolve action/capture windows (dual-window support) before grabbing screenshots.
-        context = setTibiaWindowMiddleware(context)
-        context = setScreenshotMiddleware(context)
-        context = setRadarMiddleware(context)
-        context = setChatTabsMiddleware(context)
-        context = setBattleListMiddleware(context)
-        context = setGameWindowMiddleware(context)
-        context = setDirectionMiddleware(context)
-        context = setGameWindowCreaturesMiddleware(context)
+        context = run('middleware.window', setTibiaWindowMiddleware, context)
+        context = run('middleware.screenshot', setScreenshotMiddleware, context)
+        context = run('middleware.radar', setRadarMiddleware, context)
+        context = run('middleware.chatTabs', setChatTabsMiddleware, context)
+        context = run('middleware.battleList', setBattleListMiddleware, context)
+        context = run('middleware.gameWindow', setGameWindowMiddleware, context)
+        context = run('middleware.direction', setDirectionMiddleware, context)
+        context = run('middleware.gameWindowCreatures', setGameWindowCreaturesMiddleware, context)
         if context['ng_cave']['enabled'] and context['ng_cave']['runToCreatures'] == True:
-            context = setHandleLootMiddleware(context)          
+            context = run('middleware.handleLoot', setHandleLootMiddleware, context)
         else:
             get_target_creature = cast(
                 Callable[[list[dict[str, Any]]], Optional[dict[str, Any]]],
@@ -190,10 +217,10 @@ class PilotNGThread:
             context['ng_cave']['targetCreature'] = get_target_creature(
                 cast(list[dict[str, Any]], context['gameWindow']['monsters'])
             )
-        context = setWaypointIndexMiddleware(context)
-        context = setMapPlayerStatusMiddleware(context)
-        context = setMapStatsBarMiddleware(context)
-        context = setCleanUpTasksMiddleware(context)
+        context = run('middleware.waypointIndex', setWaypointIndexMiddleware, context)
+        context = run('middleware.playerStatus', setMapPlayerStatusMiddleware, context)
+        context = run('middleware.statsBar', setMapStatsBarMiddleware, context)
+        context = run('middleware.cleanUpTasks', setCleanUpTasksMiddleware, context)
         return context
 
     def handleGameplayTasks(self, context: GameplayContext) -> GameplayContext:
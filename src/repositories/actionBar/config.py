@@ -1,3 +1,4 @@
+import numpy as np
 import pathlib
 from typing import Final, TypedDict
 
@@ -83,3 +84,12 @@ images: Final[ActionBarImages] = {
         hashit(loadFromRGBToGray(f'{digitsImagesPath}/9.png')): 9,
     },
 }
+# Count glyphs (6x5, white with a black outline) for the tolerant slot count
+# recognizer. Refresh them with builders/repositories/actionBar/buildDigits.py.
+# No screenshot of the repo shows a 3, 5 or 7 yet: getSlotCount reads counts
+# with those glyphs with tesseract once and saves the glyph it confirms here.
+digitsGlyphsImagesPath = f'{digitsImagesPath}/glyphs'
+digitsTemplates: Final[dict[int, np.ndarray]] = {
+    digit: loadFromRGBToGray(f'{digitsGlyphsImagesPath}/{digit}.png').astype(np.int16)
+    for digit in range(10) if pathlib.Path(f'{digitsGlyphsImagesPath}/{digit}.png').exists()
+}
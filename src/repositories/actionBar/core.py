@@ -1,73 +1,183 @@
-import pytesseract
+import cv2
 import math
 import numpy as np
-from typing import Union
+import pytesseract
+from typing import Dict, Optional, Tuple, Union
 import src.repositories.actionBar.extractors as actionBarExtractors
 import src.repositories.actionBar.locators as actionBarLocators
 from src.shared.typings import GrayImage
 import src.utils.core as coreUtils
-from .config import ActionBarHashes, ActionBarImages, hashes as _hashes, images as _images
+from src.utils.image import save
+from src.utils.layout import setCaptureRegion
+from .config import ActionBarHashes, ActionBarImages, digitsGlyphsImagesPath, digitsTemplates, hashes as _hashes, images as _images
 
 
 hashes: ActionBarHashes = _hashes
 images: ActionBarImages = _images
 
+pytesseract.pytesseract.tesseract_cmd = "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
 
-def _rescale_intensity_u8(
-    image: np.ndarray,
-    in_range: tuple[int, int] = (50, 175),
-    out_range: tuple[int, int] = (0, 255),
-) -> np.ndarray:
-    image_u8 = image.astype(np.uint8, copy=False)
-    in_min, in_max = in_range
-    out_min, out_max = out_range
-
-    if in_max <= in_min:
-        return image_u8.copy()
-
-    scaled = (image_u8.astype(np.float32) - float(in_min)) * (float(out_max - out_min) / float(in_max - in_min)) + float(out_min)
-    return np.clip(scaled, out_min, out_max).astype(np.uint8)
 
+# Last decoded count per slot, keyed by the hash of its digits crop, so an
+# unchanged count costs one hash.
+_slotsCountsCache: Dict[int, Tuple[int, int]] = {}
+# Max mean abs difference per glyph pixel between a digit cell and its
+# template (the closest two templates, 0 and 9, are 34 apart).
+_digitTolerance = 12.0
+# Count glyph strokes are light grays (>= 150) with a black outline (<= 30).
+_digitGlyphMinValue = 150
+_digitOutlineMaxValue = 30
+# Only the strokes (and their edges) and the outline of a template are
+# compared: the slot background behind the count changes with the item.
+_digitsMasks = {
+    digit: (template >= 90) | (template <= _digitOutlineMaxValue) for digit, template in digitsTemplates.items()
+}
+# Cooldown icons are 20x20 and a running cooldown lights row 20 (255) under
+# its icon, starting at the icon's left column. Templates are pre-centered
+# and normalized so matching one icon against all of them is one dot product
+# per template, the same score as locate's TM_CCOEFF_NORMED.
+_cooldownBarRow = 20
+_cooldownConfidence = 0.85
+_cooldownsNames = [name for name, image in images['cooldowns'].items() if image.shape[:2] == (20, 20)]
+_cooldownsTemplates = np.stack([images['cooldowns'][name].astype(np.float32).reshape(-1) for name in _cooldownsNames])
+_cooldownsTemplates -= _cooldownsTemplates.mean(axis=1, keepdims=True)
+_cooldownsTemplates /= np.maximum(np.linalg.norm(_cooldownsTemplates, axis=1, keepdims=True), 1e-6)
+
+
+def _matchDigit(slotImage: GrayImage, cellCenterX: int, dx: int, dy: int) -> Tuple[Optional[int], float]:
+    bestDigit = None
+    bestDistance = float('inf')
+    for digit, template in digitsTemplates.items():
+        h, w = template.shape[:2]
+        y = 25 + dy
+        x = cellCenterX - (w // 2) + dx
+        if y < 0 or x < 0 or y + h > slotImage.shape[0] or x + w > slotImage.shape[1]:
+            continue
+        distance = float(np.abs(slotImage[y:y + h, x:x + w].astype(np.int16) - template)[_digitsMasks[digit]].mean())
+        if distance < bestDistance:
+            bestDigit = digit
+            bestDistance = distance
+    if bestDistance > _digitTolerance:
+        return None, bestDistance
+    return bestDigit, bestDistance
 
-def _equalize_hist_u8(image: np.ndarray) -> np.ndarray:
-    image_u8 = image.astype(np.uint8, copy=False)
-    hist = np.bincount(image_u8.ravel(), minlength=256)
-    cdf = hist.cumsum()
-    nonzero = cdf[cdf > 0]
-    if nonzero.size == 0:
-        return image_u8.copy()
-    cdf_min = int(nonzero[0])
-    cdf_max = int(nonzero[-1])
-    if cdf_max == cdf_min:
-        return image_u8.copy()
 
-    lut = np.floor((cdf - cdf_min) * 255.0 / float(cdf_max - cdf_min)).clip(0, 255).astype(np.uint8)
-    return lut[image_u8]
+def _hasDigitGlyph(slotImage: GrayImage, cellCenterX: int) -> bool:
+    if cellCenterX < 3:
+        return False
+    # Glyph strokes show up on every row of the cell, item sprites rarely do,
+    # and always next to the black outline.
+    cell = slotImage[24:32, cellCenterX - 3:cellCenterX + 4]
+    if int(np.count_nonzero(np.any(cell >= _digitGlyphMinValue, axis=1))) < 5:
+        return False
+    return int(np.count_nonzero(np.any(cell <= _digitOutlineMaxValue, axis=1))) >= 3
+
+
+def _recognizeSlotDigits(slotImage: GrayImage) -> Tuple[int, int]:
+    """Decode the right-aligned count of a 34x34 slot image.
+
+    Glyphs sit on 6px cells (rightmost centred on x=29, top at y=25) and are
+    matched with a 1px shift on each axis. Returns (count, digits found).
+    """
+    bestCount = 0
+    bestScore: Optional[Tuple[int, float]] = None
+    for dy in (0, -1, 1):
+        for dx in (0, -1, 1):
+            count = 0
+            distances = []
+            for i in range(5):
+                digit, distance = _matchDigit(slotImage, 29 - (6 * i), dx, dy)
+                if digit is None:
+                    break
+                distances.append(distance)
+                count += digit * (10 ** i)
+            if not distances:
+                continue
+            score = (len(distances), -float(np.mean(distances)))
+            if bestScore is None or score > bestScore:
+                bestScore = score
+                bestCount = count
+    return bestCount, (bestScore[0] if bestScore is not None else 0)
+
+
+def _getDigitCell(slotImage: GrayImage, i: int) -> GrayImage:
+    cellCenterX = 29 - (6 * i)
+    return slotImage[25:31, cellCenterX - 2:cellCenterX + 3]
+
+
+def _learnDigitsGlyphs(slotImage: GrayImage, digits: str, digitsFound: int) -> None:
+    """Keep the cells of a confirmed count whose digits have no template yet.
+
+    Saved under digits/glyphs too, so tesseract reads each missing digit once
+    per install instead of on every count change.
+    """
+    for i in range(digitsFound, len(digits)):
+        digit = int(digits[-1 - i])
+        if digit in digitsTemplates:
+            continue
+        cell = _getDigitCell(slotImage, i)
+        if cell.shape[:2] != (6, 5):
+            continue
+        template = cell.astype(np.int16)
+        digitsTemplates[digit] = template
+        _digitsMasks[digit] = (template >= 90) | (template <= _digitOutlineMaxValue)
+        try:
+            save(np.ascontiguousarray(cell, dtype=np.uint8), f'{digitsGlyphsImagesPath}/{digit}.png')
+        except Exception:
+            pass
+
+
+def _getSlotCountByTesseract(slotImage: GrayImage) -> Optional[str]:
+    # Last resort for glyphs the templates do not cover yet (learned from its
+    # confirmed reads).
+    try:
+        stretch = np.clip((slotImage[24:32, 3:33].astype(np.float32) - 50.0) * (255.0 / 125.0), 0, 255).astype(np.uint8)
+        count = pytesseract.image_to_string(
+            cv2.equalizeHist(stretch), config='--psm 10 --oem 3 -c tessedit_char_whitelist=0123456789')
+        return ''.join(c for c in count if c.isdigit())
+    except Exception:
+        return None
 
-pytesseract.pytesseract.tesseract_cmd = "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
 
 # TODO: add unit tests
-# PERF: [0.04209370000000012, 9.999999999621423e-06]
+@coreUtils.cacheByFrame
 def getSlotCount(screenshot: GrayImage, slot: int) -> Union[int, None]:
     leftSideArrowsPos = actionBarLocators.getLeftArrowsPosition(screenshot)
     if leftSideArrowsPos is None:
         return None
+    # Locators may return a scaled bbox; normalize the slot back to 34x34.
+    templateHeight, templateWidth = images['arrows']['left'].shape[:2]
+    scale = ((leftSideArrowsPos[2] / templateWidth) + (leftSideArrowsPos[3] / templateHeight)) / 2.0
+    slotSize = max(1, int(round(34 * scale)))
     x0 = leftSideArrowsPos[0] + leftSideArrowsPos[2] + \
-        (slot * 2) + ((slot - 1) * 34)
-    slotImage = screenshot[leftSideArrowsPos[1]:leftSideArrowsPos[1] + 34, x0:x0 + 34]
-    digits = slotImage[24:32, 3:33]
-    
-    number_region_image = np.array(digits, dtype=np.uint8)
-
-    stretch = _rescale_intensity_u8(number_region_image, in_range=(50, 175), out_range=(0, 255))
-    equalized_image = _equalize_hist_u8(stretch)
-
-    count = pytesseract.image_to_string(equalized_image, config='--psm 10 --oem 3 -c tessedit_char_whitelist=0123456789')
-
-    if not count:
-        return 0
+        int(round(((slot * 2) + ((slot - 1) * 34)) * scale))
+    slotImage = screenshot[leftSideArrowsPos[1]:leftSideArrowsPos[1] + slotSize, x0:x0 + slotSize]
+    if slotImage.shape[0] != slotSize or slotImage.shape[1] != slotSize:
+        return None
+    setCaptureRegion(f'actionBar.slot{slot}', (x0, leftSideArrowsPos[1], slotSize, slotSize))
+    if slotSize != 34:
+        slotImage = cv2.resize(slotImage, (34, 34), interpolation=cv2.INTER_AREA)
+    digitsAreaHash = coreUtils.hashit(slotImage[22:34, 0:34])
+    cached = _slotsCountsCache.get(slot)
+    if cached is not None and cached[0] == digitsAreaHash:
+        return cached[1]
+    count, digitsFound = _recognizeSlotDigits(slotImage)
+    # A glyph left of the decoded digits has no template yet: do not report a
+    # truncated count.
+    if digitsFound < 5 and _hasDigitGlyph(slotImage, 29 - (6 * digitsFound)):
+        tesseractDigits = _getSlotCountByTesseract(slotImage)
+        if not tesseractDigits:
+            return None
+        # Only kept when it ends with the digits the templates read: an
+        # unconfirmed read is tried again on the next frame.
+        decodedDigits = str(count).zfill(digitsFound) if digitsFound else ''
+        if len(tesseractDigits) > digitsFound and tesseractDigits.endswith(decodedDigits):
+            _slotsCountsCache[slot] = (digitsAreaHash, int(tesseractDigits))
+            _learnDigitsGlyphs(slotImage, tesseractDigits, digitsFound)
+        return int(tesseractDigits)
+    _slotsCountsCache[slot] = (digitsAreaHash, count)
+    return count
 
-    return int(count)
 
 def getSlotCountOld(screenshot: GrayImage, slot: int) -> Union[int, None]:
     leftSideArrowsPos = actionBarLocators.getLeftArrowsPosition(screenshot)
@@ -102,13 +212,52 @@ def hasCooldownByImage(screenshot: GrayImage, cooldownImage: GrayImage) -> Union
     return listOfCooldownsImage[20:21, x:x + w][0][0] == 255
 
 
+def decodeCooldowns(listOfCooldownsImage: GrayImage) -> Dict[str, bool]:
+    """Decode every running cooldown of the cooldowns strip in one pass.
+
+    Only icons with a lit bar are matched, each against all templates at
+    once, so the cost no longer grows with the number of spells asked for.
+    """
+    cooldowns = {name: False for name in _cooldownsNames}
+    height, width = listOfCooldownsImage.shape[:2]
+    if height <= _cooldownBarRow or width < 20:
+        return cooldowns
+    bar = listOfCooldownsImage[_cooldownBarRow, :width - 19] == 255
+    xs = np.flatnonzero(bar & ~np.concatenate(([False], bar[:-1])))
+    if len(xs) == 0:
+        return cooldowns
+    icons = np.stack([listOfCooldownsImage[0:20, x:x + 20].astype(np.float32).reshape(-1) for x in xs])
+    icons -= icons.mean(axis=1, keepdims=True)
+    icons /= np.maximum(np.linalg.norm(icons, axis=1, keepdims=True), 1e-6)
+    scores = icons @ _cooldownsTemplates.T
+    for index in np.flatnonzero((scores > _cooldownConfidence).any(axis=0)):
+        cooldowns[_cooldownsNames[index]] = True
+    return cooldowns
+
+
 # TODO: add unit tests
+@coreUtils.cacheByFrame
+def getCooldowns(screenshot: GrayImage) -> Optional[Dict[str, bool]]:
+    """Running cooldowns by spell or group name, decoded once per frame."""
+    listOfCooldownsImage = actionBarExtractors.getCooldownsImage(screenshot)
+    if listOfCooldownsImage is None:
+        return None
+    return decodeCooldowns(listOfCooldownsImage)
+
+
 # PERF: [0.08509680000000008, 0.00037780000000031677]
 def hasCooldownByName(screenshot: GrayImage, name: str) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns'][name])
+    cooldowns = getCooldowns(screenshot)
+    if cooldowns is None:
+        return None
+    if name not in cooldowns:
+        # Icons that are not 20x20 are left to the template search.
+        return hasCooldownByImage(screenshot, images['cooldowns'][name])
+    return cooldowns[name]
 
 
 # PERF: [2.1100000000107144e-05, 5.5999999997169425e-06]
+@coreUtils.cacheByFrame
 def hasAttackCooldown(screenshot: GrayImage) -> Union[bool, None]:
     listOfCooldownsImage = actionBarExtractors.getCooldownsImage(screenshot)
     if listOfCooldownsImage is None:
@@ -118,38 +267,34 @@ def hasAttackCooldown(screenshot: GrayImage) -> Union[bool, None]:
     return hashName == 'attack'
 
 
-# TODO: improve performance
 # PERF: [0.08131169999999965, 0.00037539999999980367]
 def hasExoriCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['exori'])
+    return hasCooldownByName(screenshot, 'exori')
 
 
-# TODO: improve performance
 # PERF: [0.08513510000000002, 0.00037559999999992044]
 def hasExoriGranCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['exori gran'])
+    return hasCooldownByName(screenshot, 'exori gran')
 
 
-# TODO: improve performance
 # PERF: [0.08332179999999978, 0.000373600000000085]
 def hasExoriMasCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['exori mas'])
+    return hasCooldownByName(screenshot, 'exori mas')
 
 
-# TODO: improve performance
 # TODO: add unit tests
 # PERF: [0.08801449999999988, 0.000378400000000223]
 def hasExuraGranIcoCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['utura gran'])
+    return hasCooldownByName(screenshot, 'utura gran')
 
 
-# TODO: improve performance
 # PERF: [0.08647640000000001,  0.0003741999999999912]
 def hasExoriMinCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['exori min'])
+    return hasCooldownByName(screenshot, 'exori min')
 
 
 # PERF: [2.7100000000057634e-05, 5.4999999998806e-06]
+@coreUtils.cacheByFrame
 def hasHealingCooldown(screenshot: GrayImage) -> Union[bool, None]:
     listOfCooldownsImage = actionBarExtractors.getCooldownsImage(screenshot)
     if listOfCooldownsImage is None:
@@ -160,6 +305,7 @@ def hasHealingCooldown(screenshot: GrayImage) -> Union[bool, None]:
 
 
 # PERF: [2.0099999999523277e-05, 5.50000000032469e-06]
+@coreUtils.cacheByFrame
 def hasSupportCooldown(screenshot: GrayImage) -> Union[bool, None]:
     listOfCooldownsImage = actionBarExtractors.getCooldownsImage(screenshot)
     if listOfCooldownsImage is None:
@@ -169,21 +315,20 @@ def hasSupportCooldown(screenshot: GrayImage) -> Union[bool, None]:
     return hashName == 'support'
 
 
-# TODO: improve performance
 # TODO: add unit tests
 # PERF: [0.08165200000000006, 0.0003780999999998258]
 def hasUturaCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['utura'])
+    return hasCooldownByName(screenshot, 'utura')
 
 
-# TODO: improve performance
 # TODO: add unit tests
 # PERF: [0.0844541999999997, 0.0003747000000000611]
 def hasUturaGranCooldown(screenshot: GrayImage) -> Union[bool, None]:
-    return hasCooldownByImage(screenshot, images['cooldowns']['utura gran'])
+    return hasCooldownByName(screenshot, 'utura gran')
 
 
 # PERF: [0.03996639999999996, 4.199999999787707e-06]
+@coreUtils.cacheByFrame
 def slotIsEquipped(screenshot: GrayImage, slot: int) -> Union[bool, None]:
     leftSideArrowsPos = actionBarLocators.getLeftArrowsPosition(screenshot)
     if leftSideArrowsPos is None:
@@ -192,10 +337,12 @@ def slotIsEquipped(screenshot: GrayImage, slot: int) -> Union[bool, None]:
         (slot * 2) + ((slot - 1) * 34)
     slotImage = screenshot[leftSideArrowsPos[1]
         :leftSideArrowsPos[1] + 34, x0:x0 + 34]
+    setCaptureRegion(f'actionBar.slot{slot}', (x0, leftSideArrowsPos[1], 34, 34))
     return slotImage[0, 0] == 41
 
 
 # PERF: [0.04092479999999998, 4.300000000068138e-06]
+@coreUtils.cacheByFrame
 def slotIsAvailable(screenshot: GrayImage, slot: int) -> Union[bool, None]:
     leftSideArrowsPos = actionBarLocators.getLeftArrowsPosition(screenshot)
     if leftSideArrowsPos is None:
@@ -204,4 +351,5 @@ def slotIsAvailable(screenshot: GrayImage, slot: int) -> Union[bool, None]:
         (slot * 2) + ((slot - 1) * 34)
     slotImage = screenshot[leftSideArrowsPos[1]
         :leftSideArrowsPos[1] + 34, x0:x0 + 34]
+    setCaptureRegion(f'actionBar.slot{slot}', (x0, leftSideArrowsPos[1], 34, 34))
     return not (slotImage[1, 2] == 54 and slotImage[1, 4] == 54 and slotImage[1, 6] == 54 and slotImage[1, 8] == 54 and slotImage[1, 10] == 54)
@@ -1,6 +1,7 @@
 from typing import Union
 from src.shared.typings import GrayImage
 import src.repositories.actionBar.locators as actionBarLocators
+from src.utils.layout import setCaptureRegion
 
 
 # PERF: [0.1267358999999999, 3.899999999390502e-06]
@@ -11,4 +12,6 @@ def getCooldownsImage(screenshot: GrayImage) -> Union[GrayImage, None]:
     rightArrowsPos = actionBarLocators.getRightArrowsPosition(screenshot)
     if rightArrowsPos is None:
         return None
+    # Slots (34px from the arrows top) and the cooldowns strip below them.
+    setCaptureRegion('actionBar', (leftArrowsPos[0], leftArrowsPos[1], rightArrowsPos[0] - leftArrowsPos[0], 37 + 22))
     return screenshot[leftArrowsPos[1] + 37: leftArrowsPos[1] + 37 + 22, leftArrowsPos[0]:rightArrowsPos[0]]
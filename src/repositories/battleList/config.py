@@ -1,5 +1,6 @@
 import numpy as np
 import pathlib
+from typing import Dict
 from src.utils.core import hashit
 from src.utils.image import loadFromRGBToGray
 from src.wiki.creatures import creatures
@@ -28,11 +29,20 @@ images = {
         'yellow': loadFromRGBToGray(f'{skullsPath}/yellow.png'),
     }
 }
-creaturesNamesImagesHashes = {}
+creaturesNamesImagesHashes: Dict[int, str] = {}
 
-for creatureName in creatures:
-    creatureNameImage = loadFromRGBToGray(
-        f'{monstersPath}/{creatureName}.png')
-    creatureNameImage = np.ravel(creatureNameImage[8:9, 0:115])
-    creatureNameImageHash = hashit(creatureNameImage)
-    creaturesNamesImagesHashes[creatureNameImageHash] = creatureName
+
+# TODO: add unit tests
+def getCreaturesNamesImagesHashes() -> Dict[int, str]:
+    """Battle list name hash -> creature, built on the first battle list read instead of at import."""
+    if not creaturesNamesImagesHashes:
+        for creatureName in creatures:
+            try:
+                creatureNameImage = loadFromRGBToGray(
+                    f'{monstersPath}/{creatureName}.png')
+            except FileNotFoundError:
+                continue
+            creatureNameImage = np.ravel(creatureNameImage[8:9, 0:115])
+            creatureNameImageHash = hashit(creatureNameImage)
+            creaturesNamesImagesHashes[creatureNameImageHash] = creatureName
+    return creaturesNamesImagesHashes
@@ -6,6 +6,7 @@ from .locators import getContainerBottomBarPosition, getBattleListIconPosition
 from src.utils.runtime_settings import get_int
 import cv2
 from src.utils.core import locateMultiScale
+from src.utils.layout import setCaptureRegion
 from .config import images
 
 
@@ -68,6 +69,8 @@ def getContent(screenshot: GrayImage, diag: dict | None = None) -> Union[GrayIma
     list_img = screenshot[list_top:img_h, list_left:list_right]
     if list_img.size == 0:
         return None
+    # Down to the screen bottom: the list bottom bar moves when the list is resized.
+    setCaptureRegion('battleList', (list_left, list_top, list_right - list_left, img_h - list_top))
 
     if isinstance(diag, dict):
         diag['list_bbox'] = (int(list_left), int(list_top), int(list_right - list_left), int(img_h - list_top))
@@ -2,7 +2,8 @@ from typing import Union
 
 from src.utils.runtime_settings import get_float, get_int
 from src.shared.typings import BBox, GrayImage
-from src.utils.core import cacheObjectPosition, locateMultiScale
+from src.utils.core import cacheObjectPosition
+from src.utils.uiScale import locateAtUiScale
 from .config import images
 
 
@@ -79,14 +80,14 @@ def getBattleListIconPosition(screenshot: GrayImage) -> Union[BBox, None]:
     if steps < 2:
         steps = 2
     scales = [min_scale + (max_scale - min_scale) * i / (steps - 1) for i in range(steps)]
-    res = locateMultiScale(screenshot, images['icons']['ng_battleList'], confidence=confidence, scales=scales)
-    if res is not None:
-        return res
-
     # Fallback for OBS/projector scaling and slight theme differences.
     # Keep this inside the locator so callers don't need to tune env vars.
     fallback_scales = (0.50, 0.60, 0.70, 0.80, 0.90, 1.00, 1.10, 1.20, 1.30, 1.40, 1.50, 1.60, 1.70, 1.80)
-    return locateMultiScale(screenshot, images['icons']['ng_battleList'], confidence=max(0.60, confidence - 0.15), scales=fallback_scales)
+    return locateAtUiScale(
+        screenshot,
+        images['icons']['ng_battleList'],
+        ((scales, confidence), (fallback_scales, max(0.60, confidence - 0.15))),
+    )
 
 
 # PERF: [0.05364349999999973, 1.8999999991109462e-06]
@@ -100,21 +101,21 @@ def getContainerBottomBarPosition(screenshot: GrayImage) -> Union[BBox, None]:
         steps = 2
     scales = [min_scale + (max_scale - min_scale) * i / (steps - 1) for i in range(steps)]
 
-    iconPosition = locateMultiScale(screenshot, images['icons']['ng_battleList'], confidence=confidence, scales=scales)
+    iconPosition = locateAtUiScale(screenshot, images['icons']['ng_battleList'], ((scales, confidence),))
     if iconPosition is not None:
         start_x = max(0, iconPosition[0] - 50)
         start_y = max(0, iconPosition[1])
         end_x = min(screenshot.shape[1], start_x + 500)
         end_y = min(screenshot.shape[0], start_y + 800)
         cropped = screenshot[start_y:end_y, start_x:end_x]
-        position = locateMultiScale(cropped, images['containers']['bottomBar'], confidence=confidence, scales=scales)
+        position = locateAtUiScale(cropped, images['containers']['bottomBar'], ((scales, confidence),))
         if position is not None:
             return (position[0] + start_x, position[1] + start_y, position[2], position[3])
 
-    res = locateMultiScale(screenshot, images['containers']['bottomBar'], confidence=confidence, scales=scales)
-    if res is not None:
-        return res
-
     # Fallback for scaled captures.
     fallback_scales = (0.50, 0.60, 0.70, 0.80, 0.90, 1.00, 1.10, 1.20, 1.30, 1.40, 1.50, 1.60, 1.70, 1.80)
-    return locateMultiScale(screenshot, images['containers']['bottomBar'], confidence=max(0.60, confidence - 0.15), scales=fallback_scales)
+    return locateAtUiScale(
+        screenshot,
+        images['containers']['bottomBar'],
+        ((scales, confidence), (fallback_scales, max(0.60, confidence - 0.15))),
+    )
@@ -1,13 +1,17 @@
 import pathlib
 import json
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 import cv2
+import numpy as np
 from src.shared.typings import BBox, GrayImage
 from src.repositories.gameWindow.core import getLeftArrowPosition
 from src.utils.core import cacheObjectPosition, hashit, locate, locateMultiScale, locateMultiple
+from src.utils.uiScale import getUiScale, locateAtUiScale
+from src.utils.layout import getFrameSeq, isCurrentFrame, setCaptureRegion
 from src.utils.image import convertGraysToBlack, loadFromRGBToGray
 from src.utils.runtime_settings import get_bool
 from .config import hashes
@@ -21,13 +25,15 @@ chatOffImg = loadFromRGBToGray(f'{currentPath}/images/chatOff.png')
 chatOffImg = loadFromRGBToGray(f'{currentPath}/images/chatOff.png')
 lootOfTextImg = loadFromRGBToGray(f'{currentPath}/images/lootOfText.png')
 nothingTextImg = loadFromRGBToGray(f'{currentPath}/images/nothingText.png')
-oldListOfLootCheck: List[int] = []
+# Loot lines hashes remembered to tell old lines apart when the panel is
+# redrawn (tab switch, resize) instead of scrolled.
+lootLinesMemory = 32
 
 
 def _chat_scale_from_menu(chat_menu_bbox: Optional[BBox]) -> float:
     """Estimate UI scale from the chat menu icon match size."""
     if chat_menu_bbox is None:
-        return 1.0
+        return min(getUiScale() or 1.0, 2.0)
     try:
         base_w = int(chatMenuImg.shape[1])
         w = int(chat_menu_bbox[2])
@@ -91,6 +97,7 @@ def getTabs(screenshot: GrayImage) -> Dict[str, Dict[str, Any]]:
         chatsTabsContainerImage = screenshot[y:y + height, x:x + width]
         if chatsTabsContainerImage.size == 0:
             return {}
+        setCaptureRegion('chat.tabs', (x, y, width, height))
         while shouldFindTabs:
             tab_step = max(1, int(round(96 * scale)))
             xOfTab = tabIndex * tab_step
@@ -188,44 +195,149 @@ def getTabs(screenshot: GrayImage) -> Dict[str, Dict[str, Any]]:
         return tabs
 
 
-# TODO: add unit tests
+class LootMessagesReader:
+    """Incremental reader of the loot messages.
+
+    Every frame the messages container is reduced to one key per pixel row.
+    New chat lines scroll the panel up, so the previous keys match the
+    current ones shifted by the appended height and only the rows that do not
+    match are template-matched for "Loot of". Quiet frames cost the row keys
+    and no template matching at all. Each new loot line is kept as an event
+    with its timestamp.
+    """
+
+    def __init__(self, maxEvents: int = 100) -> None:
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=maxEvents)
+        self.weights: Optional[np.ndarray] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.rowsKeys: Optional[np.ndarray] = None
+        self.messages: Optional[GrayImage] = None
+        self.knownLinesHashes: Deque[int] = deque(maxlen=lootLinesMemory)
+        self.lastSeq: Optional[int] = None
+        self.lastEvents: List[Dict[str, Any]] = []
+        self.scannedRows = 0
+
+    def getRowsKeys(self, messages: GrayImage) -> np.ndarray:
+        width = messages.shape[1]
+        if self.weights is None or len(self.weights) != width:
+            self.weights = np.random.default_rng(0x1007).integers(
+                1, np.iinfo(np.int64).max, size=width, dtype=np.int64).astype(np.uint64)
+        with np.errstate(over='ignore'):
+            return (messages.astype(np.uint64) * self.weights).sum(axis=1, dtype=np.uint64)
+
+    def getChangedRows(self, rowsKeys: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Rows changed since the last frame and the first row appended by a scroll.
+
+        The appended row is len(rowsKeys) when the panel did not scroll.
+        """
+        rowsCount = len(rowsKeys)
+        previousRowsKeys = self.rowsKeys
+        if previousRowsKeys is None or len(previousRowsKeys) != rowsCount:
+            return np.ones(rowsCount, dtype=bool), rowsCount
+        bestShift = 0
+        bestMismatches = previousRowsKeys != rowsKeys
+        # Scrolls over half the panel are handled as a redraw.
+        for shift in np.flatnonzero(previousRowsKeys[:rowsCount // 2 + 1] == rowsKeys[0]).tolist():
+            if shift == 0:
+                continue
+            mismatches = previousRowsKeys[shift:] != rowsKeys[:rowsCount - shift]
+            if np.count_nonzero(mismatches) < np.count_nonzero(bestMismatches):
+                bestShift = shift
+                bestMismatches = mismatches
+        if np.count_nonzero(bestMismatches) * 8 > rowsCount - bestShift:
+            # Redrawn rather than scrolled.
+            return np.ones(rowsCount, dtype=bool), rowsCount
+        changedRows = np.ones(rowsCount, dtype=bool)
+        changedRows[:rowsCount - bestShift] = bestMismatches
+        return changedRows, rowsCount - bestShift
+
+    def getLootLinesYs(self, messages: GrayImage, changedRows: np.ndarray) -> List[int]:
+        lineHeight = lootOfTextImg.shape[0]
+        rowsCount = len(changedRows)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], changedRows.astype(np.int8), [0]))))
+        ys = []
+        for start, end in zip(edges[::2], edges[1::2]):
+            # Lines overlapping the changed rows may start above them.
+            top = max(0, int(start) - lineHeight + 1)
+            bottom = min(rowsCount, int(end) + lineHeight - 1)
+            self.scannedRows += bottom - top
+            for line in locateMultiple(messages[top:bottom], lootOfTextImg, confidence=0.82):
+                ys.append(top + int(line[1]))
+        linesYs: List[int] = []
+        for y in sorted(set(ys)):
+            if not linesYs or y - linesYs[-1] >= lineHeight:
+                linesYs.append(y)
+        return linesYs
+
+    def update(self, messages: GrayImage, timestamp: float) -> List[Dict[str, Any]]:
+        """Return the loot lines appended since the last frame as events."""
+        if self.messages is not None and self.messages.shape == messages.shape and np.array_equal(self.messages, messages):
+            return []
+        self.messages = messages.copy()
+        isFirstFrame = self.rowsKeys is None
+        rowsKeys = self.getRowsKeys(messages)
+        changedRows, appendedRow = self.getChangedRows(rowsKeys)
+        self.rowsKeys = rowsKeys
+        if not changedRows.any():
+            return []
+        lineHeight = lootOfTextImg.shape[0]
+        events = []
+        for y in self.getLootLinesYs(messages, changedRows):
+            lineImg = messages[y:y + lineHeight, :]
+            if locate(lineImg, nothingTextImg, confidence=0.82) is not None:
+                continue
+            lineHash = hashit(convertGraysToBlack(lineImg))
+            isNew = y + lineHeight > appendedRow or lineHash not in self.knownLinesHashes
+            self.knownLinesHashes.append(lineHash)
+            # Lines already in the chat when the reader starts are history, not new loot.
+            if isNew and not isFirstFrame:
+                events.append({'timestamp': timestamp, 'y': y, 'hash': lineHash})
+        self.events.extend(events)
+        return events
+
+    def read(self, screenshot: GrayImage, timestamp: Optional[float] = None) -> List[Dict[str, Any]]:
+        currentFrame = isCurrentFrame(screenshot)
+        if currentFrame and self.lastSeq == getFrameSeq():
+            return self.lastEvents
+        messagesImage = getMessagesImage(screenshot)
+        events: List[Dict[str, Any]] = []
+        if messagesImage is not None:
+            messages, (x, y, w, _), scale = messagesImage
+            events = self.update(messages, time.time() if timestamp is None else timestamp)
+            for event in events:
+                event['bbox'] = (x, y + int(round(event['y'] * scale)), w, max(1, int(round(lootOfTextImg.shape[0] * scale))))
+        if currentFrame:
+            self.lastSeq = getFrameSeq()
+            self.lastEvents = events
+        return events
+
+
+lootMessagesReader = LootMessagesReader()
+
+
 # TODO: add perf
 def hasNewLoot(screenshot: GrayImage) -> bool:
-    global oldListOfLootCheck
-    lootLines = getLootLines(screenshot)
-    if len(lootLines) == 0:
-        return False
-    listOfLootCheck = []
-    start = 5
-    if len(lootLines) - 5 <= 0:
-        start = len(lootLines)
-    for i in range(len(lootLines) - start, len(lootLines)):
-        listOfLootCheck.append(hashit(
-            convertGraysToBlack(lootLines[i][0])))
-    # On first observation, initialize state but do not treat existing chat history as "new loot".
-    # This avoids startup false-positives when the Loot tab already contains previous loot lines.
-    if len(listOfLootCheck) != 0 and len(oldListOfLootCheck) == 0:
-        oldListOfLootCheck = listOfLootCheck
-        return False
-    for newLootLine in listOfLootCheck:
-        if newLootLine not in oldListOfLootCheck:
-            oldListOfLootCheck = listOfLootCheck
-            return True
-    oldListOfLootCheck = listOfLootCheck
-    return False
+    return len(lootMessagesReader.read(screenshot)) > 0
+
+
+def getLootEvents(since: float = 0.0) -> List[Dict[str, Any]]:
+    return [event for event in lootMessagesReader.events if event['timestamp'] > since]
+
 
 def resetOldList() -> None:
-    global oldListOfLootCheck
-    oldListOfLootCheck = []
+    lootMessagesReader.reset()
 
-# TODO: add unit tests
-# TODO: add perf
-def getLootLines(screenshot: GrayImage) -> List[Tuple[GrayImage, BBox]]:
+
+def getMessagesImage(screenshot: GrayImage) -> Optional[Tuple[GrayImage, BBox, float]]:
+    """Messages container cropped and scale-normalized, with its bbox and scale."""
     messageContainerPosition = getChatMessagesContainerPosition(screenshot)
     if messageContainerPosition is None:
-        return []
+        return None
     (x, y, w, h) = messageContainerPosition
     messages = screenshot[y: y + h, x: x + w]
+    setCaptureRegion('chat.messages', messageContainerPosition)
 
     # Scale-normalize the message area so template matching is stable under OBS scaling.
     chat_menu = getChatMenuPosition(screenshot)
@@ -242,6 +354,16 @@ def getLootLines(screenshot: GrayImage) -> List[Tuple[GrayImage, BBox]]:
             scale = 1.0
     else:
         messages_norm = messages
+    return messages_norm, messageContainerPosition, scale
+
+
+# TODO: add unit tests
+# TODO: add perf
+def getLootLines(screenshot: GrayImage) -> List[Tuple[GrayImage, BBox]]:
+    messagesImage = getMessagesImage(screenshot)
+    if messagesImage is None:
+        return []
+    messages_norm, (x, y, w, _), scale = messagesImage
 
     # NOTE: locateMultiple signature is (compare_image, template). The old code had args reversed.
     lootLines = locateMultiple(messages_norm, lootOfTextImg, confidence=0.82)
@@ -269,24 +391,15 @@ def getChatMenuPosition(screenshot: GrayImage) -> Union[BBox, None]:
     # OBS projector + Windows DPI scaling can slightly resize the capture output.
     # Use multiscale matching so chat-dependent features (loot detection, tab clicks)
     # keep working.
-    return locateMultiScale(
-        screenshot,
-        chatMenuImg,
-        confidence=0.78,
-        scales=(0.80, 0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15, 1.20),
-    )
+    return locateAtUiScale(screenshot, chatMenuImg, (((0.80, 0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15, 1.20), 0.78),))
 
 
 # TODO: add unit tests
 # TODO: add perf
 @cacheObjectPosition
 def getChatOffPosition(screenshot: GrayImage) -> Union[BBox, None]:
-    return locateMultiScale(
-        screenshot,
-        chatOffImg,
-        confidence=0.92,
-        scales=(0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15),
-    )
+    return locateAtUiScale(
+        screenshot, chatOffImg, (((0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15), 0.92),), anchor=False)
 
 
 # TODO: add unit tests
@@ -296,12 +409,8 @@ def getChatStatus(screenshot: GrayImage) -> Tuple[Optional[BBox], bool]:
     chatOffPos = getChatOffPosition(screenshot)
     if chatOffPos:
         return chatOffPos, False
-    chatOnPos = locateMultiScale(
-        screenshot,
-        chatOnImgTemp,
-        confidence=0.80,
-        scales=(0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15),
-    )
+    chatOnPos = locateAtUiScale(
+        screenshot, chatOnImgTemp, (((0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15), 0.80),), anchor=False)
     return chatOnPos, True
 
 
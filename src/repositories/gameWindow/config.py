@@ -42,6 +42,6 @@ gameWindowSizes = {
 }
 # Cache is mutated at runtime; keep it loosely typed for type-checkers.
 gameWindowCache: Dict[str, Dict[str, Any]] = {
-    'left': {'arrow': None, 'position': None},
-    'right': {'arrow': None, 'position': None},
+    'left': {'arrow': None, 'position': None, 'hash': None, 'seq': None, 'missSeq': None},
+    'right': {'arrow': None, 'position': None, 'hash': None, 'seq': None, 'missSeq': None},
 }
@@ -1,97 +1,74 @@
 from typing import Tuple, Union
 from src.shared.typings import BBox, Coordinate, GrayImage, Slot
-from src.utils.core import hashit, locate
-from .config import arrowsImagesHashes, gameWindowCache, images
+from src.utils.core import cacheByFrame, hashit, locate
+from src.utils.layout import getFrameSeq, isCurrentFrame, recordAnchorStatus, registerAnchor, setCaptureRegion
+from .config import gameWindowCache, images
 
 
-# TODO: add unit tests
-# TODO: add perf
-def getLeftArrowPosition(screenshot: GrayImage) -> Union[BBox, None]:
+def _getArrowPosition(screenshot: GrayImage, side: str) -> Union[BBox, None]:
     global gameWindowCache
-    if gameWindowCache['left']['position'] is not None:
-        arrow_key = gameWindowCache['left'].get('arrow')
-        if not isinstance(arrow_key, str):
-            gameWindowCache['left']['position'] = None
-        elif arrow_key in images['arrows']:
-            leftArrowImage = images['arrows'][arrow_key]
-            leftArrowImageHash = hashit(leftArrowImage)
-            if arrowsImagesHashes.get(leftArrowImageHash, None) is not None:
-                return gameWindowCache['left']['position']
+    cache = gameWindowCache[side]
+    if cache['position'] is None and isCurrentFrame(screenshot) and cache.get('missSeq') == getFrameSeq():
+        return None
+    if cache['position'] is not None:
+        arrow_key = cache.get('arrow')
+        if not isinstance(arrow_key, str) or arrow_key not in images['arrows']:
+            cache['position'] = None
+        elif isCurrentFrame(screenshot) and cache.get('seq') == getFrameSeq():
+            # Already verified against this frame.
+            return cache['position']
         else:
-            gameWindowCache['left']['position'] = None
-    leftGameWindow01Position = locate(
-        screenshot, images['arrows']['leftGameWindow01'], confidence=0.95)
-    if leftGameWindow01Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow01'
-        gameWindowCache['left']['position'] = leftGameWindow01Position
-        return leftGameWindow01Position
-    leftGameWindow11Position = locate(
-        screenshot, images['arrows']['leftGameWindow11'], confidence=0.95)
-    if leftGameWindow11Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow11'
-        gameWindowCache['left']['position'] = leftGameWindow11Position
-        return leftGameWindow11Position
-    leftGameWindow10Position = locate(
-        screenshot, images['arrows']['leftGameWindow10'], confidence=0.95)
-    if leftGameWindow10Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow10'
-        gameWindowCache['left']['position'] = leftGameWindow10Position
-        return leftGameWindow10Position
-    leftGameWindow00Position = locate(
-        screenshot, images['arrows']['leftGameWindow00'], confidence=0.95)
-    if leftGameWindow00Position is not None:
-        gameWindowCache['left']['arrow'] = 'leftGameWindow00'
-        gameWindowCache['left']['position'] = leftGameWindow00Position
-        return leftGameWindow00Position
-
+            x, y, w, h = cache['position']
+            try:
+                # One checksum per frame; only re-layout when it fails.
+                if cache.get('hash') is not None and hashit(screenshot[y:y + h, x:x + w]) == cache['hash']:
+                    cache['seq'] = getFrameSeq()
+                    recordAnchorStatus(f'gameWindow.{side}Arrow', True, cache['position'])
+                    return cache['position']
+            except Exception:
+                pass
+            cache['position'] = None
+    for variant in ('01', '11', '10', '00'):
+        arrow_key = f'{side}GameWindow{variant}'
+        position = locate(screenshot, images['arrows'][arrow_key], confidence=0.95)
+        if position is not None:
+            x, y, w, h = position
+            cache['arrow'] = arrow_key
+            cache['position'] = position
+            cache['hash'] = hashit(screenshot[y:y + h, x:x + w])
+            cache['seq'] = getFrameSeq()
+            recordAnchorStatus(f'gameWindow.{side}Arrow', False, position)
+            return position
+    cache['missSeq'] = getFrameSeq()
+    recordAnchorStatus(f'gameWindow.{side}Arrow', False, None)
     return None
 
 
+# TODO: add unit tests
+# TODO: add perf
+def getLeftArrowPosition(screenshot: GrayImage) -> Union[BBox, None]:
+    return _getArrowPosition(screenshot, 'left')
+
+
 # TODO: add unit tests
 # TODO: add perf
 def getRightArrowPosition(screenshot: GrayImage) -> Union[BBox, None]:
-    global gameWindowCache
-    if gameWindowCache['right']['position'] is not None:
-        arrow_key = gameWindowCache['right'].get('arrow')
-        if not isinstance(arrow_key, str):
-            gameWindowCache['right']['position'] = None
-        elif arrow_key in images['arrows']:
-            rightArrowImage = images['arrows'][arrow_key]
-            rightArrowImageHash = hashit(rightArrowImage)
-            if arrowsImagesHashes.get(rightArrowImageHash, None) is not None:
-                return gameWindowCache['right']['position']
-        else:
-            gameWindowCache['right']['position'] = None
-    rightGameWindow01Position = locate(
-        screenshot, images['arrows']['rightGameWindow01'], confidence=0.95)
-    if rightGameWindow01Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow01'
-        gameWindowCache['right']['position'] = rightGameWindow01Position
-        return rightGameWindow01Position
-    rightGameWindow11Position = locate(
-        screenshot, images['arrows']['rightGameWindow11'], confidence=0.95)
-    if rightGameWindow11Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow11'
-        gameWindowCache['right']['position'] = rightGameWindow11Position
-        return rightGameWindow11Position
-    rightGameWindow10Position = locate(
-        screenshot, images['arrows']['rightGameWindow10'], confidence=0.95)
-    if rightGameWindow10Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow10'
-        gameWindowCache['right']['position'] = rightGameWindow10Position
-        return rightGameWindow10Position
-    rightGameWindow00Position = locate(
-        screenshot, images['arrows']['rightGameWindow00'], confidence=0.95)
-    if rightGameWindow00Position is not None:
-        gameWindowCache['right']['arrow'] = 'rightGameWindow00'
-        gameWindowCache['right']['position'] = rightGameWindow00Position
-        return rightGameWindow00Position
+    return _getArrowPosition(screenshot, 'right')
 
-    return None
+
+def resetArrowsPositions() -> None:
+    for cache in gameWindowCache.values():
+        cache.update({'arrow': None, 'position': None, 'hash': None, 'seq': None, 'missSeq': None})
+
+
+# resetLayout drops the arrows with the other anchors.
+setattr(getLeftArrowPosition, 'reset_cache', resetArrowsPositions)
+registerAnchor('gameWindow.arrows', getLeftArrowPosition)
 
 
 # TODO: add unit tests
 # TODO: add perf
+@cacheByFrame
 def getCoordinate(screenshot: GrayImage, gameWindowSize: Tuple[int, int]) -> Union[BBox, None]:
     global gameWindowCache
     leftArrowPosition = getLeftArrowPosition(screenshot)
@@ -108,6 +85,7 @@ def getCoordinate(screenshot: GrayImage, gameWindowSize: Tuple[int, int]) -> Uni
 # TODO: add unit tests
 # TODO: add perf
 def getImageByCoordinate(screenshot: GrayImage, coordinate: BBox, gameWindowSize: Tuple[int, int]) -> GrayImage:
+    setCaptureRegion('gameWindow', (coordinate[0], coordinate[1], gameWindowSize[0], gameWindowSize[1]))
     return screenshot[coordinate[1]:coordinate[1] +
                     gameWindowSize[1], coordinate[0]:coordinate[0] + gameWindowSize[0]]
 
@@ -10,8 +10,8 @@ from src.shared.typings import Coordinate, GrayImage, Slot, SlotWidth, XYCoordin
 from src.utils.core import hashit
 from src.utils.coordinate import getPixelFromCoordinate
 from src.utils.image import loadFromRGBToGray
-from src.utils.matrix import hasMatrixInsideOther
 from src.wiki.creatures import creatures as wikiCreatures
+from .creaturesNamesImages import CreaturesNamesImages, getScriptCreaturesNames
 from .typings import Creature, CreatureList
 
 
@@ -28,10 +28,23 @@ resolutions = {
         'slotWidth': 64,
     },
 }
-creaturesNamesHashes = {}
-for creature in wikiCreatures:
-    creaturesNamesHashes[creature] = loadFromRGBToGray(
-        f'{currentPath}/images/monsters/{creature}.png')
+creaturesNamesHashes = CreaturesNamesImages(
+    lambda creatureName: loadFromRGBToGray(f'{currentPath}/images/monsters/{creatureName}.png'), wikiCreatures)
+# Bumped by the UI when the waypoints or the ignore list change (profile load
+# included); the pilot re-pins only when it is ahead of the pinned version.
+_pinnedCreaturesNames: dict[str, int] = {'version': 0, 'pinnedVersion': -1}
+
+
+def invalidateScriptCreaturesNames() -> None:
+    _pinnedCreaturesNames['version'] += 1
+
+
+def pinScriptCreaturesNames(context: Any) -> None:
+    version = _pinnedCreaturesNames['version']
+    if version == _pinnedCreaturesNames['pinnedVersion']:
+        return
+    creaturesNamesHashes.pin(getScriptCreaturesNames(context))
+    _pinnedCreaturesNames['pinnedVersion'] = version
 
 
 # TODO: add unit tests
@@ -65,7 +78,7 @@ def getClosestCreature(gameWindowCreatures: list[dict[str, Any]], coordinate: Co
 
 # TODO: add unit tests
 # TODO: add perf
-@njit(fastmath=True)
+@njit(cache=True, fastmath=True)
 def getCreaturesBars(gameWindowImage: GrayImage) -> List[tuple[int, int]]:
     bars = []
     width = gameWindowImage.shape[1] - 27
@@ -100,6 +113,92 @@ def getCreaturesBars(gameWindowImage: GrayImage) -> List[tuple[int, int]]:
     return bars
 
 
+# Pixels allowed under the letters of a creature name (see hasMatrixInsideOther).
+nonCreatureNamePixels = np.ones(256, dtype=np.bool_)
+nonCreatureNamePixels[[0, 29, 57, 91, 113, 152, 170, 192]] = False
+_creaturesNamesImgsCache: dict[Tuple[str, ...], Tuple[List[str], np.ndarray, np.ndarray]] = {}
+
+
+# TODO: add perf
+def getCreaturesNamesImgs(creaturesNames: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Distinct known names with their images stacked and padded, cached per battle list species."""
+    key = tuple(dict.fromkeys(str(creatureName) for creatureName in creaturesNames))
+    cached = _creaturesNamesImgsCache.get(key)
+    if cached is not None:
+        return cached
+    loadedImgs = [(creatureName, creaturesNamesHashes.get(creatureName)) for creatureName in key]
+    names = [creatureName for creatureName, img in loadedImgs if img is not None]
+    imgs = [img for _, img in loadedImgs if img is not None]
+    height = max([img.shape[0] for img in imgs], default=11)
+    widths = np.array([img.shape[1] for img in imgs], dtype=np.int64)
+    namesImgs = np.full((len(imgs), height, max(widths, default=1)), 255, dtype=np.uint8)
+    for index, img in enumerate(imgs):
+        namesImgs[index, :img.shape[0], :img.shape[1]] = img
+    if len(_creaturesNamesImgsCache) >= 64:
+        _creaturesNamesImgsCache.clear()
+    _creaturesNamesImgsCache[key] = (names, namesImgs, widths)
+    return names, namesImgs, widths
+
+
+@njit(cache=True, fastmath=True)
+def _getSliceIndex(index: int, size: int) -> int:
+    if index < 0:
+        index += size
+        if index < 0:
+            return 0
+    return min(index, size)
+
+
+@njit(cache=True, fastmath=True)
+def _hasCreatureNameInside(gameWindowImage: GrayImage, nonCreatureNamePixels: np.ndarray, rowStart: int, rows: int, columnStart: int, columns: int, nameImg: np.ndarray, shift: int, nameWidth: int) -> bool:
+    for i in range(rows):
+        for j in range(min(columns, nameWidth)):
+            if nameImg[i, j + shift] == 0 and nonCreatureNamePixels[gameWindowImage[rowStart + i, columnStart + j]]:
+                return False
+    return True
+
+
+@njit(cache=True, fastmath=True)
+def matchCreaturesNames(gameWindowImage: GrayImage, nonCreatureNamePixels: np.ndarray, creaturesBars: np.ndarray, namesImgs: np.ndarray, namesWidths: np.ndarray) -> np.ndarray:
+    """(bars, names) matches, trying the name aligned, shifted one pixel right and cut one pixel left."""
+    height, gameWindowWidth = gameWindowImage.shape
+    matches = np.zeros((len(creaturesBars), len(namesWidths)), dtype=np.bool_)
+    for barIndex in range(len(creaturesBars)):
+        creatureBarX = creaturesBars[barIndex, 0]
+        creatureBarY0 = creaturesBars[barIndex, 1] - 13
+        rowStart = _getSliceIndex(creatureBarY0, height)
+        rows = max(0, _getSliceIndex(creatureBarY0 + 11, height) - rowStart)
+        for nameIndex in range(len(namesWidths)):
+            nameImg = namesImgs[nameIndex]
+            nameWidth = namesWidths[nameIndex]
+            nameHalfWidth = nameWidth // 2
+            leftDiff = max(nameHalfWidth - 13, 0)
+            gapLeft = 0 if creatureBarX > leftDiff else leftDiff - creatureBarX
+            gapInnerLeft = 0 if nameWidth > 27 else (28 - nameWidth) // 2
+            rightDiff = max(nameWidth - nameHalfWidth - 14, 0)
+            gapRight = 0 if gameWindowWidth > (
+                creatureBarX + 27 + rightDiff) else creatureBarX + 27 + rightDiff - gameWindowWidth
+            gapInnerRight = 0 if nameWidth > 27 else (27 - nameWidth) // 2
+            gg = 13 + gapLeft + gapInnerLeft - gapRight - gapInnerRight
+            startingX = min(max(0, creatureBarX - nameHalfWidth + gg), gameWindowWidth)
+            endingX = min(gameWindowWidth, creatureBarX + nameHalfWidth + gg)
+            columns = max(0, endingX - startingX)
+            if columns != nameWidth:
+                columns = max(0, min(endingX + 1, gameWindowWidth) - startingX)
+            if _hasCreatureNameInside(gameWindowImage, nonCreatureNamePixels, rowStart, rows, startingX, columns, nameImg, 0, nameWidth):
+                matches[barIndex, nameIndex] = True
+                continue
+            columnStart = min(startingX + 1, gameWindowWidth)
+            columns = max(0, min(endingX + 1, gameWindowWidth) - columnStart)
+            if _hasCreatureNameInside(gameWindowImage, nonCreatureNamePixels, rowStart, rows, columnStart, columns, nameImg, 0, nameWidth if columns == nameWidth else nameWidth - 1):
+                matches[barIndex, nameIndex] = True
+                continue
+            columns = max(0, endingX - 1 - startingX)
+            if _hasCreatureNameInside(gameWindowImage, nonCreatureNamePixels, rowStart, rows, startingX, columns, nameImg, 1, nameWidth - 1 if columns == nameWidth - 1 else nameWidth - 2):
+                matches[barIndex, nameIndex] = True
+    return matches
+
+
 # TODO: add unit tests
 # TODO: add perf
 # TODO: add typings
@@ -130,7 +229,12 @@ def getCreatures(
         math.sqrt(((creatureBar[0] - x) ** 2) + ((creatureBar[1] - y) ** 2)) for creatureBar in creaturesBars], dtype=np.float64)
     creaturesBarsSortedIndexes = np.argsort(sqrt)
     discoverTarget = beingAttackedCreatureCategory is not None
-    nonCreaturesForCurrentBar: dict[str, bool] = {}
+    creaturesNames, creaturesNamesImgs, creaturesNamesWidths = getCreaturesNamesImgs(
+        [battleListCreature['name'] for battleListCreature in battleListCreatures])
+    creaturesNamesIndexes = {creatureName: index for index, creatureName in enumerate(creaturesNames)}
+    # Every bar against every distinct name in one pass.
+    creaturesNamesMatches = matchCreaturesNames(
+        gameWindowImage, nonCreatureNamePixels, np.array(creaturesBars, dtype=np.int64).reshape(-1, 2), creaturesNamesImgs, creaturesNamesWidths)
     for creatureBarSortedIndex in creaturesBarsSortedIndexes:
         for battleListIndex in range(len(battleListCreatures)):
             creatureName = battleListCreatures[battleListIndex]['name']
@@ -148,81 +252,14 @@ def getCreatures(
                     discoverTarget = False
                 creatures.append(creature)
                 continue
-            if nonCreaturesForCurrentBar.get(creatureName, None) is not None:
-                continue
-            creatureNameImg = creaturesNamesHashes.get(creatureName)
-            if creatureNameImg is None:
-                nonCreaturesForCurrentBar[creatureName] = True
-                continue
-            creatureNameImg = cast(GrayImage, creatureNameImg)
-            (creatureBarX,
-             creatureBarY) = creaturesBars[creatureBarSortedIndex]
-            creatureBarY0 = creatureBarY - 13
-            creatureBarY1 = creatureBarY0 + 11
-            creatureNameImgHalfWidth = math.floor(creatureNameImg.shape[1] / 2)
-            leftDiff = max(creatureNameImgHalfWidth - 13, 0)
-            gapLeft = 0 if creatureBarX > leftDiff else leftDiff - creatureBarX
-            gapInnerLeft = 0 if creatureNameImg.shape[1] > 27 else math.ceil(
-                (27 - creatureNameImg.shape[1]) / 2)
-            rightDiff = max(
-                creatureNameImg.shape[1] - creatureNameImgHalfWidth - 14, 0)
-            gapRight = 0 if gameWindowWidth > (
-                creatureBarX + 27 + rightDiff) else creatureBarX + 27 + rightDiff - gameWindowWidth
-            gapInnerRight = 0 if creatureNameImg.shape[1] > 27 else math.floor(
-                (27 - creatureNameImg.shape[1]) / 2)
-            gg = 13 + gapLeft + gapInnerLeft - gapRight - gapInnerRight
-            startingX = max(0, creatureBarX - creatureNameImgHalfWidth + gg)
-            endingX = min(gameWindowWidth, creatureBarX +
-                          creatureNameImgHalfWidth + gg)
-            creatureWithDirtNameImg = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                      startingX:endingX]
-            if creatureNameImg.shape[1] != creatureWithDirtNameImg.shape[1]:
-                creatureWithDirtNameImg = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                          startingX:endingX + 1]
-            if hasMatrixInsideOther(creatureWithDirtNameImg, creatureNameImg):
-                creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            creatureNameImg2 = creaturesNamesHashes.get(creatureName)
-            if creatureNameImg2 is None:
-                nonCreaturesForCurrentBar[creatureName] = True
-                continue
-            creatureNameImg2 = cast(GrayImage, creatureNameImg2)
-            creatureWithDirtNameImg2 = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                       startingX + 1:endingX + 1]
-            if creatureNameImg2.shape[1] != creatureWithDirtNameImg2.shape[1]:
-                creatureNameImg2 = creatureNameImg2[:,
-                                                    0:creatureNameImg2.shape[1] - 1]
-            if hasMatrixInsideOther(creatureWithDirtNameImg2, creatureNameImg2):
-                creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
-                continue
-            creatureWithDirtNameImg3 = gameWindowImage[creatureBarY0:creatureBarY1,
-                                                       startingX:endingX - 1]
-            creatureNameImg3 = creaturesNamesHashes.get(creatureName)
-            if creatureNameImg3 is None:
-                nonCreaturesForCurrentBar[creatureName] = True
-                continue
-            creatureNameImg3 = cast(GrayImage, creatureNameImg3)
-            creatureNameImg3 = creatureNameImg3[:, 1:creatureNameImg3.shape[1]]
-            if creatureWithDirtNameImg3.shape[1] != creatureNameImg3.shape[1]:
-                creatureNameImg3 = creatureNameImg3[:,
-                                                    0:creatureNameImg3.shape[1] - 1]
-            if hasMatrixInsideOther(creatureWithDirtNameImg3, creatureNameImg3):
-                creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
-                                        coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
-                if creature['isBeingAttacked']:
-                    discoverTarget = False
-                creatures.append(creature)
+            creatureNameIndex = creaturesNamesIndexes.get(creatureName)
+            if creatureNameIndex is None or not creaturesNamesMatches[creatureBarSortedIndex, creatureNameIndex]:
                 continue
-            nonCreaturesForCurrentBar[creatureName] = True
-        nonCreaturesForCurrentBar.clear()
+            creature = makeCreature(creatureName, 'monster', creaturesBars[creatureBarSortedIndex], direction, gameWindowCoordinate, gameWindowImage,
+                                    coordinate, slotWidth, discoverTarget=discoverTarget, beingAttackedCreatureCategory=beingAttackedCreatureCategory, walkedPixelsInSqm=walkedPixelsInSqm)
+            if creature['isBeingAttacked']:
+                discoverTarget = False
+            creatures.append(creature)
     return creatures
 
 
@@ -275,7 +312,8 @@ def getDifferentCreaturesBySlots(previousGameWindowCreatures: CreatureList, curr
 def getGameWindowWalkableFloorsSqms(walkableFloorsSqms: np.ndarray, coordinate: Coordinate) -> np.ndarray:
     (xOfPixelCoordinate, yOfPixelCoordinate) = getPixelFromCoordinate(
         coordinate)
-    return walkableFloorsSqms[yOfPixelCoordinate - 5:yOfPixelCoordinate + 6, xOfPixelCoordinate - 7:xOfPixelCoordinate + 8]
+    # Copy: callers stamp creatures on it and the floors maps are shared (read-only when memory-mapped).
+    return walkableFloorsSqms[yOfPixelCoordinate - 5:yOfPixelCoordinate + 6, xOfPixelCoordinate - 7:xOfPixelCoordinate + 8].copy()
 
 
 # TODO: add unit tests
@@ -378,7 +416,7 @@ def isCreatureBeingAttacked(gameWindowImage: GrayImage, borderX: int, yOfCreatur
 def isTrappedByCreatures(gameWindowCreatures: CreatureList, radarCoordinate: Coordinate) -> bool:
     pixelRadarCoordinate = getPixelFromCoordinate(radarCoordinate)
     playerBox = walkableFloorsSqms[radarCoordinate[2], pixelRadarCoordinate[1] -
-                                   1: pixelRadarCoordinate[1] + 2, pixelRadarCoordinate[0] - 1: pixelRadarCoordinate[0] + 2]
+                                   1: pixelRadarCoordinate[1] + 2, pixelRadarCoordinate[0] - 1: pixelRadarCoordinate[0] + 2].copy()
     for gameWindowCreature in gameWindowCreatures:
         creatureCoordinate = gameWindowCreature.get('coordinate') if isinstance(gameWindowCreature, dict) else None
         if not isinstance(creatureCoordinate, (list, tuple)) or len(creatureCoordinate) < 2:
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from typing import Any, Callable, Container, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+
+# Creature names templates loaded on demand.
+#
+# Loading the name image of every creature in the wiki at import took most of
+# the gameWindow import time and kept ~1300 templates alive while a script
+# meets a handful of species. Names are now loaded the first time the battle
+# list shows them and the last `maxCreaturesNamesImages` are kept. The
+# creatures a script is known to meet (targeting, ignore list, names in the
+# waypoints) are pinned: loaded up front and never evicted.
+
+maxCreaturesNamesImages = 32
+
+
+class CreaturesNamesImages:
+    def __init__(self, loadImage: Callable[[str], np.ndarray], knownNames: Container[str], maxImages: int = maxCreaturesNamesImages) -> None:
+        self.loadImage = loadImage
+        self.knownNames = knownNames
+        self.maxImages = max(1, maxImages)
+        self.images: 'OrderedDict[str, Optional[np.ndarray]]' = OrderedDict()
+        self.pinnedNames: Set[str] = set()
+
+    def get(self, name: str, default: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        if name in self.images:
+            self.images.move_to_end(name)
+            image = self.images[name]
+            return default if image is None else image
+        if name not in self.knownNames:
+            return default
+        try:
+            loadedImage: Optional[np.ndarray] = self.loadImage(name)
+        except FileNotFoundError:
+            # Wiki creature without a name template: remember the miss.
+            loadedImage = None
+        self.images[name] = loadedImage
+        self.evict()
+        return default if loadedImage is None else loadedImage
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        image = self.get(name)
+        if image is None:
+            raise KeyError(name)
+        return image
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def pin(self, names: Iterable[str]) -> None:
+        """Keep the templates of `names` loaded; names pinned before and not in `names` become evictable."""
+        self.pinnedNames = {name for name in names if name in self.knownNames}
+        for name in self.pinnedNames:
+            self.get(name)
+        self.evict()
+
+    def evict(self) -> None:
+        evictable = [name for name in self.images if name not in self.pinnedNames]
+        for name in evictable[:max(0, len(evictable) - self.maxImages)]:
+            del self.images[name]
+
+    def getLoadedNames(self) -> Tuple[str, ...]:
+        return tuple(name for name, image in self.images.items() if image is not None)
+
+
+def getScriptCreaturesNames(context: Any) -> Set[str]:
+    """Creatures named by the targeting config, the ignore list and the waypoints."""
+    names: Set[str] = set()
+    try:
+        names.update(str(name) for name in (context.get('ng_targeting') or {}).get('creatures', {}))
+    except Exception:
+        pass
+    try:
+        names.update(str(name) for name in context.get('ignorable_creatures') or [])
+    except Exception:
+        pass
+    try:
+        for waypoint in ((context.get('ng_cave') or {}).get('waypoints') or {}).get('items') or []:
+            names.add(str(waypoint.get('label', '')))
+            for value in (waypoint.get('options') or {}).values():
+                if isinstance(value, str):
+                    names.add(value)
+                elif isinstance(value, (list, tuple)):
+                    names.update(item for item in value if isinstance(item, str))
+    except Exception:
+        pass
+    names.discard('')
+    return names
@@ -1,10 +1,17 @@
 from src.shared.typings import GrayImage
-from src.utils.core import locate, locateMultiScale
+from src.utils.core import buildTemplatesPyramids, cacheByFrame, locate, locateAnyMultiScale
+from src.utils.uiScale import getScalesToTry
 from .config import images
 
 
+# OBS projector / DPI scaling slightly resizes UI.
+containersBarsScales = (0.80, 0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15, 1.20)
+buildTemplatesPyramids(list(images['containersBars'].values()), containersBarsScales)
+
+
 # TODO: add unit tests
 # TODO: add perf
+@cacheByFrame
 def isContainerOpen(screenshot: GrayImage, name: str) -> bool:
     if not name:
         return False
@@ -33,21 +40,12 @@ def isContainerOpen(screenshot: GrayImage, name: str) -> bool:
     if not templates:
         return False
 
+    # Fast path: exact-scale match.
     for tpl in templates:
-        # Fast path: exact-scale match.
         if locate(screenshot, tpl) is not None:
             return True
 
-        # Fallback: OBS projector / DPI scaling slightly resizes UI.
-        if (
-            locateMultiScale(
-                screenshot,
-                tpl,
-                confidence=0.78,
-                scales=(0.80, 0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15, 1.20),
-            )
-            is not None
-        ):
-            return True
-
-    return False
+    # Fallback: every variant and scale (just the learned UI scale once known) in
+    # one search, stopping at the first hit.
+    return locateAnyMultiScale(
+        screenshot, templates, confidence=0.78, scales=getScalesToTry(containersBarsScales), stopConfidence=0.78) is not None
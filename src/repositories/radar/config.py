@@ -1,10 +1,10 @@
 import numpy as np
-import numpy.typing as npt
 import pathlib
 from typing import Any, Dict
 from src.shared.typings import Coordinate
 from src.utils.core import hashit
-from src.utils.image import loadFromRGBToGray
+from src.utils.image import load, loadFromRGBToGray
+from .floorsMaps import WalkableFloorsSqms, getWalkableFloorSqms, loadFloorsMaps
 
 
 currentPath = pathlib.Path(__file__).parent.resolve()
@@ -18,75 +18,19 @@ dimensions = {
 floors = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
 floorsConfidence = [0.85, 0.85, 0.9, 0.95, 0.95, 0.95,
                     0.95, 0.85, 0.95, 0.95, 0.95, 0.95, 0.95, 0.9, 0.85, 0.85]
-floorsImgs = [
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-0.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-1.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-2.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-3.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-4.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-5.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-6.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-7.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-8.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-9.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-10.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-11.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-12.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-13.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-14.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/floor-15.png'),
-]
-floorsPathsImgs = [
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-0.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-1.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-2.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-3.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-4.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-5.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-6.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-7.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-8.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-9.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-10.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-11.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-12.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-13.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-14.png'),
-    loadFromRGBToGray(
-        f'{currentPath}/images/paths/floor-15.png'),
-]
-floorsPathsSqms = np.load(f'{currentPath}/npys/floorsPathsSqms.npy')
+# Memory-mapped floors maps written by builders/repositories/radar/buildFloorsMaps.py.
+# Without them (they are generated, not versioned), fall back to decoding the PNGs.
+floorsMaps = loadFloorsMaps()
+floorsImgs: Any
+floorsPathsSqms: Any
+if floorsMaps is not None:
+    floorsImgs = floorsMaps['imgs']
+    floorsPathsSqms = floorsMaps['frictions']
+else:
+    floorsImgs = [
+        loadFromRGBToGray(f'{currentPath}/images/floor-{floor}.png') for floor in floors]
+    floorsPathsSqms = np.stack([
+        load(f'{currentPath}/images/paths/floor-{floor}.png')[:, :, 0] for floor in floors])
 images = {
     'tools': loadFromRGBToGray(f'{currentPath}/images/buttons/radarTools.png')
 }
@@ -152,7 +96,8 @@ nonWalkablePixelsColors = [
     pixelsColorsValues['water'],
     pixelsColorsValues['vacuumOrUndiscoveredArea'],
 ]
-walkableFloorsSqms: npt.NDArray[np.uint8] = np.ndarray(shape=(16, 2048, 2560), dtype=np.uint8)
+walkableFloorsSqms: Any = WalkableFloorsSqms(floorsMaps['walkableBits'], floorsImgs.shape[2]) if floorsMaps is not None else np.ndarray(
+    shape=(16, 2048, 2560), dtype=np.uint8)
 availableTilesFrictions = np.array(
     [70, 90, 95, 100, 110, 125, 140, 150, 160, 200, 250])
 breakpointTileMovementSpeed = {
@@ -187,9 +132,25 @@ tilesFrictionsWithBreakpoints = {
     200: np.array([0, 0, 0, 114, 124, 135, 149, 167, 190, 219, 261, 322, 419, 597, 998, 2444, 25761]),
     250: np.array([117, 126, 135, 146, 160, 175, 195, 220, 252, 295, 356, 446, 598, 884, 1591, 4557, 81351]),
 }
+# Precomputed (tile friction, char speed) -> movement ms table, so path building
+# never has to scan the breakpoints. Speeds above the table fall back to the scan.
+tilesMovementSpeedMaxCharSpeed = 4095
+tilesFrictionsColumns = np.zeros(256, dtype=np.uint8)
+tilesMovementSpeedTable = np.zeros(
+    (len(availableTilesFrictions), tilesMovementSpeedMaxCharSpeed + 1), dtype=np.uint16)
+for tileFriction in range(256):
+    closestTilesFrictions = np.flatnonzero(availableTilesFrictions >= tileFriction)
+    tilesFrictionsColumns[tileFriction] = closestTilesFrictions[0] if len(
+        closestTilesFrictions) > 0 else len(availableTilesFrictions) - 1
+for column, tileFriction in enumerate(availableTilesFrictions):
+    reachedBreakpoints = np.searchsorted(
+        tilesFrictionsWithBreakpoints[int(tileFriction)], np.arange(tilesMovementSpeedMaxCharSpeed + 1), side='right')
+    tilesMovementSpeedTable[column] = [
+        breakpointTileMovementSpeed[max(1, int(reached))] for reached in reachedBreakpoints]
 
 for floor in floors:
     floorHash = hashit(floorsLevelsImgs[floor])
     floorsLevelsImgsHashes[floorHash] = floor
-    walkableFloorsSqms[floor] = np.where(
-        np.isin(floorsPathsImgs[floor], [105, 226]), 0, 1)
+    if floorsMaps is None:
+        walkableFloorsSqms[floor] = getWalkableFloorSqms(
+            loadFromRGBToGray(f'{currentPath}/images/paths/floor-{floor}.png'))
@@ -4,12 +4,13 @@ from numba import njit
 import numpy as np
 from typing import Any, Dict, Optional, Union
 import cv2
-from src.shared.typings import Coordinate, GrayImage, GrayPixel, WaypointList
-from src.utils.core import hashit, locate, locateMultiScale
+from src.shared.typings import BBox, Coordinate, GrayImage, GrayPixel, WaypointList
+from src.utils.core import cacheByFrame, hashit, locate, locateMultiScale
 from src.utils.coordinate import getCoordinateFromPixel, getPixelFromCoordinate
-from .config import availableTilesFrictions, breakpointTileMovementSpeed, coordinates, dimensions, floorsImgs, floorsLevelsImgsHashes, floorsPathsSqms, images, nonWalkablePixelsColors, tilesFrictionsWithBreakpoints, walkableFloorsSqms
+from .config import availableTilesFrictions, breakpointTileMovementSpeed, coordinates, dimensions, floorsImgs, floorsLevelsImgsHashes, floorsPathsSqms, images, nonWalkablePixelsColors, tilesFrictionsColumns, tilesFrictionsWithBreakpoints, tilesMovementSpeedMaxCharSpeed, tilesMovementSpeedTable, walkableFloorsSqms
 from .extractors import getRadarImage
 from .locators import getRadarToolsPosition
+from .tilesIndex import getCandidatesPositions, getFloorTilesIndex
 from .typings import FloorLevel, TileFriction
 
 
@@ -71,6 +72,90 @@ def _scales_for_floor(floor_level: int) -> tuple[float, ...]:
     return default
 
 
+def _radarIgnoreMask(rh: int, rw: int) -> np.ndarray:
+    # Same regions getCoordinate overwrites: player cross and outer border.
+    mask = np.zeros((rh, rw), dtype=bool)
+    cy = int(rh // 2)
+    cx = int(rw // 2)
+    mask[max(0, cy - 4):min(rh, cy + 4), max(0, cx - 4):min(rw, cx + 4)] = True
+    border = int(os.getenv('FENRIL_RADAR_BORDER_MASK_PX', '2'))
+    if border > 0 and rh >= 105 and rh > 2 * border and rw > 2 * border:
+        mask[:border, :] = True
+        mask[-border:, :] = True
+        mask[:, :border] = True
+        mask[:, -border:] = True
+    return mask
+
+
+def _locateByTilesIndex(floorLevel: int, radarImage: GrayImage, debug: Optional[Dict[str, Any]] = None) -> Optional[BBox]:
+    if os.getenv('FENRIL_RADAR_TILES_INDEX', '1').strip().lower() in {'0', 'false', 'no', 'off'}:
+        return None
+    try:
+        floorImg = floorsImgs[floorLevel]
+        lut, index = getFloorTilesIndex(floorLevel, floorImg)
+        query = radarImage
+        # The index is built at minimap scale 1.0; bring zoomed crops back to it.
+        hint = _radar_match_scale_hint.get(int(floorLevel))
+        if hint is not None and hint > 0 and abs(float(hint) - 1.0) >= 0.03:
+            qh = max(1, int(round(radarImage.shape[0] * float(hint))))
+            qw = max(1, int(round(radarImage.shape[1] * float(hint))))
+            query = cv2.resize(radarImage, (qw, qh), interpolation=cv2.INTER_NEAREST)
+        qh, qw = query.shape[:2]
+        ignoreMask = _radarIgnoreMask(qh, qw)
+        candidates = getCandidatesPositions(query, lut, index, ignoreMask=ignoreMask)
+        if debug is not None:
+            debug['radar_tiles_index_candidates'] = candidates
+        paddingSize = 2
+        for (x, y, _) in candidates:
+            yStart = max(0, y - paddingSize)
+            xStart = max(0, x - paddingSize)
+            areaImgToCompare = floorImg[yStart:y + qh + paddingSize, xStart:x + qw + paddingSize]
+            if areaImgToCompare.shape[0] < qh or areaImgToCompare.shape[1] < qw:
+                continue
+            areaFoundImg = locate(areaImgToCompare, query, confidence=0.60)
+            if areaFoundImg is not None:
+                if debug is not None:
+                    debug['radar_tiles_index_hit'] = True
+                return (xStart + areaFoundImg[0], yStart + areaFoundImg[1], qw, qh)
+    except Exception:
+        pass
+    if debug is not None:
+        debug['radar_tiles_index_hit'] = False
+    return None
+
+
+# TODO: add perf
+def maskRadarImage(radarImage: GrayImage) -> GrayImage:
+    """Copy of the radar crop with the player marker / center overlay masked, so matching is less brittle.
+
+    The crop is a view of the screenshot, which may be shared with other readers.
+    """
+    radarImage = radarImage.copy()
+    rh, rw = radarImage.shape[:2]
+    try:
+        cy = int(rh // 2)
+        cx = int(rw // 2)
+        y0 = max(0, cy - 4)
+        y1 = min(rh, cy + 4)
+        x0 = max(0, cx - 4)
+        x1 = min(rw, cx + 4)
+        radarImage[y0:y1, x0:x1] = 128
+
+        # Also de-emphasize the outer border; it can vary with UI/capture scaling.
+        border = int(os.getenv('FENRIL_RADAR_BORDER_MASK_PX', '2'))
+        # Only apply border masking when the crop is close to the canonical minimap size.
+        # If we've trimmed a bottom band, the crop can be smaller and the border is often
+        # actual map content.
+        if border > 0 and rh >= 105 and rh > 2 * border and rw > 2 * border:
+            radarImage[:border, :] = 128
+            radarImage[-border:, :] = 128
+            radarImage[:, :border] = 128
+            radarImage[:, -border:] = 128
+    except Exception:
+        pass
+    return radarImage
+
+
 # TODO: add unit tests
 # TODO: add perf
 # TODO: get by cached images coordinates hashes
@@ -126,28 +211,7 @@ def getCoordinate(
                         previousCoordinate = (sx, sy, int(sz))
             except Exception:
                 pass
-    # Mask the player marker / center overlay so matching is less brittle.
-    try:
-        cy = int(rh // 2)
-        cx = int(rw // 2)
-        y0 = max(0, cy - 4)
-        y1 = min(rh, cy + 4)
-        x0 = max(0, cx - 4)
-        x1 = min(rw, cx + 4)
-        radarImage[y0:y1, x0:x1] = 128
-
-        # Also de-emphasize the outer border; it can vary with UI/capture scaling.
-        border = int(os.getenv('FENRIL_RADAR_BORDER_MASK_PX', '2'))
-        # Only apply border masking when the crop is close to the canonical minimap size.
-        # If we've trimmed a bottom band, the crop can be smaller and the border is often
-        # actual map content.
-        if border > 0 and rh >= 105 and rh > 2 * border and rw > 2 * border:
-            radarImage[:border, :] = 128
-            radarImage[-border:, :] = 128
-            radarImage[:, :border] = 128
-            radarImage[:, -border:] = 128
-    except Exception:
-        pass
+    radarImage = maskRadarImage(radarImage)
     if previousCoordinate is not None:
         (previousCoordinateXPixel, previousCoordinateYPixel) = getPixelFromCoordinate(
             previousCoordinate)
@@ -185,7 +249,7 @@ def getCoordinate(
         if areaFoundImg is None:
             # Fallback: multiscale match for minimap zoom differences.
             scales = _scales_for_floor(int(floorLevel))
-            areaFoundImg = locateMultiScale(areaImgToCompare, radarImage, confidence=0.35, scales=scales)
+            areaFoundImg = locateMultiScale(areaImgToCompare, radarImage, confidence=0.35, scales=scales, cacheTemplates=False)
         if areaFoundImg:
             currentCoordinateXPixel = previousCoordinateXPixel - paddingSize + areaFoundImg[0]
             currentCoordinateYPixel = previousCoordinateYPixel - paddingSize + areaFoundImg[1]
@@ -215,11 +279,15 @@ def getCoordinate(
     # FIX: Lowered confidence thresholds for OBS capture compatibility
     # OBS projector introduces pixel-level variations that prevent high-confidence matches
     # Single-scale: 0.75 → 0.60, Multiscale: 0.48 → 0.40
-    imgCoordinate = locate(floorsImgs[floorLevel], radarImage, confidence=0.60)
+    # Global relocalization: a few tiles index lookups plus one small verification
+    # match. The full-floor search below is only the last resort.
+    imgCoordinate = _locateByTilesIndex(int(floorLevel), radarImage, debug)
+    if imgCoordinate is None:
+        imgCoordinate = locate(floorsImgs[floorLevel], radarImage, confidence=0.60)
     if imgCoordinate is None:
         # Full-floor multiscale match (expensive): only used when single-scale fails.
         scales = _scales_for_floor(int(floorLevel))
-        imgCoordinate = locateMultiScale(floorsImgs[floorLevel], radarImage, confidence=0.40, scales=scales)
+        imgCoordinate = locateMultiScale(floorsImgs[floorLevel], radarImage, confidence=0.40, scales=scales, cacheTemplates=False)
     
     # FIX: If matching failed, return cached coordinate instead of None
     if imgCoordinate is None:
@@ -285,6 +353,7 @@ def getCoordinate(
 
 # TODO: add unit tests
 # TODO: add perf
+@cacheByFrame
 def getFloorLevel(screenshot: GrayImage) -> Optional[FloorLevel]:
     radarToolsPosition = getRadarToolsPosition(screenshot)
     if radarToolsPosition is None:
@@ -350,6 +419,8 @@ def getClosestWaypointIndexFromCoordinate(coordinate: Coordinate, waypoints: Way
 
 # TODO: add perf
 def getBreakpointTileMovementSpeed(charSpeed: int, tileFriction: TileFriction) -> int:
+    if 0 <= charSpeed <= tilesMovementSpeedMaxCharSpeed and 0 <= tileFriction <= 255:
+        return int(tilesMovementSpeedTable[tilesFrictionsColumns[int(tileFriction)], int(charSpeed)])
     tileFrictionNotFound = tileFriction not in tilesFrictionsWithBreakpoints
     if tileFrictionNotFound:
         closestTilesFrictions = np.flatnonzero(
@@ -1,5 +1,6 @@
 from src.repositories.radar import config
 from src.shared.typings import BBox, GrayImage
+from src.utils.layout import setCaptureRegion
 
 import cv2
 import numpy as np
@@ -50,6 +51,11 @@ def getRadarImage(screenshot: GrayImage, radarToolsPosition: BBox) -> GrayImage:
     crop = screenshot[y0c:y1c, x0c:x1c]
     if crop.size == 0:
         return crop
+    # Radar plus the floor level strip right of the tools.
+    regionRight = min(img_w, int(radarToolsPosition[0]) + int(radarToolsPosition[2]) + int(round(12 * scale)))
+    regionTop = max(0, min(y0c, int(radarToolsPosition[1]) - int(round(7 * scale))))
+    regionBottom = min(img_h, max(y1c, int(radarToolsPosition[1]) + int(round(60 * scale))))
+    setCaptureRegion('radar', (x0c, regionTop, regionRight - x0c, regionBottom - regionTop))
 
     # Some UI layouts/minimap sizes include a non-map band at the bottom of this crop
     # (often pure black). Trim trailing rows with near-zero variance so matching doesn't fail.
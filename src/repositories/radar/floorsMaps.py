@@ -0,0 +1,97 @@
+import pathlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# Startup cache of the floors maps.
+#
+# Decoding the 32 floors PNGs and building walkableFloorsSqms took seconds and
+# ~250 MB per client. The build step writes them once as raw .npy files that
+# are memory-mapped read-only, so clients on the same box share the pages and
+# only touch the floors they use:
+# - imgs: minimap floors, as loaded by loadFromRGBToGray;
+# - walkableBits: walkable sqms packed 8 per byte along x;
+# - frictions: tiles frictions (floorsPathsSqms).
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+floorsMapsVersion = 1
+floorsMapsPath = f'{currentPath}/npys/floorsMaps.v{floorsMapsVersion}'
+nonWalkablePathsPixelsColors = [105, 226]
+# Unpacked walkable floors kept in memory per process.
+maxUnpackedFloors = 4
+
+
+def getFloorsMapsFiles(path: str = floorsMapsPath) -> Dict[str, str]:
+    return {name: f'{path}.{name}.npy' for name in ('imgs', 'walkableBits', 'frictions')}
+
+
+def getWalkableFloorSqms(floorPathsImg: np.ndarray) -> np.ndarray:
+    return np.where(np.isin(floorPathsImg, nonWalkablePathsPixelsColors), 0, 1).astype(np.uint8)
+
+
+def buildFloorsMaps(floorsImgs: List[np.ndarray], floorsPathsImgs: List[np.ndarray], floorsPathsSqms: np.ndarray, path: str = floorsMapsPath) -> None:
+    files = getFloorsMapsFiles(path)
+    pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.save(files['imgs'], np.stack(floorsImgs).astype(np.uint8))
+    np.save(files['walkableBits'], np.stack([
+        np.packbits(getWalkableFloorSqms(floorPathsImg), axis=-1) for floorPathsImg in floorsPathsImgs]))
+    np.save(files['frictions'], np.asarray(floorsPathsSqms, dtype=np.uint8))
+
+
+def loadFloorsMaps(path: str = floorsMapsPath) -> Optional[Dict[str, np.ndarray]]:
+    try:
+        floorsMaps = {name: np.load(file, mmap_mode='r') for name, file in getFloorsMapsFiles(path).items()}
+    except Exception:
+        return None
+    floorsCount, height, width = floorsMaps['imgs'].shape
+    if floorsMaps['frictions'].shape != (floorsCount, height, width):
+        return None
+    if floorsMaps['walkableBits'].shape != (floorsCount, height, (width + 7) // 8):
+        return None
+    return floorsMaps
+
+
+class WalkableFloorsSqms:
+    """Read-only stand-in for the (floor, y, x) walkable sqms array.
+
+    Floors are unpacked from the memory-mapped bits on first use and the last
+    `maxUnpackedFloors` are kept. Indexing works like the ndarray it replaces:
+    walkableFloorsSqms[floor], walkableFloorsSqms[floor][y0:y1, x0:x1] and
+    walkableFloorsSqms[floor, y, x].
+    """
+
+    def __init__(self, walkableBits: np.ndarray, width: int, maxFloors: int = maxUnpackedFloors) -> None:
+        self.walkableBits = walkableBits
+        self.shape = (walkableBits.shape[0], walkableBits.shape[1], width)
+        self.dtype = np.dtype(np.uint8)
+        self.maxFloors = max(1, maxFloors)
+        self.floors: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+
+    def getFloor(self, floor: int) -> np.ndarray:
+        floorSqms = self.floors.get(floor)
+        if floorSqms is not None:
+            self.floors.move_to_end(floor)
+            return floorSqms
+        floorSqms = np.unpackbits(self.walkableBits[floor], axis=-1, count=self.shape[2])
+        floorSqms.setflags(write=False)
+        self.floors[floor] = floorSqms
+        while len(self.floors) > self.maxFloors:
+            self.floors.popitem(last=False)
+        return floorSqms
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, tuple):
+            return self.getFloor(int(key[0]))[key[1:]]
+        return self.getFloor(int(key))
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for floor in range(self.shape[0]):
+            yield self[floor]
+
+    def getUnpackedFloors(self) -> Tuple[int, ...]:
+        return tuple(self.floors.keys())
@@ -3,7 +3,8 @@ from typing import Union
 from src.utils.runtime_settings import get_bool, get_float, get_int
 from src.repositories.radar.config import images
 from src.shared.typings import BBox, GrayImage
-from src.utils.core import cacheObjectPosition, locate, locateMultiScale
+from src.utils.core import cacheObjectPosition, locate
+from src.utils.uiScale import locateAtUiScale
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -106,11 +107,11 @@ def getRadarToolsPosition(screenshot: GrayImage, previousPos: Union[BBox, None]
         steps = 2
     scales = [min_scale + (max_scale - min_scale) * i / (steps - 1) for i in range(steps)]
 
-    res = locateMultiScale(screenshot, images['tools'], confidence=confidence, scales=scales)
-    if res is not None:
-        return res
-
     # Fallback: OBS scaling / DPI scaling can move confidence below 0.80.
     # Wider scales + slightly lower confidence improves stability.
     fallback_scales = (0.60, 0.70, 0.80, 0.90, 1.00, 1.10, 1.20, 1.30, 1.40)
-    return locateMultiScale(screenshot, images['tools'], confidence=max(0.65, confidence - 0.12), scales=fallback_scales)
+    return locateAtUiScale(
+        screenshot,
+        images['tools'],
+        ((scales, confidence), (fallback_scales, max(0.65, confidence - 0.12))),
+    )
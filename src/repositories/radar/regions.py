@@ -0,0 +1,321 @@
+import heapq
+import math
+import pathlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from src.shared.typings import Coordinate, CoordinateList
+from src.utils.console_log import log
+
+
+# Coarse region graph over the whole map, used to plan routes far beyond the
+# radar window and across floors.
+#
+# Every floor is cut into `sectorSize` x `sectorSize` sectors and each
+# connected walkable area inside a sector becomes a region. Regions are linked
+# by portals (adjacent walkable tiles across a sector border) and by floor
+# transitions: an access point (yellow minimap tile: stairs, ramps, ladders,
+# rope spots, holes) with another access point right above or below it.
+#
+# A route is a coarse A* over regions. It is returned as checkpoints that are
+# never more than one sector apart, so each leg fits in the radar window and
+# is walked with the usual floor A*.
+#
+# The graph is loaded (or built, ~2s, when the npz is missing or stale) in a
+# background thread on first use. Until it is ready getRoute returns None and
+# walkers only plan inside the radar window, as they did before the graph.
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+regionsGraphPath = f'{currentPath}/npys/floorsRegionsGraph.npz'
+regionsGraphVersion = 1
+sectorSize = 32
+accessPointPixelColor = 226
+floorChangeCost = 10.0
+firstPixelCoordinate = (31744, 30976)
+# Source tile of a transition: the access point itself, then its neighbours.
+_sourceOffsets = [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)]
+# Landing tile of a transition: same position first, then around it.
+_targetOffsets = _sourceOffsets + [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+_regionsGraph: Dict[str, Any] = {
+    'graph': None,
+    'loader': None,
+}
+
+
+def labelFloorRegions(walkableFloorSqms: np.ndarray) -> Tuple[int, np.ndarray]:
+    """Label walkable areas, never joining tiles of two different sectors.
+
+    Returns (regionsCount, labels) where labels is 0 for non walkable tiles.
+    """
+    height, width = walkableFloorSqms.shape
+    ys = np.arange(height) + np.arange(height) // sectorSize
+    xs = np.arange(width) + np.arange(width) // sectorSize
+    # One blank line between sectors, so a single labelling pass keeps them apart.
+    exploded = np.zeros((ys[-1] + 1, xs[-1] + 1), dtype=np.uint8)
+    exploded[np.ix_(ys, xs)] = walkableFloorSqms != 0
+    regionsCount, labels = cv2.connectedComponents(exploded, connectivity=4, ltype=cv2.CV_32S)
+    return regionsCount - 1, labels[np.ix_(ys, xs)]
+
+
+def _getPortals(labels: np.ndarray) -> Tuple[np.ndarray, ...]:
+    height, width = labels.shape
+    portals = []
+    for column in range(sectorSize, width, sectorSize):
+        ys = np.flatnonzero((labels[:, column - 1] > 0) & (labels[:, column] > 0))
+        xs = np.full(len(ys), column, dtype=np.int64)
+        portals.append((ys, xs - 1, ys, xs))
+        portals.append((ys, xs, ys, xs - 1))
+    for row in range(sectorSize, height, sectorSize):
+        xs = np.flatnonzero((labels[row - 1, :] > 0) & (labels[row, :] > 0))
+        ys = np.full(len(xs), row, dtype=np.int64)
+        portals.append((ys - 1, xs, ys, xs))
+        portals.append((ys, xs, ys - 1, xs))
+    fromYs, fromXs, toYs, toXs = (np.concatenate([portal[i] for portal in portals]) for i in range(4))
+    return fromXs, fromYs, toXs, toYs
+
+
+def _getFirstLabel(paddedLabels: np.ndarray, xs: np.ndarray, ys: np.ndarray, offsets: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """First non zero label around each (x, y), trying offsets in order."""
+    candidates = np.stack([paddedLabels[ys + 1 + dy, xs + 1 + dx] for dx, dy in offsets])
+    first = np.argmax(candidates > 0, axis=0)
+    found = np.arange(len(xs))
+    offsetsArray = np.array(offsets, dtype=np.int64).reshape(-1, 2)
+    return (
+        candidates[first, found],
+        xs + offsetsArray[first, 0],
+        ys + offsetsArray[first, 1],
+    )
+
+
+def getFloorsWalkableSqms(walkableFloorsSqms: np.ndarray) -> np.ndarray:
+    return np.array([np.count_nonzero(walkableFloorSqms) for walkableFloorSqms in walkableFloorsSqms], dtype=np.int64)
+
+
+def buildRegionsGraph(walkableFloorsSqms: np.ndarray, floorsImgs: List[np.ndarray]) -> Dict[str, np.ndarray]:
+    floorsCount = len(walkableFloorsSqms)
+    floorsOffsets = np.zeros(floorsCount + 1, dtype=np.int64)
+    floorsLabels = []
+    regionsXs = []
+    regionsYs = []
+    for floor in range(floorsCount):
+        regionsCount, labels = labelFloorRegions(walkableFloorsSqms[floor])
+        floorsOffsets[floor + 1] = floorsOffsets[floor] + regionsCount
+        floorsLabels.append(labels)
+        ys, xs = np.nonzero(labels)
+        tilesLabels = labels[ys, xs]
+        counts = np.maximum(np.bincount(tilesLabels, minlength=regionsCount + 1)[1:], 1)
+        regionsXs.append(np.bincount(tilesLabels, weights=xs, minlength=regionsCount + 1)[1:] / counts)
+        regionsYs.append(np.bincount(tilesLabels, weights=ys, minlength=regionsCount + 1)[1:] / counts)
+    edges: List[Tuple[np.ndarray, ...]] = []
+    for floor in range(floorsCount):
+        labels = floorsLabels[floor]
+        fromXs, fromYs, toXs, toYs = _getPortals(labels)
+        offset = floorsOffsets[floor] - 1
+        edges.append((labels[fromYs, fromXs] + offset, labels[toYs, toXs] + offset, fromXs, fromYs, toXs, toYs))
+        accessYs, accessXs = np.nonzero(floorsImgs[floor] == accessPointPixelColor)
+        if len(accessYs) == 0:
+            continue
+        paddedLabels = np.pad(labels, 1)
+        sourceLabels, sourceXs, sourceYs = _getFirstLabel(paddedLabels, accessXs, accessYs, _sourceOffsets)
+        for targetFloor in (floor - 1, floor + 1):
+            if targetFloor < 0 or targetFloor >= floorsCount:
+                continue
+            paddedAccessPoints = np.pad(floorsImgs[targetFloor] == accessPointPixelColor, 1)
+            hasAccessPoint = np.stack([
+                paddedAccessPoints[accessYs + 1 + dy, accessXs + 1 + dx] for dx, dy in _targetOffsets]).any(axis=0)
+            targetLabels, targetXs, targetYs = _getFirstLabel(
+                np.pad(floorsLabels[targetFloor], 1), accessXs, accessYs, _targetOffsets)
+            linked = (sourceLabels > 0) & (targetLabels > 0) & hasAccessPoint
+            edges.append((
+                sourceLabels[linked] + offset,
+                targetLabels[linked] + floorsOffsets[targetFloor] - 1,
+                sourceXs[linked], sourceYs[linked], targetXs[linked], targetYs[linked],
+            ))
+    edgesSrc, edgesDst, fromXs, fromYs, toXs, toYs = (np.concatenate([edge[i] for edge in edges]) for i in range(6))
+    # Keep a single portal per pair of regions, the middle one of its border.
+    keys = edgesSrc * int(floorsOffsets[-1] + 1) + edgesDst
+    order = np.argsort(keys, kind='stable')
+    _, firsts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    kept = order[firsts + counts // 2]
+    return {
+        'version': np.array([regionsGraphVersion]),
+        'sectorSize': np.array([sectorSize]),
+        'floorsOffsets': floorsOffsets,
+        # Cheap check that the cached graph still matches the walkable maps.
+        'floorsWalkableSqms': getFloorsWalkableSqms(walkableFloorsSqms),
+        'regionsXs': np.concatenate(regionsXs).astype(np.float32),
+        'regionsYs': np.concatenate(regionsYs).astype(np.float32),
+        'edgesSrc': edgesSrc[kept].astype(np.int32),
+        'edgesDst': edgesDst[kept].astype(np.int32),
+        'edgesFromXs': fromXs[kept].astype(np.uint16),
+        'edgesFromYs': fromYs[kept].astype(np.uint16),
+        'edgesToXs': toXs[kept].astype(np.uint16),
+        'edgesToYs': toYs[kept].astype(np.uint16),
+    }
+
+
+def buildFloorsRegionsGraph(walkableFloorsSqms: np.ndarray, floorsImgs: List[np.ndarray], path: str = regionsGraphPath) -> None:
+    pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, **buildRegionsGraph(walkableFloorsSqms, floorsImgs))
+
+
+class RegionsGraph:
+    def __init__(self, arrays: Dict[str, np.ndarray], walkableFloorsSqms: np.ndarray) -> None:
+        self.walkableFloorsSqms = walkableFloorsSqms
+        self.floorsOffsets = arrays['floorsOffsets'].tolist()
+        self.regionsFloors = np.repeat(
+            np.arange(len(self.floorsOffsets) - 1), np.diff(arrays['floorsOffsets'])).tolist()
+        self.regionsXs = arrays['regionsXs'].tolist()
+        self.regionsYs = arrays['regionsYs'].tolist()
+        edgesSrc = arrays['edgesSrc']
+        order = np.argsort(edgesSrc, kind='stable')
+        self.edgesIndptr = np.searchsorted(edgesSrc[order], np.arange(len(self.regionsXs) + 1)).tolist()
+        self.edgesSrc = edgesSrc[order].tolist()
+        self.edgesDst = arrays['edgesDst'][order].tolist()
+        self.edgesFrom = list(zip(arrays['edgesFromXs'][order].tolist(), arrays['edgesFromYs'][order].tolist()))
+        self.edgesTo = list(zip(arrays['edgesToXs'][order].tolist(), arrays['edgesToYs'][order].tolist()))
+        self.edgesCosts = [
+            self.getDistance(src, dst) + (floorChangeCost if self.regionsFloors[src] != self.regionsFloors[dst] else 0.0)
+            for src, dst in zip(self.edgesSrc, self.edgesDst)
+        ]
+        self.floorsLabels: Dict[int, np.ndarray] = {}
+
+    def getDistance(self, region: int, otherRegion: int) -> float:
+        return math.hypot(
+            self.regionsXs[region] - self.regionsXs[otherRegion],
+            self.regionsYs[region] - self.regionsYs[otherRegion])
+
+    def getFloorLabels(self, floor: int) -> np.ndarray:
+        if floor not in self.floorsLabels:
+            self.floorsLabels[floor] = labelFloorRegions(self.walkableFloorsSqms[floor])[1]
+        return self.floorsLabels[floor]
+
+    def getRegion(self, coordinate: Coordinate) -> Optional[int]:
+        floor = int(coordinate[2])
+        if floor < 0 or floor >= len(self.floorsOffsets) - 1:
+            return None
+        labels = self.getFloorLabels(floor)
+        x = int(coordinate[0]) - firstPixelCoordinate[0]
+        y = int(coordinate[1]) - firstPixelCoordinate[1]
+        for dx, dy in _targetOffsets:
+            if 0 <= y + dy < labels.shape[0] and 0 <= x + dx < labels.shape[1] and labels[y + dy, x + dx] > 0:
+                return self.floorsOffsets[floor] + int(labels[y + dy, x + dx]) - 1
+        return None
+
+    def getRegionsPath(self, startRegion: int, goalRegion: int) -> Optional[List[int]]:
+        """A* over regions. Returns the edges indexes to follow, or None."""
+        goalFloor = self.regionsFloors[goalRegion]
+
+        def heuristic(region: int) -> float:
+            return self.getDistance(region, goalRegion) + abs(self.regionsFloors[region] - goalFloor) * floorChangeCost
+
+        costs = {startRegion: 0.0}
+        cameFrom: Dict[int, int] = {}
+        closed = set()
+        heap = [(heuristic(startRegion), startRegion)]
+        while heap:
+            _, region = heapq.heappop(heap)
+            if region == goalRegion:
+                edges = []
+                while region != startRegion:
+                    edge = cameFrom[region]
+                    edges.append(edge)
+                    region = self.edgesSrc[edge]
+                return edges[::-1]
+            if region in closed:
+                continue
+            closed.add(region)
+            for edge in range(self.edgesIndptr[region], self.edgesIndptr[region + 1]):
+                nextRegion = self.edgesDst[edge]
+                cost = costs[region] + self.edgesCosts[edge]
+                if cost < costs.get(nextRegion, math.inf):
+                    costs[nextRegion] = cost
+                    cameFrom[nextRegion] = edge
+                    heapq.heappush(heap, (cost + heuristic(nextRegion), nextRegion))
+        return None
+
+    def getRoute(self, coordinate: Coordinate, goalCoordinate: Coordinate) -> Optional[CoordinateList]:
+        """Checkpoints from coordinate to goalCoordinate, ending with the goal.
+
+        A floor change shows up as two consecutive checkpoints on different
+        floors: the tile to step on (or use) and the landing tile.
+        """
+        startRegion = self.getRegion(coordinate)
+        goalRegion = self.getRegion(goalCoordinate)
+        if startRegion is None or goalRegion is None:
+            return None
+        edges = self.getRegionsPath(startRegion, goalRegion)
+        if edges is None:
+            return None
+        route: CoordinateList = []
+        for edge in edges:
+            sourceFloor = self.regionsFloors[self.edgesSrc[edge]]
+            targetFloor = self.regionsFloors[self.edgesDst[edge]]
+            if sourceFloor != targetFloor:
+                route.append(self.getCoordinate(self.edgesFrom[edge], sourceFloor))
+            route.append(self.getCoordinate(self.edgesTo[edge], targetFloor))
+        route.append(goalCoordinate)
+        return route
+
+    def getCoordinate(self, pixel: Tuple[int, int], floor: int) -> Coordinate:
+        return (pixel[0] + firstPixelCoordinate[0], pixel[1] + firstPixelCoordinate[1], floor)
+
+
+def _loadRegionsGraph(path: str) -> Optional[Dict[str, np.ndarray]]:
+    try:
+        with np.load(path) as data:
+            if int(data['version'][0]) != regionsGraphVersion or int(data['sectorSize'][0]) != sectorSize:
+                return None
+            return {key: data[key] for key in data.files}
+    except Exception:
+        return None
+
+
+def loadRegionsGraph(path: str = regionsGraphPath) -> RegionsGraph:
+    """Load the map regions graph, building (and saving) it when the file is missing or stale."""
+    from .config import floorsImgs, walkableFloorsSqms
+    arrays = _loadRegionsGraph(path)
+    if arrays is None or not np.array_equal(arrays['floorsWalkableSqms'], getFloorsWalkableSqms(walkableFloorsSqms)):
+        arrays = buildRegionsGraph(walkableFloorsSqms, floorsImgs)
+        try:
+            pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+            np.savez(path, **arrays)
+        except OSError:
+            pass
+    return RegionsGraph(arrays, walkableFloorsSqms)
+
+
+def getRegionsGraph(path: str = regionsGraphPath) -> Optional[RegionsGraph]:
+    """The map regions graph, or None while it is loaded in the background."""
+    graph = _regionsGraph['graph']
+    if graph is None and _regionsGraph['loader'] is None:
+        def load() -> None:
+            try:
+                _regionsGraph['graph'] = loadRegionsGraph(path)
+            except Exception as e:
+                log('warn', f"Regions graph unavailable: {type(e).__name__}: {e}")
+        loader = threading.Thread(target=load, name='fenril-regions-graph', daemon=True)
+        _regionsGraph['loader'] = loader
+        loader.start()
+    return graph
+
+
+def isRegionsGraphLoading() -> bool:
+    loader = _regionsGraph['loader']
+    return _regionsGraph['graph'] is None and loader is not None and loader.is_alive()
+
+
+def resetRegionsGraph() -> None:
+    _regionsGraph['graph'] = None
+    _regionsGraph['loader'] = None
+
+
+# TODO: add unit tests
+def getRoute(coordinate: Coordinate, goalCoordinate: Coordinate) -> Optional[CoordinateList]:
+    regionsGraph = getRegionsGraph()
+    if regionsGraph is None:
+        return None
+    return regionsGraph.getRoute(coordinate, goalCoordinate)
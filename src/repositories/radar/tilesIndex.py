@@ -0,0 +1,170 @@
+import pathlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Block-hash inverted index over the floor minimaps.
+#
+# Every floor image is cut into a grid of `blockSize` x `blockSize` blocks.
+# Each block is quantized to the minimap palette (so small capture noise does
+# not change its key) and hashed to an uint64. The index is the sorted list of
+# those keys with the top-left pixel of each block.
+#
+# A radar crop is hashed at every pixel offset. Blocks that line up with the
+# floor grid hit the index and vote for the crop's top-left pixel on the
+# floor; the winning offsets are then confirmed by the caller with a single
+# small template match.
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+tilesIndexPath = f'{currentPath}/npys/floorsTilesIndex.npz'
+tilesIndexVersion = 1
+blockSize = 8
+# Blocks repeated more than this on a floor (water, grass, void...) carry no
+# position information and are dropped from the index.
+maxBucketSize = 16
+_weights = np.random.default_rng(0x7115).integers(
+    1, np.iinfo(np.int64).max, size=blockSize * blockSize, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+
+FloorTilesIndex = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+_floorsTilesIndexes: Dict[int, FloorTilesIndex] = {}
+_lut: Optional[np.ndarray] = None
+
+
+def makePaletteLut(palette: np.ndarray) -> np.ndarray:
+    palette = np.unique(np.asarray(palette, dtype=np.uint8)).astype(np.int16)
+    values = np.arange(256, dtype=np.int16)
+    nearest = np.abs(values[:, None] - palette[None, :]).argmin(axis=1)
+    return palette[nearest].astype(np.uint8)
+
+
+def getBlocksKeys(img: np.ndarray, lut: np.ndarray, step: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """Hash every `blockSize` block of img whose top-left pixel is on a `step` grid.
+
+    Returns (keys, distinct) with shape (rows, cols); distinct is False for
+    single-colour blocks.
+    """
+    quantized = lut[img]
+    windows = np.lib.stride_tricks.sliding_window_view(
+        quantized, (blockSize, blockSize))[::step, ::step]
+    flat = windows.reshape(windows.shape[0], windows.shape[1], blockSize * blockSize)
+    with np.errstate(over='ignore'):
+        keys = (flat.astype(np.uint64) * _weights).sum(axis=2, dtype=np.uint64)
+    distinct = flat.min(axis=2) != flat.max(axis=2)
+    return keys, distinct
+
+
+def buildFloorTilesIndex(floorImg: np.ndarray, lut: np.ndarray) -> FloorTilesIndex:
+    keys, distinct = getBlocksKeys(floorImg, lut, step=blockSize)
+    ys, xs = np.nonzero(distinct)
+    keys = keys[ys, xs]
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    keep = counts[inverse] <= maxBucketSize
+    keys = keys[keep]
+    xs = (xs[keep] * blockSize).astype(np.uint16)
+    ys = (ys[keep] * blockSize).astype(np.uint16)
+    order = np.argsort(keys, kind='stable')
+    return keys[order], xs[order], ys[order]
+
+
+def buildFloorsTilesIndex(floorsImgs: List[np.ndarray], path: str = tilesIndexPath) -> None:
+    palette = np.unique(np.concatenate([np.unique(img) for img in floorsImgs]))
+    lut = makePaletteLut(palette)
+    arrays: Dict[str, np.ndarray] = {
+        'version': np.array([tilesIndexVersion]),
+        'blockSize': np.array([blockSize]),
+        'palette': palette,
+    }
+    for floor, floorImg in enumerate(floorsImgs):
+        keys, xs, ys = buildFloorTilesIndex(floorImg, lut)
+        arrays[f'keys_{floor}'] = keys
+        arrays[f'xs_{floor}'] = xs
+        arrays[f'ys_{floor}'] = ys
+    pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, **arrays)
+
+
+def _loadFloorTilesIndex(floor: int, path: str) -> Optional[Tuple[np.ndarray, FloorTilesIndex]]:
+    try:
+        with np.load(path) as data:
+            if int(data['version'][0]) != tilesIndexVersion or int(data['blockSize'][0]) != blockSize:
+                return None
+            return data['palette'], (data[f'keys_{floor}'], data[f'xs_{floor}'], data[f'ys_{floor}'])
+    except Exception:
+        return None
+
+
+def getFloorTilesIndex(floor: int, floorImg: np.ndarray, path: str = tilesIndexPath) -> Tuple[np.ndarray, FloorTilesIndex]:
+    """Lazily load the floor index, building it in-process when the file is missing or stale."""
+    global _lut
+    floor = int(floor)
+    if floor not in _floorsTilesIndexes or _lut is None:
+        loaded = _loadFloorTilesIndex(floor, path)
+        if loaded is not None:
+            palette, index = loaded
+            _lut = makePaletteLut(palette)
+        else:
+            if _lut is None:
+                _lut = makePaletteLut(np.unique(floorImg))
+            index = buildFloorTilesIndex(floorImg, _lut)
+        _floorsTilesIndexes[floor] = index
+    return _lut, _floorsTilesIndexes[floor]
+
+
+def resetTilesIndex() -> None:
+    global _lut
+    _floorsTilesIndexes.clear()
+    _lut = None
+
+
+def getCandidatesPositions(
+    radarImage: np.ndarray,
+    lut: np.ndarray,
+    index: FloorTilesIndex,
+    ignoreMask: Optional[np.ndarray] = None,
+    minVotes: int = 3,
+    maxCandidates: int = 3,
+) -> List[Tuple[int, int, int]]:
+    """Return up to maxCandidates (x, y, votes) floor positions for the crop's top-left pixel."""
+    indexKeys, indexXs, indexYs = index
+    if len(indexKeys) == 0:
+        return []
+    h, w = radarImage.shape[:2]
+    if h < blockSize or w < blockSize:
+        return []
+    keys, distinct = getBlocksKeys(radarImage, lut)
+    if ignoreMask is not None:
+        # Drop blocks touching masked pixels (player cross, border).
+        masked = np.lib.stride_tricks.sliding_window_view(
+            ignoreMask.astype(bool), (blockSize, blockSize)).any(axis=(2, 3))
+        distinct &= ~masked
+    qys, qxs = np.nonzero(distinct)
+    if len(qys) == 0:
+        return []
+    queryKeys = keys[qys, qxs]
+    lo = np.searchsorted(indexKeys, queryKeys, side='left')
+    hi = np.searchsorted(indexKeys, queryKeys, side='right')
+    hits = np.nonzero(hi > lo)[0]
+    if len(hits) == 0:
+        return []
+    counts = (hi - lo)[hits]
+    matches = np.repeat(hits, counts)
+    offsets = np.arange(len(matches)) - np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.repeat(lo[hits], counts) + offsets
+    xs = indexXs[positions].astype(np.int32) - qxs[matches].astype(np.int32)
+    ys = indexYs[positions].astype(np.int32) - qys[matches].astype(np.int32)
+    packed = (ys.astype(np.int64) << 32) | (xs.astype(np.int64) & 0xFFFFFFFF)
+    votesKeys, votes = np.unique(packed, return_counts=True)
+    order = np.argsort(-votes, kind='stable')[:maxCandidates]
+    candidates = []
+    for i in order:
+        if votes[i] < minVotes:
+            break
+        key = int(votesKeys[i])
+        x = key & 0xFFFFFFFF
+        if x >= 0x80000000:
+            x -= 0x100000000
+        y = key >> 32
+        candidates.append((int(x), int(y), int(votes[i])))
+    return candidates
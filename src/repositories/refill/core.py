@@ -1,7 +1,7 @@
 from time import sleep
 from typing import Optional
 from src.shared.typings import BBox, GrayImage
-from src.utils.core import cacheObjectPosition, locate, locateMultiScale, getScreenshot
+from src.utils.core import cacheObjectPosition, locate, locateAnyMultiScale, getScreenshot
 from src.utils.image import crop
 from src.utils.keyboard import hotkey, press, write
 from src.utils.mouse import leftClick, moveTo
@@ -15,15 +15,9 @@ def _locate_any_template(
     confidence: float,
     scales: tuple[float, ...],
 ) -> Optional[BBox]:
-    for template in templates:
-        pos = locateMultiScale(
-            screenshot,
-            template,
-            confidence=confidence,
-            scales=scales,
-        )
-        if pos is not None:
-            return pos
+    res = locateAnyMultiScale(screenshot, templates, confidence=confidence, scales=scales)
+    if res is not None:
+        return res[1]
     for template in templates:
         pos = locate(screenshot, template, confidence=confidence)
         if pos is not None:
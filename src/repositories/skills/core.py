@@ -1,14 +1,16 @@
 import numpy as np
 from typing import Union
 from src.shared.typings import BBox, GrayImage
-from src.utils.core import hashit
+from src.utils.core import cacheByFrame, hashit
 from src.utils.image import convertGraysToBlack
+from src.utils.layout import setCaptureRegion
 from .config import minutesOrHoursHashes, numbersHashes
 from .locators import getSkillsIconPosition
 
 
 # TODO: add unit tests
 # PERF: [0.04747469999999998, 2.9300000000009874e-05]
+@cacheByFrame
 def getCapacity(screenshot: GrayImage) -> Union[int, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
@@ -20,6 +22,7 @@ def getCapacity(screenshot: GrayImage) -> Union[int, None]:
 
 # TODO: add unit tests
 # TODO: add perf
+@cacheByFrame
 def getFood(screenshot: GrayImage) -> Union[int, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
@@ -31,6 +34,7 @@ def getFood(screenshot: GrayImage) -> Union[int, None]:
 
 # TODO: add unit tests
 # PERF: [0.04967209999999955, 3.1599999999798456e-05]
+@cacheByFrame
 def getHp(screenshot: GrayImage) -> Union[int, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
@@ -42,6 +46,7 @@ def getHp(screenshot: GrayImage) -> Union[int, None]:
 
 # TODO: add unit tests
 # PERF: [0.05254219999999998, 2.970000000068751e-05]
+@cacheByFrame
 def getMana(screenshot: GrayImage) -> Union[int, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
@@ -53,6 +58,7 @@ def getMana(screenshot: GrayImage) -> Union[int, None]:
 
 # TODO: add unit tests
 # PERF: [0.04700700000000024, 3.0399999999985994e-05]
+@cacheByFrame
 def getSpeed(screenshot: GrayImage) -> Union[int, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
@@ -64,6 +70,7 @@ def getSpeed(screenshot: GrayImage) -> Union[int, None]:
 
 # TODO: add unit tests
 # PERF: [0.047493200000000346, 2.0000000000131024e-05]
+@cacheByFrame
 def getStamina(screenshot: GrayImage) -> Union[int, None]:
     skillsIconPosition = getSkillsIconPosition(screenshot)
     if skillsIconPosition is None:
@@ -76,6 +83,7 @@ def getStamina(screenshot: GrayImage) -> Union[int, None]:
 # TODO: add unit tests
 # TODO: add perf
 def getMinutesCount(screenshot: GrayImage, position: BBox) -> int:
+    setCaptureRegion(f'skills.{position[1]}', (position[0] + 110, position[1], 34, 8))
     minutesCountsImage = convertGraysToBlack(
         screenshot[position[1]:position[1] + 8, position[0] + 130:position[0] + 144])
     minutesCountsHashKey = hashit(minutesCountsImage)
@@ -94,6 +102,7 @@ def getMinutesCount(screenshot: GrayImage, position: BBox) -> int:
 # TODO: add unit tests
 # TODO: add perf
 def getValuesCount(screenshot: GrayImage, position: BBox) -> int:
+    setCaptureRegion(f'skills.{position[1]}', (position[0] + 94, position[1], 50, 8))
     capacityHundredsCountsImage = convertGraysToBlack(
         screenshot[position[1]:position[1] + 8, position[0] + 144 - 22:position[0] + 144])
     capacityHundredsCountsImage = np.where(
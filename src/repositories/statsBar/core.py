@@ -1,6 +1,8 @@
 from typing import Optional, TypedDict
 
 from src.shared.typings import GrayImage
+from src.utils.core import cacheByFrame
+from src.utils.layout import setCaptureRegion
 from .locators import getStopIconPosition, getStatsPz, getStatsHur, getStatsPoison
 
 
@@ -10,6 +12,7 @@ class StatsBarStats(TypedDict):
   poison: bool
 
 
+@cacheByFrame
 def getStats(screenshot: GrayImage) -> Optional[StatsBarStats]:
   stopIcon = getStopIconPosition(screenshot)
 
@@ -22,6 +25,7 @@ def getStats(screenshot: GrayImage) -> Optional[StatsBarStats]:
     )
 
     statsBarImg = screenshot[statsBarPosition[1]:statsBarPosition[3], statsBarPosition[0]:statsBarPosition[2]]
+    setCaptureRegion('statsBar', (statsBarPosition[0], statsBarPosition[1], statsBarPosition[2] - statsBarPosition[0], statsBarPosition[3] - statsBarPosition[1]))
 
     statsPz = getStatsPz(statsBarImg)
     statsHur = getStatsHur(statsBarImg)
@@ -3,6 +3,7 @@ from typing import Union
 
 import numpy as np
 from src.shared.typings import GrayImage
+from src.utils.core import cacheByFrame
 from .config import hpBarAllowedPixelsColors, manaBarAllowedPixelsColors
 from .extractors import getHpBar, getManaBar
 from .locators import getHpIconPosition, getManaIconPosition
@@ -33,6 +34,7 @@ def getFilledBarPercentage(bar: np.ndarray, allowedPixelsColors: np.ndarray) ->
 
 # TODO: add unit tests
 # PERF: [0.34756980000000004, 2.9999999999752447e-06]
+@cacheByFrame
 def getHpPercentage(screenshot: GrayImage) -> Union[int, None]:
     hpIconPosition = getHpIconPosition(screenshot)
     if hpIconPosition is None:
@@ -46,6 +48,7 @@ def getHpPercentage(screenshot: GrayImage) -> Union[int, None]:
 
 # TODO: add unit tests
 # PERF: [0.32003090000000034, 3.200000000092018e-06]
+@cacheByFrame
 def getManaPercentage(screenshot: GrayImage) -> Union[int, None]:
     manaIconPosition = getManaIconPosition(screenshot)
     if manaIconPosition is None:
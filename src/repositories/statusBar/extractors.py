@@ -1,4 +1,5 @@
 from src.shared.typings import BBox, GrayImage
+from src.utils.layout import setCaptureRegion
 from .config import barSize
 import numpy as np
 
@@ -20,6 +21,7 @@ def getHpBar(screenshot: GrayImage, heartPos: BBox) -> GrayImage:
         bar = screenshot[y0:y1, x0:x1]
         if len(bar) == 0 or len(bar[0]) == 0:
             return np.array([])
+        setCaptureRegion('statusBar.hp', (x0, y0, barSize, 1))
         return bar[0]
     except (IndexError, KeyError) as e:
         return np.array([])
@@ -42,6 +44,7 @@ def getManaBar(screenshot: GrayImage, heartPos: BBox) -> GrayImage:
         bar = screenshot[y0:y1, x0:x1]
         if len(bar) == 0 or len(bar[0]) == 0:
             return np.array([])
+        setCaptureRegion('statusBar.mana', (x0, y0, barSize, 1))
         return bar[0]
     except (IndexError, KeyError) as e:
         return np.array([])
@@ -1,4 +1,5 @@
 from os.path import exists
+import threading
 import time
 from typing import Any, Callable, Dict, List, Optional, cast
 
@@ -7,14 +8,16 @@ from tkinter import messagebox
 import pygetwindow as gw
 from src.gameplay.core.load import loadContextFromConfig, loadNgCfgs
 from src.repositories.chat.core import resetOldList
+from src.repositories.gameWindow.creatures import invalidateScriptCreaturesNames
 # from src.utils.core import getScreenshot
 from src.utils.console_log import log
 from src.utils.console_log import configure_console_log
 from src.utils.core import configure_capture, setScreenshotOutputIdx
 from src.utils.ino import configure_arduino
 from src.utils.mouse import configure_mouse
-from src.utils.runtime_settings import get_bool, get_float, get_int, get_str
+from src.utils.runtime_settings import RuntimeSettings, get_bool, get_float, get_int, get_str
 from src.utils.safety import configure_safe_log
+from src.utils.uiScale import configureUiScale
 from src.repositories.radar.locators import configure_radar_locators
 from src.repositories.battleList.locators import configure_battlelist_locators
 from src.repositories.battleList.extractors import configure_battlelist_extractors
@@ -26,12 +29,15 @@ class Context:
     def __init__(self, context: Dict[str, Any]) -> None:
         shouldInsertProfile = not exists(self.filePath)
         self.db = TinyDB(self.filePath)
+        self.pendingUiScale: Optional[float] = None
+        self.pendingUiScaleLock = threading.Lock()
         if shouldInsertProfile:
             self.insertProfile()
         self.enabledProfile = self.getEnabledProfile()
         load_context = cast(Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]], loadContextFromConfig)
         self.context = load_context(
             self.enabledProfile['config'], context)
+        invalidateScriptCreaturesNames()
 
         # Apply runtime configuration to global helpers/backends.
         try:
@@ -57,6 +63,11 @@ class Context:
                 dxcam_recover_on_stale=get_bool(self.context, 'ng_runtime.dxcam_recover_on_stale', env_var='FENRIL_DXCAM_RECOVER_ON_STALE', default=True),
                 dxcam_recover_on_black=get_bool(self.context, 'ng_runtime.dxcam_recover_on_black', env_var='FENRIL_DXCAM_RECOVER_ON_BLACK', default=True),
                 log_dxcam_recovery=get_bool(self.context, 'ng_runtime.log_dxcam_recovery', env_var='FENRIL_LOG_DXCAM_RECOVERY', default=True),
+                # The healing loop reads its frames from the capture thread.
+                pipelined=get_bool(self.context, 'ng_runtime.capture_pipelined', env_var='FENRIL_CAPTURE_PIPELINED', default=False)
+                or get_bool(self.context, 'ng_runtime.healing_loop', env_var='FENRIL_HEALING_LOOP', default=False),
+                pipelined_ring_size=get_int(self.context, 'ng_runtime.capture_ring_size', env_var='FENRIL_CAPTURE_RING_SIZE', default=3),
+                pipelined_wait_s=get_float(self.context, 'ng_runtime.capture_pipelined_wait_s', env_var='FENRIL_CAPTURE_PIPELINED_WAIT_S', default=0.05),
             )
         except Exception:
             pass
@@ -123,6 +134,15 @@ class Context:
             )
         except Exception:
             pass
+
+        try:
+            configureUiScale(
+                enabled=get_bool(self.context, 'ng_runtime.ui_scale_learning', env_var='FENRIL_UI_SCALE_LEARNING', default=True),
+                scale=self.enabledProfile['config'].get('ng_uiScale'),
+                persist=self.setUiScale,
+            )
+        except Exception:
+            pass
         window_title = self.enabledProfile['config'].get('window_title')
         if window_title:
             self.setWindowTitle(window_title, persist=False)
@@ -142,7 +162,7 @@ class Context:
         if not isinstance(self.enabledProfile['config']['ng_backpacks'], dict):
             self.enabledProfile['config']['ng_backpacks'] = {}
         self.enabledProfile['config']['ng_backpacks']['main'] = backpack
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def insertProfile(self) -> None:
         self.db.insert({
@@ -200,6 +220,15 @@ class Context:
                     'attack_from_battlelist': False,
                     'targeting_diag': False,
                     'window_diag': False,
+                    'tick_profiler': False,
+                    'tick_profiler_path': '',
+                    'capture_roi': False,
+                    'capture_roi_full_every': 30,
+                    'ui_scale_learning': True,
+                    'healing_loop': False,
+                    'healing_loop_interval_s': 0.02,
+                    'frame_bus_client': '',
+                    'jit_warmup': True,
                     'dump_task_on_timeout': False,
                     'status_log_interval_s': 2.0,
                     'loot_modifier': 'shift',
@@ -400,7 +429,8 @@ class Context:
             self.enabledProfile['config']['ng_cave']['waypoints'] = {}
         
         self.enabledProfile['config']['ng_cave']['waypoints']['items'] = upgraded
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
+        invalidateScriptCreaturesNames()
 
     def _getLegacyRefillOptions(self) -> Optional[Dict[str, Any]]:
         try:
@@ -516,7 +546,7 @@ class Context:
                 self.enabledProfile['config']['ng_comboSpells']['items'].append(comboSpellsItem)
         
         self.enabledProfile['config']['healing'] = self.context.get('healing', {})
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def importLegacySetup(self, setup: Dict[str, Any]) -> None:
         """Import a legacy scripts-master setup_*.json into the current profile.
@@ -723,7 +753,8 @@ class Context:
                 self.enabledProfile['config'].setdefault('ng_cave', {})
                 self.enabledProfile['config']['ng_cave'].setdefault('waypoints', {})
                 self.enabledProfile['config']['ng_cave']['waypoints']['items'] = items_list
-            self.db.update(self.enabledProfile)
+            self.saveProfile()
+            invalidateScriptCreaturesNames()
         except Exception:
             pass
 
@@ -767,10 +798,21 @@ class Context:
 
     def _ensureNgRuntimeConfig(self) -> None:
         if 'ng_runtime' not in self.context or not isinstance(self.context.get('ng_runtime'), dict):
-            self.context['ng_runtime'] = {}
+            self.context['ng_runtime'] = RuntimeSettings()
+        elif not isinstance(self.context['ng_runtime'], RuntimeSettings):
+            self.context['ng_runtime'] = RuntimeSettings(self.context['ng_runtime'])
         self.context['ng_runtime'].setdefault('attack_from_battlelist', False)
         self.context['ng_runtime'].setdefault('targeting_diag', False)
         self.context['ng_runtime'].setdefault('window_diag', False)
+        self.context['ng_runtime'].setdefault('tick_profiler', False)
+        self.context['ng_runtime'].setdefault('tick_profiler_path', '')
+        self.context['ng_runtime'].setdefault('capture_roi', False)
+        self.context['ng_runtime'].setdefault('capture_roi_full_every', 30)
+        self.context['ng_runtime'].setdefault('ui_scale_learning', True)
+        self.context['ng_runtime'].setdefault('healing_loop', False)
+        self.context['ng_runtime'].setdefault('healing_loop_interval_s', 0.02)
+        self.context['ng_runtime'].setdefault('frame_bus_client', '')
+        self.context['ng_runtime'].setdefault('jit_warmup', True)
         self.context['ng_runtime'].setdefault('dump_task_on_timeout', False)
         self.context['ng_runtime'].setdefault('status_log_interval_s', 2.0)
         self.context['ng_runtime'].setdefault('loot_modifier', 'shift')
@@ -868,6 +910,15 @@ class Context:
                 prof.setdefault('attack_from_battlelist', False)
                 prof.setdefault('targeting_diag', False)
                 prof.setdefault('window_diag', False)
+                prof.setdefault('tick_profiler', False)
+                prof.setdefault('tick_profiler_path', '')
+                prof.setdefault('capture_roi', False)
+                prof.setdefault('capture_roi_full_every', 30)
+                prof.setdefault('ui_scale_learning', True)
+                prof.setdefault('healing_loop', False)
+                prof.setdefault('healing_loop_interval_s', 0.02)
+                prof.setdefault('frame_bus_client', '')
+                prof.setdefault('jit_warmup', True)
                 prof.setdefault('dump_task_on_timeout', False)
                 prof.setdefault('status_log_interval_s', 2.0)
                 prof.setdefault('loot_modifier', 'shift')
@@ -921,6 +972,21 @@ class Context:
         self.context['ng_runtime']['start_paused'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['start_paused'] = v
+        self.saveProfile()
+
+    def setUiScale(self, scale: float) -> None:
+        # Called from the pilot thread: only the UI thread writes the profile
+        # (TinyDB rewrites file.json without locking), so the scale waits for
+        # its next save.
+        with self.pendingUiScaleLock:
+            self.pendingUiScale = float(scale)
+
+    def saveProfile(self) -> None:
+        with self.pendingUiScaleLock:
+            pendingUiScale = self.pendingUiScale
+            self.pendingUiScale = None
+        if pendingUiScale is not None:
+            self.enabledProfile['config']['ng_uiScale'] = pendingUiScale
         self.db.update(self.enabledProfile)
 
     def setWindowTitle(self, window_title: str, persist: bool = True) -> bool:
@@ -929,7 +995,7 @@ class Context:
         self.context['window'] = windows[0] if windows else None
         if persist:
             self.enabledProfile['config']['window_title'] = window_title
-            self.db.update(self.enabledProfile)
+            self.saveProfile()
         return self.context['window'] is not None
 
     def getEnabledProfile(self) -> Dict[str, Any]:
@@ -938,30 +1004,32 @@ class Context:
     def updateLootBackpack(self, backpack: str) -> None:
         self.context['ng_backpacks']['loot'] = backpack
         self.enabledProfile['config']['ng_backpacks']['loot'] = backpack
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def addWaypoint(self, waypoint: Dict[str, Any]) -> None:
         self.context['ng_cave']['waypoints']['items'].append(waypoint)
         self.enabledProfile['config']['ng_cave']['waypoints']['items'].append(
             waypoint)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
+        invalidateScriptCreaturesNames()
 
     def addCombo(self, combo: Dict[str, Any]) -> None:
         self.context['ng_comboSpells']['items'].append(combo)
         self.enabledProfile['config']['ng_comboSpells']['items'].append(
             combo)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def addIgnorableCreature(self, creature: str) -> None:
         self.context['ignorable_creatures'].append(creature)
         self.enabledProfile['config']['ignorable_creatures'].append(creature)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
+        invalidateScriptCreaturesNames()
 
     def addSpellByIndex(self, index: int, spell: Dict[str, Any]) -> None:
         self.context['ng_comboSpells']['items'][index]['spells'].append(spell)
         # self.enabledProfile['config']['ng_comboSpells']['items'][index]['spells'].append(
         #     spell)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def getAllWaypointLabels(self) -> List[str]:
         waypointsLabels = [waypointItem['label'] for waypointItem in self.context['ng_cave']
@@ -982,30 +1050,34 @@ class Context:
             self.enabledProfile['config']['ng_cave']['waypoints']['items'][waypointIndex]['label'] = label
         self.context['ng_cave']['waypoints']['items'][waypointIndex]['options'] = options
         self.enabledProfile['config']['ng_cave']['waypoints']['items'][waypointIndex]['options'] = options
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
+        invalidateScriptCreaturesNames()
 
     def updateIgnorableCreatureByIndex(self, creatureIndex: int, name: Optional[str] = None) -> None:
         if name is not None:
             self.context['ignorable_creatures'][creatureIndex] = name
             self.enabledProfile['config']['ignorable_creatures'][creatureIndex] = name
-            self.db.update(self.enabledProfile)
+            self.saveProfile()
+            invalidateScriptCreaturesNames()
 
     def removeWaypointByIndex(self, index: int) -> None:
         self.context['ng_cave']['waypoints']['items'].pop(index)
         self.enabledProfile['config']['ng_cave']['waypoints']['items'].pop(
             index)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
+        invalidateScriptCreaturesNames()
 
     def removeComboByIndex(self, index: int) -> None:
         self.context['ng_comboSpells']['items'].pop(index)
         self.enabledProfile['config']['ng_comboSpells']['items'].pop(
             index)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def removeIgnorableCreatureByIndex(self, index: int) -> None:
         self.context['ignorable_creatures'].pop(index)
         self.enabledProfile['config']['ignorable_creatures'].pop(index)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
+        invalidateScriptCreaturesNames()
 
     def play(self) -> None:
         if self.context['window'] is None:
@@ -1033,41 +1105,41 @@ class Context:
     def toggleHealingPotionsByKey(self, healthPotionType: str, enabled: bool) -> None:
         self.context['healing']['potions'][healthPotionType]['enabled'] = enabled
         self.enabledProfile['config']['healing']['potions'][healthPotionType]['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleFoodByKey(self, enabled: bool) -> None:
         self.context['healing']['eatFood']['enabled'] = enabled
         self.enabledProfile['config']['healing']['eatFood']['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleHealingHighPriorityByKey(self, key: str, enabled: bool) -> None:
         self.context['healing']['highPriority'][key]['enabled'] = enabled
         self.enabledProfile['config']['healing']['highPriority'][key]['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setShovelHotkey(self, hotkey: str) -> None:
         self.context['general_hotkeys']['shovel_hotkey'] = hotkey
         self.enabledProfile['config']['general_hotkeys']['shovel_hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRopeHotkey(self, hotkey: str) -> None:
         self.context['general_hotkeys']['rope_hotkey'] = hotkey
         self.enabledProfile['config']['general_hotkeys']['rope_hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackEnabled(self, enabled: bool) -> None:
         self._ensureManualAutoAttackConfig()
         self.context['manual_auto_attack']['enabled'] = enabled
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackHotkey(self, hotkey: str) -> None:
         self._ensureManualAutoAttackConfig()
         self.context['manual_auto_attack']['hotkey'] = hotkey
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackInterval(self, interval_s: float) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1083,7 +1155,7 @@ class Context:
         self.context['manual_auto_attack']['interval_s'] = interval_s
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['interval_s'] = interval_s
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackMethod(self, method: str) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1093,14 +1165,14 @@ class Context:
         self.context['manual_auto_attack']['method'] = method_norm
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['method'] = method_norm
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackOnlyWhenNotAttacking(self, enabled: bool) -> None:
         self._ensureManualAutoAttackConfig()
         self.context['manual_auto_attack']['only_when_not_attacking'] = bool(enabled)
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['only_when_not_attacking'] = bool(enabled)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackKeyRepeat(self, repeats: int) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1115,7 +1187,7 @@ class Context:
         self.context['manual_auto_attack']['key_repeat'] = repeats_i
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['key_repeat'] = repeats_i
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackPreDelay(self, delay_s: float) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1130,7 +1202,7 @@ class Context:
         self.context['manual_auto_attack']['pre_delay_s'] = v
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['pre_delay_s'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackClickModifier(self, modifier: str) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1142,7 +1214,7 @@ class Context:
         self.context['manual_auto_attack']['click_modifier'] = mod
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['click_modifier'] = mod
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackClickButton(self, button: str) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1152,14 +1224,14 @@ class Context:
         self.context['manual_auto_attack']['click_button'] = btn
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['click_button'] = btn
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackFocusBefore(self, enabled: bool) -> None:
         self._ensureManualAutoAttackConfig()
         self.context['manual_auto_attack']['focus_before'] = bool(enabled)
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['focus_before'] = bool(enabled)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManualAutoAttackFocusAfter(self, delay_s: float) -> None:
         self._ensureManualAutoAttackConfig()
@@ -1174,7 +1246,7 @@ class Context:
         self.context['manual_auto_attack']['focus_after_s'] = v
         self.enabledProfile['config'].setdefault('manual_auto_attack', {})
         self.enabledProfile['config']['manual_auto_attack']['focus_after_s'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAttackFromBattlelist(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1182,7 +1254,7 @@ class Context:
         self.context['ng_runtime']['attack_from_battlelist'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['attack_from_battlelist'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeTargetingDiag(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1190,7 +1262,7 @@ class Context:
         self.context['ng_runtime']['targeting_diag'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['targeting_diag'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeWindowDiag(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1198,7 +1270,7 @@ class Context:
         self.context['ng_runtime']['window_diag'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['window_diag'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeDumpTaskOnTimeout(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1206,7 +1278,7 @@ class Context:
         self.context['ng_runtime']['dump_task_on_timeout'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['dump_task_on_timeout'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeStatusLogInterval(self, interval_s: float) -> None:
         self._ensureNgRuntimeConfig()
@@ -1221,7 +1293,7 @@ class Context:
         self.context['ng_runtime']['status_log_interval_s'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['status_log_interval_s'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeLootModifier(self, modifier: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1233,7 +1305,7 @@ class Context:
         self.context['ng_runtime']['loot_modifier'] = mod
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['loot_modifier'] = mod
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAttackOnly(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1241,7 +1313,7 @@ class Context:
         self.context['ng_runtime']['attack_only'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['attack_only'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAllowAttackWithoutCoord(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1249,7 +1321,7 @@ class Context:
         self.context['ng_runtime']['allow_attack_without_coord'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['allow_attack_without_coord'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeWarnOnWindowMiss(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1257,7 +1329,7 @@ class Context:
         self.context['ng_runtime']['warn_on_window_miss'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['warn_on_window_miss'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeActionWindowTitle(self, title: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1265,7 +1337,7 @@ class Context:
         self.context['ng_runtime']['action_window_title'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['action_window_title'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeCaptureWindowTitle(self, title: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1273,7 +1345,7 @@ class Context:
         self.context['ng_runtime']['capture_window_title'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['capture_window_title'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeDepotOpenButton(self, button: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1283,7 +1355,7 @@ class Context:
         self.context['ng_runtime']['depot_open_button'] = btn
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['depot_open_button'] = btn
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAttackHotkey(self, hotkey: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1293,7 +1365,7 @@ class Context:
         self.context['ng_runtime']['attack_hotkey'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['attack_hotkey'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAttackClickButton(self, button: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1303,7 +1375,7 @@ class Context:
         self.context['ng_runtime']['attack_click_button'] = btn
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['attack_click_button'] = btn
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAttackSafeClickModifier(self, modifier: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1315,7 +1387,7 @@ class Context:
         self.context['ng_runtime']['attack_safe_click_modifier'] = mod
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['attack_safe_click_modifier'] = mod
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeBattlelistAttackClickModifier(self, modifier: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1327,7 +1399,7 @@ class Context:
         self.context['ng_runtime']['battlelist_attack_click_modifier'] = mod
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['battlelist_attack_click_modifier'] = mod
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeBattlelistAttackClickButton(self, button: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1337,7 +1409,7 @@ class Context:
         self.context['ng_runtime']['battlelist_attack_click_button'] = btn
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['battlelist_attack_click_button'] = btn
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeBattlelistClickAtCursor(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1345,7 +1417,7 @@ class Context:
         self.context['ng_runtime']['battlelist_click_at_cursor'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['battlelist_click_at_cursor'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeBlockRightClickAttack(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1353,7 +1425,7 @@ class Context:
         self.context['ng_runtime']['block_right_click_attack'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['block_right_click_attack'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeAttackClickPreDelay(self, delay_s: float) -> None:
         self._ensureNgRuntimeConfig()
@@ -1368,7 +1440,7 @@ class Context:
         self.context['ng_runtime']['attack_click_pre_delay_s'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['attack_click_pre_delay_s'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeInputDiag(self, enabled: bool) -> None:
         self._ensureNgRuntimeConfig()
@@ -1376,7 +1448,7 @@ class Context:
         self.context['ng_runtime']['input_diag'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['input_diag'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_mouse(input_diag=v)
         except Exception:
@@ -1388,7 +1460,7 @@ class Context:
         self.context['ng_runtime']['safe_log'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['safe_log'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_safe_log(enabled=v)
         except Exception:
@@ -1400,7 +1472,7 @@ class Context:
         self.context['ng_runtime']['console_log'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['console_log'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_console_log(enabled=v)
         except Exception:
@@ -1414,7 +1486,7 @@ class Context:
         self.context['ng_runtime']['log_level'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['log_level'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_console_log(level=v)
         except Exception:
@@ -1431,7 +1503,7 @@ class Context:
         self.context['ng_runtime']['output_idx'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['output_idx'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             setScreenshotOutputIdx(v)
         except Exception:
@@ -1443,7 +1515,7 @@ class Context:
         self.context['ng_runtime']['auto_output_idx'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['auto_output_idx'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setRuntimeArduinoPort(self, port: str) -> None:
         self._ensureNgRuntimeConfig()
@@ -1451,7 +1523,7 @@ class Context:
         self.context['ng_runtime']['arduino_port'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['arduino_port'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_arduino(port=v)
         except Exception:
@@ -1463,7 +1535,7 @@ class Context:
         self.context['ng_runtime']['disable_arduino'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['disable_arduino'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_arduino(disable_arduino=v)
         except Exception:
@@ -1475,7 +1547,7 @@ class Context:
         self.context['ng_runtime']['disable_arduino_clicks'] = v
         self.enabledProfile['config'].setdefault('ng_runtime', {})
         self.enabledProfile['config']['ng_runtime']['disable_arduino_clicks'] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         try:
             configure_arduino(disable_clicks=v)
         except Exception:
@@ -1507,148 +1579,148 @@ class Context:
         if not isinstance(self.enabledProfile['config']['ng_runtime'].get('task_timeouts'), dict):
             self.enabledProfile['config']['ng_runtime']['task_timeouts'] = {}
         self.enabledProfile['config']['ng_runtime']['task_timeouts'][key] = v
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHotkeyHealingHighPriorityByKey(self, key: str, hotkey: str) -> None:
         self.context['healing']['highPriority'][key]['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['highPriority'][key]['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHealthFoodHpPercentageLessThanOrEqual(self, hpPercentageLessThanOrEqual: int) -> None:
         self.context['healing']['highPriority']['healthFood']['hpPercentageLessThanOrEqual'] = hpPercentageLessThanOrEqual
         self.enabledProfile['config']['healing']['highPriority']['healthFood'][
             'hpPercentageLessThanOrEqual'] = hpPercentageLessThanOrEqual
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setManaFoodHpPercentageLessThanOrEqual(self, manaPercentageLessThanOrEqual: int) -> None:
         self.context['healing']['highPriority']['manaFood']['manaPercentageLessThanOrEqual'] = manaPercentageLessThanOrEqual
         self.enabledProfile['config']['healing']['highPriority']['manaFood'][
             'manaPercentageLessThanOrEqual'] = manaPercentageLessThanOrEqual
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleSpellByKey(self, healthPotionType: str, enabled: bool) -> None:
         self.context['healing']['spells'][healthPotionType]['enabled'] = enabled
         self.enabledProfile['config']['healing']['spells'][healthPotionType]['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setFoodHotkey(self, hotkey: str) -> None:
         self.context['healing']['eatFood']['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['eatFood']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHealthPotionHotkeyByKey(self, healthPotionType: str, hotkey: str) -> None:
         self.context['healing']['potions'][healthPotionType]['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['potions'][healthPotionType]['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHealthPotionSlotByKey(self, healthPotionType: str, slot: int) -> None:
         self.context['healing']['potions'][healthPotionType]['slot'] = slot
         self.enabledProfile['config']['healing']['potions'][healthPotionType]['slot'] = slot
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSpellHotkeyByKey(self, healthPotionType: str, hotkey: str) -> None:
         self.context['healing']['spells'][healthPotionType]['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['spells'][healthPotionType]['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHealthPotionHpPercentageLessThanOrEqual(self, healthPotionType: str, hpPercentage: int) -> None:
         self.context['healing']['potions'][healthPotionType]['hpPercentageLessThanOrEqual'] = hpPercentage
         self.enabledProfile['config']['healing']['potions'][healthPotionType]['hpPercentageLessThanOrEqual'] = hpPercentage
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapRingHpPercentageLessThanOrEqual(self, hpPercentageLessThanOrEqual: int) -> None:
         self.context['healing']['highPriority']['swapRing']['tankRing']['hpPercentageLessThanOrEqual'] = hpPercentageLessThanOrEqual
         self.enabledProfile['config']['healing']['highPriority']['swapRing']['tankRing'][
             'hpPercentageLessThanOrEqual'] = hpPercentageLessThanOrEqual
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapTankRingHotkey(self, hotkey: str) -> None:
         self.context['healing']['highPriority']['swapRing']['tankRing']['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['highPriority']['swapRing']['tankRing']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapTankRingSlotByKey(self, slot: int) -> None:
         self.context['healing']['highPriority']['swapRing']['tankRing']['slot'] = slot
         self.enabledProfile['config']['healing']['highPriority']['swapRing']['tankRing']['slot'] = slot
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapMainRingSlotByKey(self, slot: int) -> None:
         self.context['healing']['highPriority']['swapRing']['mainRing']['slot'] = slot
         self.enabledProfile['config']['healing']['highPriority']['swapRing']['mainRing']['slot'] = slot
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapMainRingHotkey(self, hotkey: str) -> None:
         self.context['healing']['highPriority']['swapRing']['mainRing']['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['highPriority']['swapRing']['mainRing']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapRingHpPercentageGreaterThan(self, hpPercentageGreaterThan: int) -> None:
         self.context['healing']['highPriority']['swapRing']['mainRing']['hpPercentageGreaterThan'] = hpPercentageGreaterThan
         self.enabledProfile['config']['healing']['highPriority']['swapRing']['mainRing'][
             'hpPercentageGreaterThan'] = hpPercentageGreaterThan
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapAmuletHpPercentageLessThanOrEqual(self, hpPercentageLessThanOrEqual: int) -> None:
         self.context['healing']['highPriority']['swapAmulet']['tankAmulet']['hpPercentageLessThanOrEqual'] = hpPercentageLessThanOrEqual
         self.enabledProfile['config']['healing']['highPriority']['swapAmulet']['tankAmulet'][
             'hpPercentageLessThanOrEqual'] = hpPercentageLessThanOrEqual
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapAmuletHpPercentageGreaterThan(self, hpPercentageGreaterThan: int) -> None:
         self.context['healing']['highPriority']['swapAmulet']['mainAmulet']['hpPercentageGreaterThan'] = hpPercentageGreaterThan
         self.enabledProfile['config']['healing']['highPriority']['swapAmulet']['mainAmulet'][
             'hpPercentageGreaterThan'] = hpPercentageGreaterThan
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapTankAmuletHotkey(self, hotkey: str) -> None:
         self.context['healing']['highPriority']['swapAmulet']['tankAmulet']['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['highPriority']['swapAmulet']['tankAmulet']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapMainAmuletHotkey(self, hotkey: str) -> None:
         self.context['healing']['highPriority']['swapAmulet']['mainAmulet']['hotkey'] = hotkey
         self.enabledProfile['config']['healing']['highPriority']['swapAmulet']['mainAmulet']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapTankAmuletSlotByKey(self, slot: int) -> None:
         self.context['healing']['highPriority']['swapAmulet']['tankAmulet']['slot'] = slot
         self.enabledProfile['config']['healing']['highPriority']['swapAmulet']['tankAmulet']['slot'] = slot
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSwapMainAmuletSlotByKey(self, slot: int) -> None:
         self.context['healing']['highPriority']['swapAmulet']['mainAmulet']['slot'] = slot
         self.enabledProfile['config']['healing']['highPriority']['swapAmulet']['mainAmulet']['slot'] = slot
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSpellHpPercentageLessThanOrEqual(self, spellType: str, hpPercentage: int) -> None:
         self.context['healing']['spells'][spellType]['hpPercentageLessThanOrEqual'] = hpPercentage
         self.enabledProfile['config']['healing']['spells'][spellType]['hpPercentageLessThanOrEqual'] = hpPercentage
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSpellManaPercentageGreaterThanOrEqual(self, spellType: str, hpPercentage: int) -> None:
         self.context['healing']['spells'][spellType]['manaPercentageGreaterThanOrEqual'] = hpPercentage
         self.enabledProfile['config']['healing']['spells'][spellType]['manaPercentageGreaterThanOrEqual'] = hpPercentage
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setSpellName(self, spellType: str, spell: Optional[str]) -> None:
         self.context['healing']['spells'][spellType]['spell'] = spell
         self.enabledProfile['config']['healing']['spells'][spellType]['spell'] = spell
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHealthPotionManaPercentageGreaterThanOrEqual(self, healthPotionType: str, hpPercentage: int) -> None:
         self.context['healing']['potions'][healthPotionType]['manaPercentageGreaterThanOrEqual'] = hpPercentage
         self.enabledProfile['config']['healing']['potions'][healthPotionType]['manaPercentageGreaterThanOrEqual'] = hpPercentage
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setHealthPotionManaPercentageLessThanOrEqual(self, healthPotionType: str, hpPercentage: int) -> None:
         self.context['healing']['potions'][healthPotionType]['manaPercentageLessThanOrEqual'] = hpPercentage
         self.enabledProfile['config']['healing']['potions'][healthPotionType]['manaPercentageLessThanOrEqual'] = hpPercentage
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleCavebot(self, enabled: bool) -> None:
         self.context['ng_cave']['enabled'] = enabled
         self.enabledProfile['config']['ng_cave']['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
         log('info', f"Cavebot enabled={enabled}")
         if enabled and self.context.get('ng_pause'):
             self.play()
@@ -1656,95 +1728,95 @@ class Context:
     def toggleRunToCreatures(self, enabled: bool) -> None:
         self.context['ng_cave']['runToCreatures'] = enabled
         self.enabledProfile['config']['ng_cave']['runToCreatures'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleComboSpells(self, enabled: bool) -> None:
         self.context['ng_comboSpells']['enabled'] = enabled
         self.enabledProfile['config']['ng_comboSpells']['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleSingleCombo(self, enabled: bool, index: int) -> None:
         self.context['ng_comboSpells']['items'][index]['enabled'] = enabled
         self.enabledProfile['config']['ng_comboSpells']['items'][index]['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def removeSpellByIndex(self, index: int, indexTable: int) -> None:
         self.context['ng_comboSpells']['items'][index]['spells'].pop(indexTable)
         # self.enabledProfile['config']['ng_comboSpells']['items'][index]['spells'].pop(
         #     index)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def changeComboName(self, name: str, index: int) -> None:
         self.context['ng_comboSpells']['items'][index]['name'] = name
         self.enabledProfile['config']['ng_comboSpells']['items'][index]['name'] = name
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setCompare(self, compare: str, index: int) -> None:
         self.context['ng_comboSpells']['items'][index]['creatures']['compare'] = compare
         self.enabledProfile['config']['ng_comboSpells']['items'][index]['creatures']['compare'] = compare
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def changeCompareValue(self, value: str, index: int) -> None:
         if not value:
             return
         self.context['ng_comboSpells']['items'][index]['creatures']['value'] = int(value)
         self.enabledProfile['config']['ng_comboSpells']['items'][index]['creatures']['value'] = int(value)
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setComboSpellName(self, name: str, index: int, indexSecond: int) -> None:
         self.context['ng_comboSpells']['items'][index]['spells'][indexSecond]['name'] = name
         self.enabledProfile['config']['ng_comboSpells']['items'][index]['spells'][indexSecond]['name'] = name
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setComboSpellHotkey(self, key: str, index: int, indexSecond: int) -> None:
         self.context['ng_comboSpells']['items'][index]['spells'][indexSecond]['hotkey'] = key
         self.enabledProfile['config']['ng_comboSpells']['items'][index]['spells'][indexSecond]['hotkey'] = key
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleAutoHur(self, enabled: bool) -> None:
         self.context['auto_hur']['enabled'] = enabled
         self.enabledProfile['config']['auto_hur']['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleAutoHurPz(self, enabled: bool) -> None:
         self.context['auto_hur']['pz'] = enabled
         self.enabledProfile['config']['auto_hur']['pz'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setAutoHurHotkey(self, hotkey: str) -> None:
         self.context['auto_hur']['hotkey'] = hotkey
         self.enabledProfile['config']['auto_hur']['hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setAutoHurSpell(self, spell: str) -> None:
         self.context['auto_hur']['spell'] = spell
         self.enabledProfile['config']['auto_hur']['spell'] = spell
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleAlert(self, enabled: bool) -> None:
         self.context['alert']['enabled'] = enabled
         self.enabledProfile['config']['alert']['enabled'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleAlertCave(self, enabled: bool) -> None:
         self.context['alert']['cave'] = enabled
         self.enabledProfile['config']['alert']['cave'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleAlertSayPlayer(self, enabled: bool) -> None:
         self.context['alert']['sayPlayer'] = enabled
         self.enabledProfile['config']['alert']['sayPlayer'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleClearStatsPoison(self, enabled: bool) -> None:
         self.context['clear_stats']['poison'] = enabled
         self.enabledProfile['config']['clear_stats']['poison'] = enabled
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def setClearStatsPoisonHotkey(self, hotkey: str) -> None:
         self.context['clear_stats']['poison_hotkey'] = hotkey
         self.enabledProfile['config']['clear_stats']['poison_hotkey'] = hotkey
-        self.db.update(self.enabledProfile)
+        self.saveProfile()
 
     def toggleManaPotionsByKey(self, manaPotionType: str, enabled: bool) -> None:
         self.context['healing']['potions'][manaPotionType]['enabled'] = enabled
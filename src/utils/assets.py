@@ -0,0 +1,202 @@
+import glob
+import json
+import os
+import pathlib
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.runtime_settings import get_bool
+
+
+# Startup bundle of the grayscale templates.
+#
+# Every repository config decodes its PNGs at import: more than 2800 files,
+# most of them the creature names of src.wiki.creatures for the battle list
+# and the game window. The bundle keeps them all decoded in one raw .npy,
+# memory-mapped copy-on-write, next to a JSON index with the offset, shape
+# and source size/mtime of every image. loadFromRGBToGray serves images from
+# it and only decodes a PNG that is missing from the bundle or changed since;
+# rebuildAssetsBundleIfStale then writes a new bundle. Only templates under
+# src/ are bundled (not screenshots loaded by scripts or tests).
+#
+# Built by builders/repositories/buildAssetsBundle.py, or by the first run
+# of the bot (main scripts call rebuildAssetsBundleIfStale).
+
+rootPath = pathlib.Path(__file__).resolve().parents[2]
+assetsBundleVersion = 1
+assetsBundlePath = f'{rootPath}/src/repositories/npys/assets.v{assetsBundleVersion}'
+# Radar floors are bundled by floorsMaps.
+excludedAssets = ('src/repositories/radar/images/floor-', 'src/repositories/radar/images/paths/')
+
+# (size, mtime_ns) of the source PNG.
+SourceStamp = Tuple[int, int]
+
+_assets: Dict[str, Any] = {
+    'enabled': get_bool({}, 'assets_bundle', env_var='FENRIL_ASSETS_BUNDLE', default=True),
+    'bundle': None,
+    'loaded': False,
+    # Images decoded from PNG in this process: key -> (image, stamp).
+    'decoded': {},
+}
+
+
+def getAssetsBundleIndexFile(path: str = assetsBundlePath) -> str:
+    return f'{path}.index.json'
+
+
+def getAssetKey(path: str) -> Optional[str]:
+    """Bundle key of an image path: relative to the repo root, None when it is not a template under src/."""
+    try:
+        key = os.path.relpath(os.path.abspath(path), rootPath)
+    except ValueError:
+        return None
+    key = os.path.normcase(key).replace(os.sep, '/')
+    if not key.startswith('src/') or key.startswith(excludedAssets):
+        return None
+    return key
+
+
+def getSourceStamp(path: str) -> SourceStamp:
+    stat = os.stat(path)
+    return (int(stat.st_size), int(stat.st_mtime_ns))
+
+
+class AssetsBundle:
+    def __init__(self, index: Dict[str, List[int]], data: np.ndarray, dataFile: str) -> None:
+        self.index = index
+        self.data = data
+        self.dataFile = dataFile
+
+    def getImage(self, key: str, stamp: SourceStamp) -> Optional[np.ndarray]:
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, height, width, size, mtime = entry
+        if (size, mtime) != stamp:
+            return None
+        return self.data[offset:offset + height * width].reshape(height, width).view(np.ndarray)
+
+
+def loadAssetsBundle(path: str = assetsBundlePath) -> Optional[AssetsBundle]:
+    try:
+        with open(getAssetsBundleIndexFile(path), encoding='utf-8') as file:
+            index = json.load(file)
+        if index.get('version') != assetsBundleVersion:
+            return None
+        dataFile = str(pathlib.Path(path).parent / index['data'])
+        # Copy-on-write: callers get writable arrays, like decoded PNGs.
+        data = np.load(dataFile, mmap_mode='c')
+        if data.dtype != np.uint8 or data.ndim != 1:
+            return None
+        return AssetsBundle(index['images'], data, dataFile)
+    except Exception:
+        return None
+
+
+def buildAssetsBundle(images: Dict[str, Tuple[np.ndarray, SourceStamp]], path: str = assetsBundlePath) -> str:
+    """Write `images` (key -> (gray image, source stamp)) as a new bundle and return its data file."""
+    parent = pathlib.Path(path).parent
+    parent.mkdir(parents=True, exist_ok=True)
+    index: Dict[str, List[int]] = {}
+    offset = 0
+    for key, (image, (size, mtime)) in sorted(images.items()):
+        height, width = image.shape[:2]
+        index[key] = [offset, int(height), int(width), size, mtime]
+        offset += int(height) * int(width)
+    data = np.empty(offset, dtype=np.uint8)
+    for key, (image, _) in images.items():
+        start, height, width = index[key][:3]
+        data[start:start + height * width] = np.ascontiguousarray(image, dtype=np.uint8).ravel()
+    # A new data file per build: the previous one may still be mapped (Windows
+    # cannot replace it) and readers of the old index keep working.
+    dataName = f'{pathlib.Path(path).name}.{time.time_ns()}.data.npy'
+    np.save(str(parent / dataName), data)
+    indexFile = getAssetsBundleIndexFile(path)
+    with open(f'{indexFile}.tmp', 'w', encoding='utf-8') as file:
+        json.dump({'version': assetsBundleVersion, 'data': dataName, 'images': index}, file)
+    pathlib.Path(f'{indexFile}.tmp').replace(indexFile)
+    for oldDataFile in glob.glob(f'{path}.*.data.npy'):
+        if pathlib.Path(oldDataFile).name != dataName:
+            try:
+                os.remove(oldDataFile)
+            except OSError:
+                pass
+    return str(parent / dataName)
+
+
+def getBundle() -> Optional[AssetsBundle]:
+    if not _assets['loaded']:
+        _assets['loaded'] = True
+        _assets['bundle'] = loadAssetsBundle()
+    return _assets['bundle']
+
+
+def getBundledImage(path: str) -> Optional[np.ndarray]:
+    if not _assets['enabled']:
+        return None
+    key = getAssetKey(path)
+    if key is None:
+        return None
+    bundle = getBundle()
+    if bundle is None:
+        return None
+    try:
+        return bundle.getImage(key, getSourceStamp(path))
+    except OSError:
+        return None
+
+
+def recordDecodedImage(path: str, image: np.ndarray) -> None:
+    if not _assets['enabled']:
+        return
+    key = getAssetKey(path)
+    if key is None:
+        return
+    try:
+        _assets['decoded'][key] = (image, getSourceStamp(path))
+    except OSError:
+        pass
+
+
+def isAssetsBundleStale() -> bool:
+    return bool(_assets['decoded'])
+
+
+def rebuildAssetsBundleIfStale(path: str = assetsBundlePath) -> bool:
+    """Write a new bundle when this process had to decode PNGs.
+
+    Keeps the entries of the current bundle whose sources did not change,
+    so a run that did not import every repository does not drop the rest.
+    """
+    if not _assets['enabled'] or not isAssetsBundleStale():
+        return False
+    images: Dict[str, Tuple[np.ndarray, SourceStamp]] = {}
+    bundle = getBundle()
+    if bundle is not None:
+        for key, entry in bundle.index.items():
+            try:
+                stamp = getSourceStamp(str(rootPath / key))
+            except OSError:
+                continue
+            image = bundle.getImage(key, stamp)
+            if image is not None:
+                images[key] = (image, stamp)
+    images.update(_assets['decoded'])
+    try:
+        buildAssetsBundle(images, path)
+    except OSError:
+        # Read-only install or disk full: keep decoding on startup.
+        return False
+    _assets['decoded'] = {}
+    _assets['loaded'] = False
+    _assets['bundle'] = None
+    return True
+
+
+def getTemplatesPaths(patterns: Iterable[str] = ('src/**/*.png',)) -> List[str]:
+    paths = []
+    for pattern in patterns:
+        paths.extend(glob.glob(str(rootPath / pattern), recursive=True))
+    return sorted(path for path in paths if getAssetKey(path) is not None)
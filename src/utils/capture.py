@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+class LatestFrameRing:
+    """Pre-allocated ring of gray frames with a single writer and a few readers.
+
+    The writer copies each frame into a free slot and then publishes
+    `(seq, slot)` with one attribute assignment, which is atomic under the GIL,
+    so reading the latest frame never takes a lock. The slot handed to a
+    reader is never written again until that reader asks for a newer frame.
+    """
+
+    def __init__(self, size: int = 3, readers: int = 1) -> None:
+        self.size = max(3, int(size), int(readers) + 2)
+        self._buffers: List[Optional[np.ndarray]] = [None] * self.size
+        self._published: Tuple[int, int] = (0, -1)
+        self._readerSlots = [-1] * max(1, int(readers))
+
+    def publish(self, frame: np.ndarray) -> int:
+        seq, latestSlot = self._published
+        readerSlots = self._readerSlots
+        slot = (latestSlot + 1) % self.size
+        while slot == latestSlot or slot in readerSlots:
+            slot = (slot + 1) % self.size
+        buffer = self._buffers[slot]
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty_like(frame)
+            self._buffers[slot] = buffer
+        np.copyto(buffer, frame)
+        self._published = (seq + 1, slot)
+        return seq + 1
+
+    def getSeq(self) -> int:
+        return self._published[0]
+
+    def latest(self, reader: int = 0) -> Tuple[int, Optional[np.ndarray]]:
+        while True:
+            published = self._published
+            seq, slot = published
+            if slot < 0:
+                return seq, None
+            self._readerSlots[reader] = slot
+            # Still the latest once marked as held: the writer will not pick it.
+            if self._published is published:
+                return seq, self._buffers[slot]
+
+
+class CaptureThread(threading.Thread):
+    """Capture producer: grabs frames in the background into a LatestFrameRing."""
+
+    def __init__(self, grab: Callable[[], Optional[np.ndarray]], ringSize: int = 3, minInterval: float = 0.0, readers: int = 1) -> None:
+        super().__init__(name='fenril-capture', daemon=True)
+        self.grab = grab
+        self.ring = LatestFrameRing(ringSize, readers=readers)
+        self.minInterval = float(minInterval)
+        self.lastError: Optional[str] = None
+        self._stopEvent = threading.Event()
+        self._frameEvent = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopEvent.is_set():
+            startedAt = time.perf_counter()
+            try:
+                frame = self.grab()
+            except Exception as e:
+                frame = None
+                self.lastError = str(e)
+            if frame is not None:
+                self.ring.publish(frame)
+                self._frameEvent.set()
+            elapsed = time.perf_counter() - startedAt
+            # Always yield a little so a failing grab does not spin a core.
+            self._stopEvent.wait(max(self.minInterval - elapsed, 0.001 if frame is not None else 0.01))
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        self._stopEvent.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def waitForFrame(self, afterSeq: int, timeout: float, reader: int = 0) -> Tuple[int, Optional[np.ndarray]]:
+        """Return the latest frame, waiting up to timeout for one newer than afterSeq."""
+        deadline = time.perf_counter() + max(0.0, float(timeout))
+        while self.ring.getSeq() <= afterSeq:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            self._frameEvent.clear()
+            if self.ring.getSeq() > afterSeq:
+                break
+            self._frameEvent.wait(remaining)
+        return self.ring.latest(reader)
@@ -45,10 +45,16 @@ def log(level: str, msg: str) -> None:
     print(f"[{ts}][fenril][{lvl}] {msg}")
 
 
-def log_throttled(key: str, level: str, msg: str, interval_s: float) -> None:
+def is_log_due(key: str, interval_s: float) -> bool:
+    """True at most once per `interval_s` for `key`: lets callers build costly messages only when they print."""
     now = time.time()
     last = _last_by_key.get(key)
     if last is not None and (now - last) < interval_s:
-        return
+        return False
     _last_by_key[key] = now
-    log(level, msg)
+    return True
+
+
+def log_throttled(key: str, level: str, msg: str, interval_s: float) -> None:
+    if is_log_due(key, interval_s):
+        log(level, msg)
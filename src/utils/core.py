@@ -1,12 +1,19 @@
 import cv2
 import dxcam
+import functools
 import numpy as np
 import hashlib
 import os
+import threading
 import time
 import base64
+import binascii
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
 from src.shared.typings import BBox, GrayImage
+from src.utils.capture import CaptureThread
+from src.utils.obsws import ObsRequestError, ObsScreenshotClient
+from src.utils.layout import getCurrentFrameSeq, recordAnchorStatus, registerAnchor
 
 
 def _get_windows_monitors() -> Optional[List[Tuple[int, int, int, int]]]:
@@ -142,8 +149,7 @@ def _probe_dxcam_for_region(
             if shot is None:
                 continue
             try:
-                full = cv2.cvtColor(shot, cv2.COLOR_BGRA2GRAY)
-                frame = _crop_gray_frame(cast(GrayImage, full), region)
+                frame = _crop_to_gray(shot, region)
                 if not _frame_is_hard_black(cast(np.ndarray, frame)):
                     return int(dev), int(out), cam
             except Exception:
@@ -271,7 +277,17 @@ _CAPTURE_CFG: Dict[str, Any] = {
     'dxcam_autoprobe_on_black': _env_bool('FENRIL_DXCAM_AUTOPROBE_ON_BLACK', True),
     # OBS fallback
     'obs_fallback_on_black': _env_bool('FENRIL_OBS_FALLBACK_ON_BLACK', True),
+    # OBS transport: 'bmp' skips the PNG encode in OBS and the PNG decode here
+    # (falls back to 'png' if OBS rejects it). The fast transport is our own
+    # screenshot client; off, requests go through obsws_python's ReqClient.
+    'obs_image_format': _env_str('FENRIL_OBS_IMAGE_FORMAT', 'bmp').strip().lower(),
+    'obs_fast_transport': _env_bool('FENRIL_OBS_FAST_TRANSPORT', True),
     'log_dxcam_recovery': _env_bool('FENRIL_LOG_DXCAM_RECOVERY', True),
+    # Pipelined capture: a producer thread grabs frames while the pilot analyzes
+    # the previous one; the pilot only picks up the latest ready frame.
+    'pipelined': _env_bool('FENRIL_CAPTURE_PIPELINED', False),
+    'pipelined_ring_size': _env_int('FENRIL_CAPTURE_RING_SIZE', 3),
+    'pipelined_wait_s': _env_float('FENRIL_CAPTURE_PIPELINED_WAIT_S', 0.05),
 }
 
 
@@ -292,6 +308,26 @@ def _get_obs_client() -> Optional[Any]:
     global _obs_client, _last_obs_error, _last_obs_error_time
     if _obs_client is not None:
         return _obs_client
+    host = _env_str('FENRIL_OBS_HOST', '127.0.0.1')
+    port = int(os.getenv('FENRIL_OBS_PORT', '4455'))
+    password = os.getenv('FENRIL_OBS_PASSWORD', '')
+    if bool(_CAPTURE_CFG.get('obs_fast_transport', True)):
+        try:
+            import websocket  # noqa: F401
+        except Exception as e:
+            _last_obs_error = f"websocket-client import failed: {e}"
+            _last_obs_error_time = time.time()
+            return None
+        try:
+            client = ObsScreenshotClient(host=host, port=port, password=password,
+                                         timeout=_env_float('FENRIL_OBS_TIMEOUT_SECONDS', 5.0))
+            client.connect()
+            _obs_client = client
+            return _obs_client
+        except Exception as e:
+            _last_obs_error = f"OBS connect failed ({host}:{port}): {e}"
+            _last_obs_error_time = time.time()
+            return None
     try:
         from obsws_python import ReqClient
     except Exception as e:
@@ -299,9 +335,6 @@ def _get_obs_client() -> Optional[Any]:
         _last_obs_error_time = time.time()
         return None
 
-    host = _env_str('FENRIL_OBS_HOST', '127.0.0.1')
-    port = int(os.getenv('FENRIL_OBS_PORT', '4455'))
-    password = os.getenv('FENRIL_OBS_PASSWORD', '')
     try:
         _obs_client = ReqClient(host=host, port=port, password=password)
         return _obs_client
@@ -312,6 +345,42 @@ def _get_obs_client() -> Optional[Any]:
         return None
 
 
+def _request_obs_image(client: Any, payload: Dict[str, Any]) -> Optional[bytes]:
+    """Return the encoded image bytes of a GetSourceScreenshot request."""
+    if isinstance(client, ObsScreenshotClient):
+        return client.getSourceScreenshot(payload)
+    resp = client.send('GetSourceScreenshot', payload, raw=True)
+    if not isinstance(resp, dict):
+        return None
+    b64 = resp.get('imageData')
+    if not b64 or not isinstance(b64, str):
+        return None
+    # Response may include a data URI prefix
+    if b64.startswith('data:'):
+        b64 = b64[b64.index(',', 0, 64) + 1:]
+    return binascii.a2b_base64(b64)
+
+
+def _is_obs_request_error(e: Exception) -> bool:
+    return isinstance(e, ObsRequestError) or type(e).__name__ == 'OBSSDKRequestError'
+
+
+def _decode_obs_image(raw: bytes) -> Optional[GrayImage]:
+    img = cv2.imdecode(np.frombuffer(raw, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    # Validate minimum dimensions (avoid 1x1 corrupt frames)
+    if img is None or img.size == 0 or img.shape[0] < 100 or img.shape[1] < 100:
+        return None
+    if len(img.shape) == 2:
+        # Already grayscale
+        return cast(GrayImage, img)
+    if img.shape[2] == 4:
+        # BGRA -> Gray (BMP and PNG screenshots of sources with alpha)
+        return cast(GrayImage, cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY))
+    if img.shape[2] == 3:
+        return cast(GrayImage, cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
+    return None
+
+
 def _grab_obs_source_gray() -> Optional[GrayImage]:
     """Grab a grayscale screenshot from OBS via WebSocket.
     
@@ -319,7 +388,7 @@ def _grab_obs_source_gray() -> Optional[GrayImage]:
     - Retry logic on failures
     - Timeout to prevent hangs
     - Cache of last valid frame
-    - Efficient image conversion
+    - Uncompressed (bmp) screenshots over a bytes-level client
     - Comprehensive validation
 
     Requires env:
@@ -330,12 +399,15 @@ def _grab_obs_source_gray() -> Optional[GrayImage]:
       - FENRIL_OBS_PASSWORD
       - FENRIL_OBS_WIDTH / FENRIL_OBS_HEIGHT (0 means native)
       - FENRIL_OBS_QUALITY (default -1)
+      - FENRIL_OBS_IMAGE_FORMAT (default bmp)
+      - FENRIL_OBS_FAST_TRANSPORT (default True)
       - FENRIL_OBS_MAX_RETRIES (default 2)
       - FENRIL_OBS_TIMEOUT_SECONDS (default 5.0)
       - FENRIL_OBS_CACHE_VALID_FRAME (default True)
     """
     global _last_obs_valid_frame, _obs_consecutive_failures, _obs_total_captures, _obs_total_failures
-    
+    global _last_obs_error, _last_obs_error_time
+
     source = _env_str('FENRIL_OBS_SOURCE', '').strip()
     if not source:
         return None
@@ -359,11 +431,12 @@ def _grab_obs_source_gray() -> Optional[GrayImage]:
     _obs_total_captures += 1
     
     for attempt in range(attempts):
+        image_format = str(_CAPTURE_CFG.get('obs_image_format', 'bmp') or 'png')
         try:
             # Use raw request to allow omitting width/height (native source resolution)
             payload: Dict[str, Any] = {
                 'sourceName': source,
-                'imageFormat': 'png',
+                'imageFormat': image_format,
                 'imageCompressionQuality': int(quality),
             }
             if int(width) >= 8:
@@ -371,90 +444,37 @@ def _grab_obs_source_gray() -> Optional[GrayImage]:
             if int(height) >= 8:
                 payload['imageHeight'] = int(height)
 
-            # Send request with timeout protection
-            resp = client.send('GetSourceScreenshot', payload, raw=True)
-            
-            # Validate response structure
-            if not isinstance(resp, dict):
-                if attempt < attempts - 1:
-                    continue
-                return _use_cached_frame(cache_enabled)
-            
-            b64 = resp.get('imageData')
-            if not b64 or not isinstance(b64, str):
-                if attempt < attempts - 1:
-                    continue
-                return _use_cached_frame(cache_enabled)
-            
-            if len(b64) < 100:  # PNG minimum viable size
+            raw = _request_obs_image(client, payload)
+            if raw is None or len(raw) < 100:  # PNG minimum viable size
                 if attempt < attempts - 1:
                     continue
                 return _use_cached_frame(cache_enabled)
 
-            # Response may include a data URI prefix
-            if ',' in b64 and b64.strip().lower().startswith('data:'):
-                b64 = b64.split(',', 1)[1]
-            
-            raw = base64.b64decode(b64)
-            if len(raw) < 100:
-                if attempt < attempts - 1:
-                    continue
-                return _use_cached_frame(cache_enabled)
-            
-            # Decode image efficiently
-            buf = np.frombuffer(raw, dtype=np.uint8)
-            img = cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
-            
-            if img is None or img.size == 0:
-                if attempt < attempts - 1:
-                    continue
-                return _use_cached_frame(cache_enabled)
-            
-            # Validate minimum dimensions (avoid 1x1 corrupt frames)
-            if img.shape[0] < 100 or img.shape[1] < 100:
-                if attempt < attempts - 1:
-                    continue
-                return _use_cached_frame(cache_enabled)
-            
-            # Convert to grayscale efficiently
-            gray_img: Optional[GrayImage] = None
-            
-            if len(img.shape) == 2:
-                # Already grayscale
-                gray_img = cast(GrayImage, img)
-            elif img.shape[2] == 4:
-                # BGRA -> Gray (most common for OBS)
-                gray_img = cast(GrayImage, cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY))
-            elif img.shape[2] == 3:
-                # BGR -> Gray
-                gray_img = cast(GrayImage, cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
-            else:
-                # Unexpected format
+            gray_img = _decode_obs_image(raw)
+            if gray_img is None:
                 if attempt < attempts - 1:
                     continue
                 return _use_cached_frame(cache_enabled)
-            
-            # Validate grayscale image
-            if gray_img is None or gray_img.size == 0:
-                if attempt < attempts - 1:
-                    continue
-                return _use_cached_frame(cache_enabled)
-            
+
             # SUCCESS: Cache valid frame and reset failure counter
             if cache_enabled:
                 _last_obs_valid_frame = gray_img.copy()
             _obs_consecutive_failures = 0
-            
+
             return gray_img
-            
+
         except Exception as e:
+            if image_format != 'png' and _is_obs_request_error(e):
+                # Older OBS builds may not encode this format.
+                _CAPTURE_CFG['obs_image_format'] = 'png'
+                _last_obs_error = f"OBS rejected imageFormat={image_format!r}, using png: {e}"
+                _last_obs_error_time = time.time()
             # Log only on last attempt to avoid spam
             if attempt == attempts - 1:
                 _obs_total_failures += 1
                 _obs_consecutive_failures += 1
                 # Suppress repeated error logs (max 1 per 10 seconds)
                 current_time = time.time()
-                global _last_obs_error, _last_obs_error_time
                 if current_time - _last_obs_error_time > 10.0:
                     _last_obs_error = f"OBS capture failed after {attempts} attempts: {e}"
                     _last_obs_error_time = current_time
@@ -494,6 +514,9 @@ def configure_capture(
     dxcam_autoprobe_on_black: Optional[bool] = None,
     obs_fallback_on_black: Optional[bool] = None,
     log_dxcam_recovery: Optional[bool] = None,
+    pipelined: Optional[bool] = None,
+    pipelined_ring_size: Optional[int] = None,
+    pipelined_wait_s: Optional[float] = None,
 ) -> None:
     # backend
     if 'backend' in _CAPTURE_CFG:
@@ -530,6 +553,85 @@ def configure_capture(
         _CAPTURE_CFG['obs_fallback_on_black'] = bool(obs_fallback_on_black)
     if log_dxcam_recovery is not None:
         _CAPTURE_CFG['log_dxcam_recovery'] = bool(log_dxcam_recovery)
+    if pipelined_ring_size is not None:
+        _CAPTURE_CFG['pipelined_ring_size'] = max(3, int(pipelined_ring_size))
+    if pipelined_wait_s is not None:
+        _CAPTURE_CFG['pipelined_wait_s'] = max(0.0, float(pipelined_wait_s))
+    if pipelined is not None:
+        _CAPTURE_CFG['pipelined'] = bool(pipelined)
+        if not _CAPTURE_CFG['pipelined']:
+            stopCaptureThread()
+
+
+# Serializes every use of the dxcam camera (grabs and camera switches).
+_cameraLock = threading.RLock()
+# (x, y, w, h) regions converted by region-of-interest grabs, None for full frames.
+_capture_roi: Optional[List[BBox]] = None
+_capture_thread: Optional[CaptureThread] = None
+_capture_regions: Tuple[Optional[Tuple[int, int, int, int]], Optional[Tuple[int, int, int, int]]] = (None, None)
+_capture_consumed_seq: int = 0
+# Ring readers of the capture thread: the pilot (0) and the healing loop (1).
+healingFrameReader = 1
+captureReaders = 2
+
+
+def _grab_for_capture_thread() -> Callable[[], Optional[GrayImage]]:
+    lastFrame: Optional[GrayImage] = None
+
+    def grab() -> Optional[GrayImage]:
+        nonlocal lastFrame
+        region, absolute_region = _capture_regions
+        frame = getScreenshot(region=region, absolute_region=absolute_region)
+        # getScreenshot hands back the previous frame when a grab fails; do not
+        # publish it again as a new frame.
+        if frame is None or frame is lastFrame:
+            return None
+        lastFrame = frame
+        return frame
+    return grab
+
+
+def stopCaptureThread() -> None:
+    global _capture_thread
+    thread = _capture_thread
+    _capture_thread = None
+    if thread is not None:
+        thread.stop()
+
+
+def getLatestScreenshot(
+    region: Optional[Tuple[int, int, int, int]] = None,
+    absolute_region: Optional[Tuple[int, int, int, int]] = None,
+) -> Tuple[int, Optional[GrayImage]]:
+    """Pipelined counterpart of getScreenshot: returns (seq, latest frame).
+
+    The capture producer thread is started lazily and always grabs with the
+    regions of the last call. Waits up to `pipelined_wait_s` for a frame newer
+    than the one returned previously (longer for the very first frame).
+    """
+    global _capture_thread, _capture_regions, _capture_consumed_seq
+    _capture_regions = (region, absolute_region)
+    if _capture_thread is None or not _capture_thread.is_alive():
+        _capture_thread = CaptureThread(
+            _grab_for_capture_thread(), ringSize=int(_CAPTURE_CFG.get('pipelined_ring_size', 3)), readers=captureReaders)
+        _capture_thread.start()
+        _capture_consumed_seq = 0
+    timeout = float(_CAPTURE_CFG.get('pipelined_wait_s', 0.05)) if _capture_consumed_seq > 0 else 1.0
+    seq, frame = _capture_thread.waitForFrame(_capture_consumed_seq, timeout)
+    _capture_consumed_seq = seq
+    return seq, frame
+
+
+def peekLatestScreenshot(reader: int, afterSeq: int = 0, timeout: float = 0.0) -> Tuple[int, Optional[GrayImage]]:
+    """Latest frame of the capture thread for a secondary ring reader.
+
+    Never starts the capture thread (the pilot owns the capture regions):
+    returns (0, None) while pipelined capture is not running.
+    """
+    thread = _capture_thread
+    if thread is None or not thread.is_alive():
+        return 0, None
+    return thread.waitForFrame(afterSeq, timeout, reader=reader)
 
 
 def get_capture_config() -> Dict[str, Any]:
@@ -589,31 +691,67 @@ def _crop_gray_frame(
         return frame
 
 
+def _crop_to_gray(
+    frame: np.ndarray,
+    region: Optional[Tuple[int, int, int, int]],
+) -> GrayImage:
+    """Crop a BGRA output frame to region, then convert only that crop to gray."""
+    return cast(GrayImage, cv2.cvtColor(_crop_gray_frame(cast(GrayImage, frame), region), cv2.COLOR_BGRA2GRAY))
+
+
+def _crop_roi_to_gray(
+    frame: np.ndarray,
+    region: Optional[Tuple[int, int, int, int]],
+    roi: Sequence[BBox],
+) -> GrayImage:
+    """Region-sized gray frame where only the roi bboxes are converted; the rest is black."""
+    crop = _crop_gray_frame(cast(GrayImage, frame), region)
+    gray = np.zeros(crop.shape[:2], dtype=np.uint8)
+    for x, y, w, h in roi:
+        if w > 0 and h > 0:
+            gray[y:y + h, x:x + w] = cv2.cvtColor(np.ascontiguousarray(crop[y:y + h, x:x + w]), cv2.COLOR_BGRA2GRAY)
+    return cast(GrayImage, gray)
+
+
+def _getRoiPixels(frame: GrayImage, roi: Sequence[BBox]) -> np.ndarray:
+    pixels = [frame[y:y + h, x:x + w].ravel() for x, y, w, h in roi]
+    pixels = [p for p in pixels if p.size]
+    return np.concatenate(pixels) if pixels else frame
+
+
+def setCaptureRoi(roi: Optional[Sequence[BBox]]) -> None:
+    """Convert only these (x, y, w, h) regions of the next dxcam grabs; None grabs full frames."""
+    global _capture_roi
+    _capture_roi = [(int(x), int(y), int(w), int(h)) for (x, y, w, h) in roi] if roi else None
+
+
 def setScreenshotOutputIdx(output_idx: int) -> None:
     global camera, _camera_output_idx
     idx = int(output_idx)
-    if idx == _camera_output_idx and camera is not None:
-        return
-    try:
-        camera = _create_camera(idx, device_idx=_camera_device_idx)
-        _camera_output_idx = idx
-    except Exception:
-        # Fall back to output 0 if dxcam reports fewer outputs than expected.
-        camera = _create_camera(0, device_idx=_camera_device_idx)
-        _camera_output_idx = 0
+    with _cameraLock:
+        if idx == _camera_output_idx and camera is not None:
+            return
+        try:
+            camera = _create_camera(idx, device_idx=_camera_device_idx)
+            _camera_output_idx = idx
+        except Exception:
+            # Fall back to output 0 if dxcam reports fewer outputs than expected.
+            camera = _create_camera(0, device_idx=_camera_device_idx)
+            _camera_output_idx = 0
 
 
 def setScreenshotDeviceIdx(device_idx: int) -> None:
     global camera, _camera_device_idx, _camera_output_idx
     dev = int(device_idx)
-    if dev == _camera_device_idx and camera is not None:
-        return
-    try:
-        camera = _create_camera(_camera_output_idx, device_idx=dev)
-        _camera_device_idx = dev
-    except Exception:
-        # Keep the previous device/output if switching fails.
-        return
+    with _cameraLock:
+        if dev == _camera_device_idx and camera is not None:
+            return
+        try:
+            camera = _create_camera(_camera_output_idx, device_idx=dev)
+            _camera_device_idx = dev
+        except Exception:
+            # Keep the previous device/output if switching fails.
+            return
 
 
 def _sanitize_region(
@@ -664,54 +802,102 @@ def _grab_mss(absolute_region: Tuple[int, int, int, int]) -> Optional[GrayImage]
 
 # TODO: add unit tests
 def cacheObjectPosition(func: Callable[[GrayImage], Optional[BBox]]) -> Callable[[GrayImage], Optional[BBox]]:
-    lastX = None
-    lastY = None
-    lastW = None
-    lastH = None
-    lastImgHash = None
+    # (bbox, hash of its pixels) of the last search, swapped in one assignment:
+    # the healing thread verifies the same anchors as the pilot.
+    lastPosition: Optional[Tuple[BBox, Any]] = None
+    # Per thread (seq, generation, bbox) of the frame in which the cached bbox
+    # was last verified (or searched); generation bumps on reset_cache.
+    lastFrame = threading.local()
+    generation = 0
+    anchorName = f'{getattr(func, "__module__", "")}.{getattr(func, "__name__", "anchor")}'
 
     def reset_cache() -> None:
-        nonlocal lastX, lastY, lastW, lastH, lastImgHash
-        lastX = None
-        lastY = None
-        lastW = None
-        lastH = None
-        lastImgHash = None
+        nonlocal lastPosition, generation
+        lastPosition = None
+        generation += 1
 
     def inner(screenshot: GrayImage) -> Optional[BBox]:
-        nonlocal lastX, lastY, lastW, lastH, lastImgHash
-        if lastX is not None and lastY is not None and lastW is not None and lastH is not None:
-            x = cast(int, lastX)
-            y = cast(int, lastY)
-            w = cast(int, lastW)
-            h = cast(int, lastH)
+        nonlocal lastPosition
+        # Same frame as the last call: the anchor was already verified (or
+        # searched) against this exact screenshot, skip the hash entirely.
+        seq = getCurrentFrameSeq(screenshot)
+        currentGeneration = generation
+        frame = getattr(lastFrame, 'value', None)
+        if seq is not None and frame is not None and frame[:2] == (seq, currentGeneration):
+            return frame[2]
+        position = lastPosition
+        if position is not None:
+            (x, y, w, h), imgHash = position
             # ERROR 8 FIXED: Validar que coordenadas están dentro del screenshot
             try:
                 if y + h <= screenshot.shape[0] and x + w <= screenshot.shape[1]:
-                    if hashit(screenshot[y:y + h, x:x + w]) == lastImgHash:
+                    if hashit(screenshot[y:y + h, x:x + w]) == imgHash:
+                        if seq is not None:
+                            lastFrame.value = (seq, currentGeneration, (x, y, w, h))
+                            recordAnchorStatus(anchorName, True, (x, y, w, h), seq)
                         return (x, y, w, h)
             except Exception:
                 # Cache inválido, buscar de nuevo
                 pass
         res = func(screenshot)
+        if seq is not None:
+            lastFrame.value = (seq, currentGeneration, res)
+            recordAnchorStatus(anchorName, False, res, seq)
         if res is None:
             return None
-        lastX = res[0]
-        lastY = res[1]
-        lastW = res[2]
-        lastH = res[3]
         # ERROR 8 FIXED: Proteger contra errores al calcular hash
         try:
-            lastImgHash = hashit(
-                screenshot[lastY:lastY + lastH, lastX:lastX + lastW])
+            lastPosition = (res, hashit(screenshot[res[1]:res[1] + res[3], res[0]:res[0] + res[2]]))
         except Exception:
-            lastImgHash = None
+            lastPosition = None
         return res
     # Attach a reset hook for recovery code (e.g., when radar tools can't be found).
     try:
         setattr(inner, 'reset_cache', reset_cache)
+        setattr(inner, 'anchor_name', anchorName)
     except Exception:
         pass
+    return registerAnchor(anchorName, inner)
+
+
+def cacheByFrame(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Memoize a pure `func(screenshot, *args)` reader for the current frame.
+
+    Results are kept per arguments until the screenshot middleware opens the
+    next frame, so several observers asking the same question in one tick pay
+    for it once. Screenshots that are not the current frame (crops, tests) and
+    unhashable arguments always call through. Each thread keeps its own
+    results (the healing loop may read the pilot's frame). Cached results are
+    shared between callers and must not be mutated.
+    """
+    frames = threading.local()
+    generation = 0
+    missing = object()
+
+    def reset_cache() -> None:
+        nonlocal generation
+        generation += 1
+
+    @functools.wraps(func)
+    def inner(screenshot: GrayImage, *args: Any, **kwargs: Any) -> Any:
+        seq = getCurrentFrameSeq(screenshot)
+        if seq is None:
+            return func(screenshot, *args, **kwargs)
+        frameKey = (seq, generation)
+        if getattr(frames, 'key', None) != frameKey:
+            frames.key = frameKey
+            frames.results = {}
+        results: Dict[Any, Any] = frames.results
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        try:
+            result = results.get(key, missing)
+        except TypeError:
+            return func(screenshot, *args, **kwargs)
+        if result is missing:
+            result = func(screenshot, *args, **kwargs)
+            results[key] = result
+        return result
+    setattr(inner, 'reset_cache', reset_cache)
     return inner
 
 
@@ -748,55 +934,124 @@ def locate(compareImage: GrayImage, img: GrayImage, confidence: float = 0.85, ty
     return res[3][0], res[3][1], len(img[0]), len(img)
 
 
-def locateMultiScale(
+# Resized templates by (id, shape, scale) and the last matched scale per
+# templates group, shared by every multi-scale search. Entries keep a
+# reference to the template, so its id cannot be reused while cached.
+_scaledTemplates: 'OrderedDict[Tuple[int, Tuple[int, ...], int], Tuple[GrayImage, GrayImage]]' = OrderedDict()
+_scaledTemplatesMaxSize = 2048
+_lastMultiScaleHits: Dict[Tuple[int, ...], float] = {}
+
+
+def getScaledTemplate(img: GrayImage, scale: float, cache: bool = True) -> GrayImage:
+    key = (id(img), img.shape, int(round(float(scale) * 1000)))
+    cached = _scaledTemplates.get(key)
+    if cached is not None and cached[0] is img:
+        _scaledTemplates.move_to_end(key)
+        return cached[1]
+    base_h, base_w = img.shape[:2]
+    w = max(1, int(round(base_w * float(scale))))
+    h = max(1, int(round(base_h * float(scale))))
+    if (w, h) == (base_w, base_h):
+        templ = img
+    else:
+        interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        templ = cv2.resize(img, (w, h), interpolation=interp)
+    if cache:
+        _scaledTemplates[key] = (img, templ)
+        while len(_scaledTemplates) > _scaledTemplatesMaxSize:
+            _scaledTemplates.popitem(last=False)
+    return templ
+
+
+def buildTemplatesPyramids(templates: Sequence[GrayImage], scales: Sequence[float]) -> None:
+    for img in templates:
+        for s in scales:
+            if s > 0:
+                getScaledTemplate(img, s)
+
+
+def locateAnyMultiScale(
     compareImage: GrayImage,
-    img: GrayImage,
+    templates: Sequence[GrayImage],
     confidence: float = 0.85,
     scales: Optional[Sequence[float]] = None,
     type: int = cv2.TM_CCOEFF_NORMED,
-) -> Optional[BBox]:
-    """Template matching across multiple scales.
-
-    Useful when capture output is scaled (e.g., OBS projector, DPI scaling).
-    Returns the best match bbox in compareImage coordinates.
+    stopConfidence: Optional[float] = 0.97,
+    cacheTemplates: bool = True,
+) -> Optional[Tuple[int, BBox]]:
+    """Best (template index, bbox) over every template and scale.
+
+    Scales are tried from the one that last matched these templates (then
+    closest to 1.0 first) and the search stops at the first score at or over
+    stopConfidence. Pass stopConfidence=confidence when any match will do,
+    or None to always try every template and scale. Templates built per call
+    (e.g. a radar crop) should pass cacheTemplates=False.
     """
     if scales is None:
         scales = (0.85, 0.90, 0.95, 1.0, 1.05, 1.10, 1.15)
-
-    best_val: float = -1.0
-    best_loc: Optional[Tuple[int, int]] = None
-    best_w: int = 0
-    best_h: int = 0
-
     try:
-        base_h, base_w = img.shape[:2]
         cmp_h, cmp_w = compareImage.shape[:2]
     except Exception:
         return None
+    if not templates:
+        return None
+    compareImage = np.ascontiguousarray(compareImage)
 
-    for s in scales:
-        try:
-            if s <= 0:
-                continue
-            w = max(1, int(round(base_w * float(s))))
-            h = max(1, int(round(base_h * float(s))))
-            if w > cmp_w or h > cmp_h:
+    hitKey = tuple(id(img) for img in templates)
+    lastScale = _lastMultiScaleHits.get(hitKey, 1.0)
+    orderedScales = sorted(
+        (float(s) for s in scales if s > 0),
+        key=lambda s: (abs(s - lastScale) > 1e-6, abs(np.log(s)), s))
+
+    best_val: float = -1.0
+    best: Optional[Tuple[int, BBox]] = None
+    best_scale = 1.0
+    for s in orderedScales:
+        for index, img in enumerate(templates):
+            try:
+                templ = getScaledTemplate(img, s, cache=cacheTemplates)
+                h, w = templ.shape[:2]
+                if w > cmp_w or h > cmp_h:
+                    continue
+                match = cv2.matchTemplate(compareImage, templ, type)
+                _, max_val, _, max_loc = cv2.minMaxLoc(match)
+            except Exception:
                 continue
-            interp = cv2.INTER_AREA if s < 1.0 else cv2.INTER_LINEAR
-            templ = cv2.resize(img, (w, h), interpolation=interp)
-            match = cv2.matchTemplate(compareImage, templ, type)
-            _, max_val, _, max_loc = cv2.minMaxLoc(match)
             if max_val > best_val:
                 best_val = float(max_val)
-                best_loc = (int(max_loc[0]), int(max_loc[1]))
-                best_w = int(w)
-                best_h = int(h)
-        except Exception:
+                best = (index, (int(max_loc[0]), int(max_loc[1]), int(w), int(h)))
+                best_scale = s
+                if stopConfidence is not None and best_val >= stopConfidence and best_val > confidence:
+                    break
+        else:
             continue
+        break
 
-    if best_loc is None or best_val <= confidence:
+    if best is None or best_val <= confidence:
         return None
-    return best_loc[0], best_loc[1], best_w, best_h
+    if cacheTemplates:
+        _lastMultiScaleHits[hitKey] = best_scale
+    return best
+
+
+def locateMultiScale(
+    compareImage: GrayImage,
+    img: GrayImage,
+    confidence: float = 0.85,
+    scales: Optional[Sequence[float]] = None,
+    type: int = cv2.TM_CCOEFF_NORMED,
+    stopConfidence: Optional[float] = 0.97,
+    cacheTemplates: bool = True,
+) -> Optional[BBox]:
+    """Template matching across multiple scales.
+
+    Useful when capture output is scaled (e.g., OBS projector, DPI scaling).
+    Returns the best match bbox in compareImage coordinates.
+    """
+    res = locateAnyMultiScale(
+        compareImage, [img], confidence=confidence, scales=scales, type=type,
+        stopConfidence=stopConfidence, cacheTemplates=cacheTemplates)
+    return res[1] if res is not None else None
 
 
 # TODO: add unit tests
@@ -821,6 +1076,16 @@ def locateMultiple(compareImg: GrayImage, img: GrayImage, confidence: float = 0.
 def getScreenshot(
     region: Optional[Tuple[int, int, int, int]] = None,
     absolute_region: Optional[Tuple[int, int, int, int]] = None,
+) -> Optional[GrayImage]:
+    # The dxcam camera is not thread-safe: tasks and the UI grab on their own
+    # threads while the capture thread (pipelined mode) grabs in the background.
+    with _cameraLock:
+        return _grabScreenshot(region=region, absolute_region=absolute_region)
+
+
+def _grabScreenshot(
+    region: Optional[Tuple[int, int, int, int]] = None,
+    absolute_region: Optional[Tuple[int, int, int, int]] = None,
 ) -> Optional[GrayImage]:
     global camera, latestScreenshot, _camera_output_idx, _camera_device_idx
     global _last_grab_was_none, _consecutive_none_frames, _consecutive_black_frames, _consecutive_same_frames, _last_screenshot_stats
@@ -904,12 +1169,17 @@ def getScreenshot(
 
     if screenshot is None:
         return latestScreenshot
-    full_gray = cast(GrayImage, cv2.cvtColor(screenshot, cv2.COLOR_BGRA2GRAY))
-    latestScreenshot = _crop_gray_frame(full_gray, region)
+    roi = _capture_roi
+    if roi:
+        latestScreenshot = _crop_roi_to_gray(screenshot, region, roi)
+    else:
+        latestScreenshot = _crop_to_gray(screenshot, region)
 
     # Lightweight stats + black-frame heuristic (used by diagnostics).
     try:
         frame = cast(GrayImage, latestScreenshot)
+        # ROI frames are black outside the regions: take stats on the regions only.
+        statsPixels = _getRoiPixels(frame, roi) if roi else frame
         fp = _frame_fingerprint(cast(np.ndarray, frame))
         if _last_frame_fingerprint is not None and fp == _last_frame_fingerprint:
             _consecutive_same_frames += 1
@@ -917,11 +1187,11 @@ def getScreenshot(
             _consecutive_same_frames = 0
         _last_frame_fingerprint = fp
 
-        mean_val = float(np.mean(frame))
-        std_val = float(np.std(frame))
+        mean_val = float(np.mean(statsPixels))
+        std_val = float(np.std(statsPixels))
         dark_px_thr = int(_CAPTURE_CFG.get('black_dark_pixel_threshold', 8))
         dark_frac_thr = float(_CAPTURE_CFG.get('black_dark_fraction_threshold', 0.98))
-        dark_fraction = float(np.mean(frame <= dark_px_thr))
+        dark_fraction = float(np.mean(statsPixels <= dark_px_thr))
         _last_screenshot_stats = {
             'shape': tuple(frame.shape),
             'mean': mean_val,
@@ -933,6 +1203,7 @@ def getScreenshot(
             'backend': 'dxcam',
             'device_idx': _camera_device_idx,
             'output_idx': _camera_output_idx,
+            'roi': len(roi) if roi else 0,
         }
         std_thr = float(_CAPTURE_CFG.get('black_std_threshold', 1.0))
         mean_thr = float(_CAPTURE_CFG.get('black_mean_threshold', 2.0))
@@ -951,8 +1222,7 @@ def getScreenshot(
                 # Calling dxcam.create repeatedly can spam stdout.
                 shot2 = camera.grab()
                 if shot2 is not None:
-                    full2 = cast(GrayImage, cv2.cvtColor(shot2, cv2.COLOR_BGRA2GRAY))
-                    frame2 = _crop_gray_frame(full2, region)
+                    frame2 = _crop_to_gray(shot2, region)
                     mean2 = float(np.mean(frame2))
                     std2 = float(np.std(frame2))
                     if not (mean2 <= 0.5 and std2 <= 0.5):
@@ -1025,8 +1295,7 @@ def getScreenshot(
             shot2 = None
         if shot2 is not None:
             try:
-                full2 = cast(GrayImage, cv2.cvtColor(shot2, cv2.COLOR_BGRA2GRAY))
-                frame2 = _crop_gray_frame(full2, region)
+                frame2 = _crop_to_gray(shot2, region)
                 latestScreenshot = cast(GrayImage, frame2)
                 _consecutive_same_frames = 0
                 _last_frame_fingerprint = _frame_fingerprint(cast(np.ndarray, frame2))
@@ -1055,8 +1324,7 @@ def getScreenshot(
             shot2 = None
         if shot2 is not None:
             try:
-                full2 = cast(GrayImage, cv2.cvtColor(shot2, cv2.COLOR_BGRA2GRAY))
-                frame2 = _crop_gray_frame(full2, region)
+                frame2 = _crop_to_gray(shot2, region)
                 mean2 = float(np.mean(frame2))
                 std2 = float(np.std(frame2))
                 dark_px_thr = int(_CAPTURE_CFG.get('black_dark_pixel_threshold', 8))
@@ -1115,8 +1383,7 @@ def getScreenshot(
                         shot3 = None
                     if shot3 is not None:
                         try:
-                            full3 = cast(GrayImage, cv2.cvtColor(shot3, cv2.COLOR_BGRA2GRAY))
-                            frame3 = _crop_gray_frame(full3, rel_region)
+                            frame3 = _crop_to_gray(shot3, rel_region)
                             if not _frame_is_hard_black(cast(np.ndarray, frame3)):
                                 latestScreenshot = cast(GrayImage, frame3)
                                 _consecutive_black_frames = 0
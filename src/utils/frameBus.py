@@ -0,0 +1,277 @@
+import argparse
+import os
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+# Shared-memory frame bus.
+#
+# With several clients on one machine every bot process used to run its own
+# desktop duplication and colour conversion of the same monitor. With the bus
+# a single capture process (`python -m src.utils.frameBus`) grabs the monitor
+# once and publishes the region each bot asks for into that bot's
+# shared-memory ring. The bot writes its capture region into the ring header
+# and reads the newest frame as a read-only view of the shared buffer,
+# without copying.
+#
+# Ring layout: an int64 header followed by `slotsCount` frame slots of
+# `slotSize` bytes. Like LatestFrameRing there is one writer and one reader:
+# the writer never touches the latest slot nor the slot the reader holds, and
+# publishes `seq * slotsCount + slot` with a single aligned store.
+
+slotsCount = 3
+publishedIndex = 0
+readerSlotIndex = 1
+slotSizeIndex = 2
+requestIndex = 3
+shapesIndex = 7
+headerSize = shapesIndex + slotsCount * 2
+headerBytes = headerSize * 8
+
+Region = Tuple[int, int, int, int]
+
+# Rings created by this process (the capture process, or tests).
+_createdClients: Set[str] = set()
+
+
+def getSharedMemoryName(client: str) -> str:
+    return f'fenril_frames_{client}'
+
+
+class SharedFrameRing:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self.shm = shm
+        self.owner = owner
+        self.header: np.ndarray = np.ndarray((headerSize,), dtype=np.int64, buffer=shm.buf)
+        self.slotSize = int(self.header[slotSizeIndex])
+        self.slots: List[np.ndarray] = [
+            np.ndarray((self.slotSize,), dtype=np.uint8, buffer=shm.buf, offset=headerBytes + slot * self.slotSize)
+            for slot in range(slotsCount)
+        ]
+
+    @classmethod
+    def create(cls, client: str, maxWidth: int, maxHeight: int) -> 'SharedFrameRing':
+        slotSize = int(maxWidth) * int(maxHeight)
+        shm = shared_memory.SharedMemory(name=getSharedMemoryName(client), create=True, size=headerBytes + slotsCount * slotSize)
+        header: np.ndarray = np.ndarray((headerSize,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[readerSlotIndex] = -1
+        header[slotSizeIndex] = slotSize
+        del header
+        _createdClients.add(client)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, client: str) -> 'SharedFrameRing':
+        shm = shared_memory.SharedMemory(name=getSharedMemoryName(client))
+        if os.name == 'posix' and client not in _createdClients:
+            # Attaching registers the segment with this process' resource
+            # tracker, which would unlink it when the bot exits.
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, 'shared_memory')  # type: ignore[attr-defined]
+            except Exception:
+                pass
+        return cls(shm, owner=False)
+
+    def getSeq(self) -> int:
+        return int(self.header[publishedIndex]) // slotsCount
+
+    def publish(self, frame: np.ndarray) -> int:
+        height, width = frame.shape[:2]
+        if height * width > self.slotSize:
+            raise ValueError(f'frame {width}x{height} does not fit in a {self.slotSize} bytes slot')
+        published = int(self.header[publishedIndex])
+        latestSlot = published % slotsCount if published else -1
+        readerSlot = int(self.header[readerSlotIndex])
+        slot = (latestSlot + 1) % slotsCount
+        while slot == latestSlot or slot == readerSlot:
+            slot = (slot + 1) % slotsCount
+        np.copyto(self.slots[slot][:height * width].reshape(height, width), frame)
+        self.header[shapesIndex + slot * 2] = height
+        self.header[shapesIndex + slot * 2 + 1] = width
+        seq = published // slotsCount + 1
+        self.header[publishedIndex] = seq * slotsCount + slot
+        return seq
+
+    def latest(self) -> Tuple[int, Optional[np.ndarray]]:
+        while True:
+            published = int(self.header[publishedIndex])
+            if not published:
+                return 0, None
+            slot = published % slotsCount
+            self.header[readerSlotIndex] = slot
+            # Still the latest once marked as held: the writer will not touch it.
+            if int(self.header[publishedIndex]) == published:
+                break
+        height = int(self.header[shapesIndex + slot * 2])
+        width = int(self.header[shapesIndex + slot * 2 + 1])
+        frame = self.slots[slot][:height * width].reshape(height, width)
+        if not self.owner:
+            # Readers share the buffer with the capture process: never write into it.
+            frame.flags.writeable = False
+        return published // slotsCount, frame
+
+    def setRequest(self, region: Optional[Region]) -> None:
+        self.header[requestIndex:requestIndex + 4] = region if region is not None else (0, 0, 0, 0)
+
+    def getRequest(self) -> Optional[Region]:
+        x, y, width, height = (int(value) for value in self.header[requestIndex:requestIndex + 4])
+        if width <= 0 or height <= 0:
+            return None
+        return (x, y, width, height)
+
+    def close(self) -> None:
+        del self.header
+        self.slots = []
+        try:
+            self.shm.close()
+        except BufferError:
+            # A frame view handed to the reader is still alive.
+            pass
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class FrameBusPublisher:
+    """Capture side: one grab per frame, cropped into every client's ring."""
+
+    def __init__(self, rings: Dict[str, SharedFrameRing], grab: Callable[[], Optional[np.ndarray]]) -> None:
+        self.rings = rings
+        self.grab = grab
+        self._stopEvent = threading.Event()
+
+    def publishFrame(self, frame: np.ndarray) -> int:
+        published = 0
+        frameHeight, frameWidth = frame.shape[:2]
+        for ring in self.rings.values():
+            request = ring.getRequest()
+            if request is None:
+                continue
+            x, y, width, height = request
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(frameWidth, x + width), min(frameHeight, y + height)
+            if x1 <= x0 or y1 <= y0 or (y1 - y0) * (x1 - x0) > ring.slotSize:
+                continue
+            ring.publish(frame[y0:y1, x0:x1])
+            published += 1
+        return published
+
+    def run(self, minInterval: float = 0.0) -> None:
+        while not self._stopEvent.is_set():
+            startedAt = time.perf_counter()
+            frame = self.grab()
+            if frame is not None:
+                self.publishFrame(frame)
+            elapsed = time.perf_counter() - startedAt
+            self._stopEvent.wait(max(minInterval - elapsed, 0.001 if frame is not None else 0.01))
+
+    def stop(self) -> None:
+        self._stopEvent.set()
+
+    def close(self) -> None:
+        for ring in self.rings.values():
+            ring.close()
+
+
+_readers: Dict[str, SharedFrameRing] = {}
+_readersState: Dict[str, Dict[str, float]] = {}
+# Seconds between attach attempts while the capture process is not running.
+attachRetryInterval = 2.0
+# Seconds without a new frame before the reader detaches and attaches again.
+staleTimeout = 2.0
+
+
+def readFrameBus(client: str, region: Optional[Region], wait: float = 0.05) -> Tuple[int, Optional[np.ndarray]]:
+    """Bot side: ask for `region` (x, y, w, h on the captured output) and return the newest frame.
+
+    Waits up to `wait` for a frame newer than the last one returned. Returns
+    (0, None) when the capture process is not running or has no frame for
+    this region yet, so the caller can fall back to its own capture.
+    """
+    state = _readersState.setdefault(client, {'lastSeq': 0, 'minSeq': 0, 'lastAttachAt': float('-inf')})
+    ring = _readers.get(client)
+    if ring is None:
+        now = time.perf_counter()
+        if now - state['lastAttachAt'] < attachRetryInterval:
+            return 0, None
+        state['lastAttachAt'] = now
+        try:
+            ring = _readers[client] = SharedFrameRing.attach(client)
+        except (OSError, ValueError):
+            return 0, None
+    if ring.getRequest() != region:
+        ring.setRequest(region)
+        # Frames already published are crops of the previous region.
+        state['minSeq'] = ring.getSeq()
+    afterSeq = max(state['lastSeq'], state['minSeq'])
+    deadline = time.perf_counter() + max(0.0, float(wait))
+    while ring.getSeq() <= afterSeq and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    seq, frame = ring.latest()
+    now = time.perf_counter()
+    if seq > state['lastSeq'] or 'frameAt' not in state:
+        state['frameAt'] = now
+    elif now - state['frameAt'] > staleTimeout:
+        # The capture process stopped (or was restarted on a new segment).
+        del frame
+        ring.close()
+        del _readers[client]
+        _readersState.pop(client, None)
+        return 0, None
+    if frame is None or seq <= state['minSeq']:
+        return 0, None
+    if region is not None and frame.shape[:2] != (region[3], region[2]):
+        # Clamped by the publisher: the region is partly off the captured output.
+        return 0, None
+    state['lastSeq'] = seq
+    return seq, frame
+
+
+def closeFrameBusReaders() -> None:
+    for ring in _readers.values():
+        ring.close()
+    _readers.clear()
+    _readersState.clear()
+
+
+def parseClient(value: str) -> Tuple[str, int, int]:
+    """'name:WIDTHxHEIGHT' -> (name, width, height)."""
+    name, _, size = value.partition(':')
+    width, _, height = size.lower().partition('x')
+    if not name or not width or not height:
+        raise argparse.ArgumentTypeError(f'expected name:WIDTHxHEIGHT, got {value!r}')
+    return name, int(width), int(height)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Capture the screen once and publish every client region into its shared-memory ring.')
+    parser.add_argument('--client', action='append', type=parseClient, required=True,
+                        help='client name and largest region size, e.g. main:1920x1080 (repeatable)')
+    parser.add_argument('--output-idx', type=int, default=1, help='monitor to capture (1-based, like FENRIL_OUTPUT_IDX)')
+    parser.add_argument('--fps', type=float, default=0.0, help='capture rate limit, 0 for as fast as possible')
+    args = parser.parse_args(argv)
+
+    from src.utils.core import getScreenshot, setScreenshotOutputIdx
+
+    setScreenshotOutputIdx(args.output_idx)
+    rings = {name: SharedFrameRing.create(name, width, height) for name, width, height in args.client}
+    publisher = FrameBusPublisher(rings, getScreenshot)
+    print(f"[fenril][frameBus] publishing {', '.join(rings)} from output {args.output_idx}")
+    try:
+        publisher.run(1.0 / args.fps if args.fps > 0 else 0.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+
+
+if __name__ == '__main__':
+    main()
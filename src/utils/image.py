@@ -4,6 +4,7 @@ import numpy as np
 from PIL import Image
 from typing import Any, Callable, Optional, Sequence, Union, cast
 from src.shared.typings import BBox, GrayImage
+from src.utils.assets import getBundledImage, recordDecodedImage
 from src.utils.core import hashit, locate
 
 
@@ -48,6 +49,8 @@ def cacheChain(imageList: Sequence[GrayImage]) -> Callable[[Callable[..., Any]],
 # TODO: add unit tests
 @njit(cache=True, fastmath=True)
 def convertGraysToBlack(arr: np.ndarray) -> np.ndarray:
+    # On a copy: arr is usually a crop of the screenshot, which may be read-only (frame bus).
+    arr = arr.copy()
     for i in range(len(arr)):
         for j in range(len(arr[0])):
             if arr[i, j] >= 50 and arr[i, j] <= 100:
@@ -62,7 +65,12 @@ def RGBtoGray(image: np.ndarray) -> GrayImage:
 
 # TODO: add unit tests
 def loadFromRGBToGray(path: str) -> GrayImage:
-    return np.array(RGBtoGray(load(path)), dtype=np.uint8)
+    image = getBundledImage(path)
+    if image is not None:
+        return image
+    image = np.array(RGBtoGray(load(path)), dtype=np.uint8)
+    recordDecodedImage(path, image)
+    return image
 
 
 # TODO: add unit tests
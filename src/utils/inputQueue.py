@@ -0,0 +1,82 @@
+import functools
+import heapq
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+
+# Input arbitration between threads.
+#
+# The pilot and the healing loop both send keys and clicks through the same
+# Arduino/pyautogui backends. Every input call holds the queue while it runs,
+# so two threads never interleave the commands of one press, and when several
+# threads are waiting the most urgent one (lowest priority) goes next: a heal
+# queued behind a cavebot click is sent right after that click. Holding is
+# reentrant, so a task can keep a modifier and its click together.
+
+urgentPriority = 0
+normalPriority = 10
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class InputQueue:
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._local = threading.local()
+
+    def setThreadPriority(self, priority: int) -> None:
+        """Priority of every input sent from the calling thread."""
+        self._local.priority = int(priority)
+
+    def getThreadPriority(self) -> int:
+        return getattr(self._local, 'priority', normalPriority)
+
+    def getWaitingCount(self) -> int:
+        with self._condition:
+            return len(self._waiting)
+
+    @contextmanager
+    def hold(self, priority: Optional[int] = None) -> Iterator[None]:
+        threadId = threading.get_ident()
+        with self._condition:
+            if self._owner == threadId:
+                self._depth += 1
+            else:
+                entry = (self.getThreadPriority() if priority is None else int(priority), next(self._tickets))
+                heapq.heappush(self._waiting, entry)
+                try:
+                    while self._owner is not None or self._waiting[0] != entry:
+                        self._condition.wait()
+                except BaseException:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                    self._condition.notify_all()
+                    raise
+                heapq.heappop(self._waiting)
+                self._owner = threadId
+                self._depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._owner = None
+                    self._condition.notify_all()
+
+
+inputQueue = InputQueue()
+
+
+def holdsInput(func: F) -> F:
+    @functools.wraps(func)
+    def inner(*args: Any, **kwargs: Any) -> Any:
+        with inputQueue.hold():
+            return func(*args, **kwargs)
+    return inner  # type: ignore[return-value]
@@ -4,6 +4,7 @@ import pyautogui
 from src.utils.runtime_settings import get_bool
 
 from .ino import sendCommandArduino
+from .inputQueue import holdsInput
 
 
 _DISABLE_INPUT: bool = get_bool({}, '_', env_var='FENRIL_DISABLE_INPUT', default=False, prefer_env=True)
@@ -74,6 +75,7 @@ def _normalize_keys(args: Tuple[object, ...]) -> Tuple[List[str], bool]:
         return [str(key) for key in args[0]], True
     return [str(key) for key in args], False
 
+@holdsInput
 def hotkey(*args: object) -> None:
     if _DISABLE_INPUT:
         return
@@ -94,6 +96,7 @@ def hotkey(*args: object) -> None:
         else:
             pyautogui.hotkey(*keys)
 
+@holdsInput
 def keyDown(key: str) -> None:
     if _DISABLE_INPUT:
         return
@@ -102,6 +105,7 @@ def keyDown(key: str) -> None:
         if not sendCommandArduino(f"keyDown,{asciiKey}"):
             pyautogui.keyDown(key)
 
+@holdsInput
 def keyUp(key: str) -> None:
     if _DISABLE_INPUT:
         return
@@ -110,6 +114,7 @@ def keyUp(key: str) -> None:
         if not sendCommandArduino(f"keyUp,{asciiKey}"):
             pyautogui.keyUp(key)
 
+@holdsInput
 def press(*args: object) -> None:
     if _DISABLE_INPUT:
         return
@@ -126,6 +131,7 @@ def press(*args: object) -> None:
         else:
             pyautogui.press(*keys)
 
+@holdsInput
 def write(phrase: str) -> None:
     if _DISABLE_INPUT:
         return
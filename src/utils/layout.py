@@ -0,0 +1,124 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Per-frame UI layout registry.
+#
+# Every middleware used to locate (and hash-verify) the same anchors again on
+# every call: radar tools, battle list icon, game window arrows, chat menu,
+# skills/hp/mana icons. The screenshot middleware now opens a frame with
+# `beginFrame`; anchors decorated with `cacheObjectPosition` verify their
+# cached bbox once per frame and every later call in the same frame is a plain
+# lookup. A full search (re-layout) only happens when that checksum fails.
+# Anchors are only verified when a middleware asks for them, and every cached
+# bbox is dropped when the capture window or region changes.
+
+# (seq, token) of the current frame, swapped in one assignment so threads
+# never see the seq of one frame with the token of another.
+_frame: Dict[str, Tuple[int, Optional[Tuple[int, int, Tuple[int, ...]]]]] = {
+    'current': (0, None),
+}
+
+_anchors: Dict[str, Callable[..., Any]] = {}
+_anchorsStatus: Dict[str, Dict[str, Any]] = {}
+# Screenshot regions read by the repositories: name -> ((x, y, w, h), frame seq).
+_captureRegions: Dict[str, Tuple[Tuple[int, int, int, int], int]] = {}
+# Capture geometry (window size, output) the cached anchors were found in.
+_captureGeometry: Dict[str, Any] = {'known': False, 'value': None}
+
+
+def frameToken(screenshot: Optional[np.ndarray]) -> Optional[Tuple[int, int, Tuple[int, ...]]]:
+    if screenshot is None:
+        return None
+    try:
+        return (id(screenshot), int(screenshot.__array_interface__['data'][0]), tuple(screenshot.shape))
+    except Exception:
+        return None
+
+
+def beginFrame(screenshot: Optional[np.ndarray]) -> int:
+    seq = _frame['current'][0] + 1
+    _frame['current'] = (seq, frameToken(screenshot))
+    return seq
+
+
+def getFrameSeq() -> int:
+    return _frame['current'][0]
+
+
+def getCurrentFrameSeq(screenshot: Optional[np.ndarray]) -> Optional[int]:
+    """Seq of the current frame when `screenshot` is it, else None."""
+    seq, token = _frame['current']
+    if token is None or frameToken(screenshot) != token:
+        return None
+    return seq
+
+
+def isCurrentFrame(screenshot: Optional[np.ndarray]) -> bool:
+    return getCurrentFrameSeq(screenshot) is not None
+
+
+def registerAnchor(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    _anchors[name] = func
+    return func
+
+
+def recordAnchorStatus(name: str, verified: bool, bbox: Optional[Tuple[int, int, int, int]], seq: Optional[int] = None) -> None:
+    status = _anchorsStatus.setdefault(name, {'hits': 0, 'relayouts': 0})
+    if verified:
+        status['hits'] += 1
+    else:
+        status['relayouts'] += 1
+    status['seq'] = getFrameSeq() if seq is None else seq
+    status['verified'] = verified
+    status['bbox'] = bbox
+
+
+def getRelayoutAnchors(seq: Optional[int] = None) -> List[str]:
+    seq = getFrameSeq() if seq is None else seq
+    return [
+        name for name, status in _anchorsStatus.items()
+        if status.get('seq') == seq and status.get('verified') is False
+    ]
+
+
+def setCaptureRegion(name: str, bbox: Optional[Tuple[int, int, int, int]]) -> None:
+    """Record the screenshot region a reader used in this frame, for ROI capture."""
+    if bbox is None:
+        return
+    x, y, w, h = bbox
+    _captureRegions[name] = ((int(x), int(y), int(w), int(h)), getFrameSeq())
+
+
+def getCaptureRegions(maxAge: int = 30) -> List[Tuple[int, int, int, int]]:
+    """Regions and anchors bboxes used within the last maxAge frames."""
+    seq = getFrameSeq()
+    regions = [bbox for bbox, regionSeq in _captureRegions.values() if seq - regionSeq < maxAge]
+    for status in _anchorsStatus.values():
+        if status.get('bbox') is not None and seq - int(status.get('seq', seq)) < maxAge:
+            x, y, w, h = status['bbox']
+            regions.append((int(x), int(y), int(w), int(h)))
+    return regions
+
+
+def resetLayout() -> None:
+    for func in _anchors.values():
+        reset_cache = getattr(func, 'reset_cache', None)
+        if callable(reset_cache):
+            try:
+                reset_cache()
+            except Exception:
+                pass
+    _anchorsStatus.clear()
+    _captureRegions.clear()
+
+
+def setCaptureGeometry(geometry: Any) -> bool:
+    """Reset the layout when the capture geometry changed; True when it did."""
+    known, previousGeometry = _captureGeometry['known'], _captureGeometry['value']
+    _captureGeometry.update({'known': True, 'value': geometry})
+    if not known or previousGeometry == geometry:
+        return False
+    resetLayout()
+    return True
@@ -5,6 +5,7 @@ import time
 import pyautogui
 from src.shared.typings import XYCoordinate
 from .ino import sendCommandArduino
+from .inputQueue import holdsInput
 from src.utils.runtime_settings import get_bool, get_int
 
 
@@ -217,6 +218,7 @@ def get_window_transform() -> tuple[Optional[Tuple[int, int, int, int]], Optiona
     """Return (capture_rect, action_rect) currently used for coordinate transform."""
     return (_capture_rect, _action_rect)
 
+@holdsInput
 def drag(x1y1: XYCoordinate, x2y2: XYCoordinate) -> None:
     if _should_block_click(x1y1) or _should_block_click(x2y2):
         return
@@ -231,6 +233,7 @@ def drag(x1y1: XYCoordinate, x2y2: XYCoordinate) -> None:
     pyautogui.moveTo(x1y1[0], x1y1[1])
     pyautogui.dragTo(x2y2[0], x2y2[1], button="left")
 
+@holdsInput
 def leftClick(windowCoordinate: Optional[XYCoordinate] = None) -> None:
     global _last_click_backend
     if _should_block_click(windowCoordinate):
@@ -264,6 +267,7 @@ def leftClick(windowCoordinate: Optional[XYCoordinate] = None) -> None:
     _last_click_backend = 'pyautogui'
     _click_diag(f"[fenril][input] leftClick backend=pyautogui coord={windowCoordinate}")
 
+@holdsInput
 def moveTo(windowCoordinate: XYCoordinate) -> None:
     if _DISABLE_INPUT:
         _click_diag(f"[fenril][input] BLOCK moveTo (input disabled) title={_action_title!r}")
@@ -282,6 +286,7 @@ def moveTo(windowCoordinate: XYCoordinate) -> None:
     if not sendCommandArduino(f"moveTo,{int(windowCoordinate[0])},{int(windowCoordinate[1])}"):
         pyautogui.moveTo(windowCoordinate[0], windowCoordinate[1])
 
+@holdsInput
 def rightClick(windowCoordinate: Optional[XYCoordinate] = None) -> None:
     global _last_click_backend
     if _should_block_click(windowCoordinate):
@@ -313,6 +318,7 @@ def rightClick(windowCoordinate: Optional[XYCoordinate] = None) -> None:
     _last_click_backend = 'pyautogui'
     _click_diag(f"[fenril][input] rightClick backend=pyautogui coord={windowCoordinate}")
 
+@holdsInput
 def scroll(clicks: int) -> None:
     if _DISABLE_INPUT:
         _click_diag(f"[fenril][input] BLOCK scroll (input disabled) title={_action_title!r}")
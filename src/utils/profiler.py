@@ -0,0 +1,113 @@
+import json
+import math
+import pathlib
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Tick profiler.
+#
+# Every stage of a pilot tick (middlewares, orchestrator, healing observers)
+# records its duration into a log-bucketed histogram: 8 buckets per octave
+# from 1us, so recording is a log2 and a list increment and percentiles are
+# within ~9% of the real value. Disabled profilers just call through.
+
+bucketsPerOctave = 8
+minSeconds = 1e-6
+bucketsCount = bucketsPerOctave * 24
+
+
+def getBucketIndex(seconds: float) -> int:
+    if seconds <= minSeconds:
+        return 0
+    return min(int(math.log2(seconds / minSeconds) * bucketsPerOctave) + 1, bucketsCount - 1)
+
+
+def getBucketUpperBound(index: int) -> float:
+    if index <= 0:
+        return minSeconds
+    return minSeconds * 2 ** (index / bucketsPerOctave)
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self.counts = [0] * bucketsCount
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[getBucketIndex(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def getPercentile(self, percentile: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(getBucketUpperBound(index), self.max)
+        return self.max
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': round(self.getPercentile(50) * 1000, 3),
+            'p95_ms': round(self.getPercentile(95) * 1000, 3),
+            'p99_ms': round(self.getPercentile(99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+            'last_ms': round(self.last * 1000, 3),
+        }
+
+
+class TickProfiler:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        if not self.enabled:
+            return func(*args)
+        startedAt = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.record(name, perf_counter() - startedAt)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def toDict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: histogram.toDict() for name, histogram in sorted(self.histograms.items())}
+
+    def getSummary(self, top: int = 5, only: Optional[List[str]] = None, exclude: Optional[List[str]] = None) -> str:
+        """Slowest stages by p95, e.g. 'middleware.radar=1.2/3.4/5.0ms' for p50/p95/p99."""
+        excluded = set(exclude or [])
+        histograms = sorted(
+            ((name, histogram) for name, histogram in self.histograms.items()
+             if (only is None or name in only) and name not in excluded and histogram.count),
+            key=lambda item: item[1].getPercentile(95), reverse=True)[:top]
+        return ' '.join(
+            f'{name}={histogram.getPercentile(50) * 1000:.1f}/{histogram.getPercentile(95) * 1000:.1f}/{histogram.getPercentile(99) * 1000:.1f}ms'
+            for name, histogram in histograms)
+
+    def dumpJson(self, path: str) -> None:
+        pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmpPath = f'{path}.tmp'
+        with open(tmpPath, 'w', encoding='utf-8') as file:
+            json.dump(self.toDict(), file, indent=2)
+        pathlib.Path(tmpPath).replace(path)
@@ -1,12 +1,84 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar
 
 
 _TRUE = {"1", "true", "yes", "y", "on", "t"}
 _FALSE = {"0", "false", "no", "n", "off", "f"}
 
+T = TypeVar("T")
+
+class RuntimeSettings(dict):
+    """`context['ng_runtime']`, remembering resolved settings until it changes.
+
+    get_bool/get_float/get_int/get_str split the dotted path, walk the
+    context and read the environment on every call, many times per tick.
+    When `ng_runtime` is a RuntimeSettings, the value they resolve for a
+    top-level key ('ng_runtime.<key>') is kept per call signature (path, env
+    var, default) and reused until the dict is modified (profile load, UI
+    setters, tasks counters). The environment is read again at that point
+    too: the bot never changes it in-process. Nested paths are not kept:
+    their dicts are modified in place. `|=` is not tracked; use update.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+        self.resolved: Dict[Tuple[Any, ...], Tuple[int, Any]] = {}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (RuntimeSettings, (dict(self),))
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.invalidate()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.invalidate()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.invalidate()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        value = super().pop(key, *args)
+        self.invalidate()
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.invalidate()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.invalidate()
+
+
+def _resolve(kind: str, context: Any, path: str, env_var: Optional[str], default: Any, prefer_env: bool, get: Callable[..., T]) -> T:
+    settings = context.get("ng_runtime") if isinstance(context, Mapping) and path.startswith("ng_runtime.") else None
+    if not isinstance(settings, RuntimeSettings) or "." in path[11:]:
+        return get(context, path, env_var=env_var, default=default, prefer_env=prefer_env)
+    key = (kind, path, env_var, default, prefer_env)
+    # Version read before resolving: a change made meanwhile forces a new read.
+    stamp = settings.version
+    cached = settings.resolved.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = get(context, path, env_var=env_var, default=default, prefer_env=prefer_env)
+    settings.resolved[key] = (stamp, value)
+    return value
+
 
 def _get_nested(mapping: Any, path: str) -> Any:
     cur: Any = mapping
@@ -33,7 +105,7 @@ def _parse_bool(value: Any) -> Optional[bool]:
     return None
 
 
-def get_bool(
+def _get_bool(
     context: Any,
     path: str,
     *,
@@ -41,8 +113,6 @@ def get_bool(
     default: bool = False,
     prefer_env: bool = False,
 ) -> bool:
-    """Get a boolean setting from context (preferred) or env var (fallback)."""
-
     if env_var and prefer_env:
         env = os.getenv(env_var)
         parsed = _parse_bool(env)
@@ -63,7 +133,7 @@ def get_bool(
     return default
 
 
-def get_float(
+def _get_float(
     context: Any,
     path: str,
     *,
@@ -94,7 +164,7 @@ def get_float(
     return default
 
 
-def get_int(
+def _get_int(
     context: Any,
     path: str,
     *,
@@ -125,7 +195,7 @@ def get_int(
     return default
 
 
-def get_str(
+def _get_str(
     context: Any,
     path: str,
     *,
@@ -148,3 +218,48 @@ def get_str(
         if env is not None:
             return env
     return default
+
+
+def get_bool(
+    context: Any,
+    path: str,
+    *,
+    env_var: Optional[str] = None,
+    default: bool = False,
+    prefer_env: bool = False,
+) -> bool:
+    """Get a boolean setting from context (preferred) or env var (fallback)."""
+    return _resolve("bool", context, path, env_var, default, prefer_env, _get_bool)
+
+
+def get_float(
+    context: Any,
+    path: str,
+    *,
+    env_var: Optional[str] = None,
+    default: float,
+    prefer_env: bool = False,
+) -> float:
+    return _resolve("float", context, path, env_var, default, prefer_env, _get_float)
+
+
+def get_int(
+    context: Any,
+    path: str,
+    *,
+    env_var: Optional[str] = None,
+    default: int,
+    prefer_env: bool = False,
+) -> int:
+    return _resolve("int", context, path, env_var, default, prefer_env, _get_int)
+
+
+def get_str(
+    context: Any,
+    path: str,
+    *,
+    env_var: Optional[str] = None,
+    default: str = "",
+    prefer_env: bool = False,
+) -> str:
+    return _resolve("str", context, path, env_var, default, prefer_env, _get_str)
@@ -0,0 +1,144 @@
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from src.shared.typings import BBox, GrayImage
+from src.utils.core import locateMultiScale
+
+
+# Learned UI scale.
+#
+# OBS projectors and Windows DPI scaling resize the whole client by the same
+# factor, yet every anchor locator swept its own 7-14 scales on each re-layout.
+# Anchors that are always on screen (radar tools, battle list icon, chat menu)
+# report the scale of their match here; once it is known every locator tries
+# that single scale first and only sweeps again when it misses, which is what
+# invalidates the estimate. The context persists it per profile so a restart
+# does not need a sweep either; `persist` runs on the pilot thread, so it only
+# hands the scale over (the UI thread writes the profile).
+#
+# The scale learned is the one of the sweep that produced the match, not the
+# ratio of the rounded bbox to the template: at 0.95 that ratio reads 0.909
+# for the 11 px battle list icon and 0.974 for the 4 px high bottom bar, and
+# every anchor would move the estimate. Small templates get the same size at
+# neighbouring scales of the sweep; those matches do not teach anything.
+
+minScale = 0.3
+maxScale = 3.0
+# Estimates closer than this to the current one are the same scale.
+scaleTolerance = 0.01
+
+_uiScale: Dict[str, Any] = {
+    'enabled': True,
+    'scale': None,
+    'persisted': None,
+    'persist': None,
+}
+
+ScaleSweep = Tuple[Sequence[float], float]
+
+
+def configureUiScale(
+    *,
+    enabled: Optional[bool] = None,
+    scale: Optional[float] = None,
+    persist: Optional[Callable[[float], None]] = None,
+) -> None:
+    if enabled is not None:
+        _uiScale['enabled'] = bool(enabled)
+    if persist is not None:
+        _uiScale['persist'] = persist
+    if scale is not None:
+        try:
+            scale = float(scale)
+        except (TypeError, ValueError):
+            return
+        if minScale <= scale <= maxScale:
+            # Loaded from the profile: already persisted.
+            _uiScale['scale'] = scale
+            _uiScale['persisted'] = scale
+
+
+def getUiScale() -> Optional[float]:
+    if not _uiScale['enabled']:
+        return None
+    return _uiScale['scale']
+
+
+def setUiScale(scale: float) -> None:
+    scale = min(max(float(scale), minScale), maxScale)
+    current = _uiScale['scale']
+    if current is not None and abs(current - scale) < scaleTolerance:
+        return
+    _uiScale['scale'] = scale
+    persisted = _uiScale['persisted']
+    persist = _uiScale['persist']
+    if persist is None or (persisted is not None and abs(persisted - scale) < scaleTolerance):
+        return
+    try:
+        persist(round(scale, 3))
+        _uiScale['persisted'] = scale
+    except Exception:
+        pass
+
+
+def resetUiScale() -> None:
+    _uiScale['scale'] = None
+    _uiScale['persisted'] = None
+
+
+def getMatchScale(bbox: BBox, template: GrayImage, scales: Sequence[float]) -> Optional[float]:
+    """Scale of `scales` the match was found at, None when several give the template its size."""
+    try:
+        templateHeight, templateWidth = template.shape[:2]
+        size = (int(bbox[2]), int(bbox[3]))
+    except Exception:
+        return None
+    matchScales = set()
+    for scale in scales:
+        # Same rounding as getScaledTemplate.
+        scaledSize = (max(1, int(round(templateWidth * float(scale)))), max(1, int(round(templateHeight * float(scale)))))
+        if scaledSize == size:
+            matchScales.add(round(float(scale), 3))
+    if len(matchScales) != 1:
+        return None
+    return matchScales.pop()
+
+
+def observeAnchorScale(bbox: Optional[BBox], template: GrayImage, scales: Sequence[float]) -> None:
+    if bbox is None or not _uiScale['enabled']:
+        return
+    scale = getMatchScale(bbox, template, scales)
+    if scale is not None:
+        setUiScale(scale)
+
+
+def getScalesToTry(scales: Sequence[float]) -> Sequence[float]:
+    scale = getUiScale()
+    return scales if scale is None else (scale,)
+
+
+def locateAtUiScale(
+    screenshot: GrayImage,
+    template: GrayImage,
+    sweeps: Sequence[ScaleSweep],
+    anchor: bool = True,
+) -> Optional[BBox]:
+    """Match at the learned scale, sweeping `(scales, confidence)` pairs in order when it misses.
+
+    Anchors (always on screen) learn the scale of the match of a sweep.
+    Presence checks (chat off/on buttons) can legitimately miss, so they sweep
+    without learning.
+    """
+    if not sweeps:
+        return None
+    scale = getUiScale()
+    if scale is not None:
+        res = locateMultiScale(screenshot, template, confidence=sweeps[0][1], scales=(scale,))
+        if res is not None:
+            return res
+    for scales, confidence in sweeps:
+        res = locateMultiScale(screenshot, template, confidence=confidence, scales=scales)
+        if res is not None:
+            if anchor:
+                observeAnchorScale(res, template, scales)
+            return res
+    return None
@@ -688,3 +688,41 @@ def test_not_call_all_tree_onTimeout(mocker):
     assert rootTask.tasks[1].statusReason == 'completed'
     assert rootTask.status == 'completed'
     assert rootTask.statusReason == 'completed'
+
+
+def test_should_resolve_current_task_once_until_task_tree_changes(mocker):
+    rootTask = VectorTask(name='rootTask')
+    rootTask.tasks = [
+        BaseTask(name='firstTask').setParentTask(rootTask).setRootTask(rootTask),
+        BaseTask(name='secondTask').setParentTask(rootTask).setRootTask(rootTask),
+    ]
+    tasksOrchestrator = TasksOrchestrator()
+    tasksOrchestrator.setRootTask(context, rootTask)
+    getNestedTaskSpy = mocker.spy(tasksOrchestrator, 'getNestedTask')
+    assert tasksOrchestrator.getCurrentTask(context) is rootTask.tasks[0]
+    assert tasksOrchestrator.getCurrentTask(context) is rootTask.tasks[0]
+    assert tasksOrchestrator.getCurrentTaskName(context) == 'rootTask'
+    assert tasksOrchestrator.getCurrentTaskPath(context) == ('rootTask', 'firstTask')
+    resolutionsCount = getNestedTaskSpy.call_count
+    rootTask.currentTaskIndex = 1
+    assert tasksOrchestrator.getCurrentTask(context) is rootTask.tasks[1]
+    assert getNestedTaskSpy.call_count > resolutionsCount
+    resolutionsCount = getNestedTaskSpy.call_count
+    rootTask.tasks[1].status = 'running'
+    tasksOrchestrator.getCurrentTask(context)
+    assert getNestedTaskSpy.call_count > resolutionsCount
+    resolutionsCount = getNestedTaskSpy.call_count
+    rootTask.tasks[1].status = 'running'
+    tasksOrchestrator.getCurrentTask(context)
+    assert getNestedTaskSpy.call_count == resolutionsCount
+
+
+def test_should_not_reuse_current_task_of_previous_root_task():
+    tasksOrchestrator = TasksOrchestrator()
+    tasksOrchestrator.setRootTask(context, BaseTask(name='firstTask'))
+    assert tasksOrchestrator.getCurrentTaskPath(context) == ('firstTask',)
+    tasksOrchestrator.rootTask = BaseTask(name='secondTask')
+    assert tasksOrchestrator.getCurrentTaskPath(context) == ('secondTask',)
+    tasksOrchestrator.reset()
+    assert tasksOrchestrator.getCurrentTask(context) is None
+    assert tasksOrchestrator.getCurrentTaskPath(context) == ()
@@ -0,0 +1,75 @@
+import numpy as np
+from src.gameplay.core.waypoint import FloorWalkpointsPlanner, generateFloorWalkpoints
+
+
+def getWalkableFloorsSqms():
+    return np.ones((8, 300, 300), dtype=np.uint8)
+
+
+def test_should_plan_same_walkpoints_as_generateFloorWalkpoints(mocker):
+    mocker.patch('src.gameplay.core.waypoint.walkableFloorsSqms', getWalkableFloorsSqms())
+    coordinate = (31844, 31076, 7)
+    goalCoordinate = (31850, 31079, 7)
+    nonWalkableCoordinates = [(31846, 31077, 7), (31846, 31078, 7)]
+    planner = FloorWalkpointsPlanner(goalCoordinate)
+    assert planner.plan(coordinate, nonWalkableCoordinates) == generateFloorWalkpoints(
+        coordinate, goalCoordinate, nonWalkableCoordinates=nonWalkableCoordinates)
+    assert planner.searches == 1
+
+
+def test_should_reuse_remaining_path_while_player_walks_on_it(mocker):
+    mocker.patch('src.gameplay.core.waypoint.walkableFloorsSqms', getWalkableFloorsSqms())
+    planner = FloorWalkpointsPlanner((31850, 31076, 7))
+    walkpoints = planner.plan((31844, 31076, 7))
+    assert planner.plan(walkpoints[1]) == walkpoints[2:]
+    assert planner.plan(walkpoints[2], [(31800, 31000, 7)]) == walkpoints[3:]
+    assert planner.searches == 1
+    assert planner.reuses == 2
+
+
+def test_should_search_again_when_an_obstacle_blocks_remaining_path(mocker):
+    mocker.patch('src.gameplay.core.waypoint.walkableFloorsSqms', getWalkableFloorsSqms())
+    planner = FloorWalkpointsPlanner((31850, 31076, 7))
+    walkpoints = planner.plan((31844, 31076, 7))
+    blockedWalkpoint = walkpoints[3]
+    newWalkpoints = planner.plan(walkpoints[0], [blockedWalkpoint])
+    assert planner.searches == 2
+    assert blockedWalkpoint not in newWalkpoints
+    assert newWalkpoints[-1] == (31850, 31076, 7)
+
+
+def test_should_keep_trapped_result_until_obstacles_change(mocker):
+    mocker.patch('src.gameplay.core.waypoint.walkableFloorsSqms', getWalkableFloorsSqms())
+    coordinate = (31844, 31076, 7)
+    wall = [(x, y, 7) for x in range(31843, 31846) for y in range(31075, 31078) if (x, y) != (31844, 31076)]
+    planner = FloorWalkpointsPlanner((31850, 31076, 7))
+    assert planner.plan(coordinate, wall) == []
+    assert planner.plan(coordinate, wall) == []
+    assert planner.searches == 1
+    wall.remove((31845, 31076, 7))
+    assert len(planner.plan(coordinate, wall)) > 0
+    assert planner.searches == 2
+
+
+def test_should_walk_to_farthest_route_checkpoint_in_window_when_goal_is_far(mocker):
+    mocker.patch('src.gameplay.core.waypoint.walkableFloorsSqms', getWalkableFloorsSqms())
+    route = [(31870, 31076, 7), (31890, 31076, 7), (31910, 31076, 7), (31930, 31076, 7)]
+    getRouteSpy = mocker.patch('src.gameplay.core.waypoint.getRoute', return_value=route)
+    planner = FloorWalkpointsPlanner((31930, 31076, 7))
+    walkpoints = planner.plan((31844, 31076, 7))
+    getRouteSpy.assert_called_once_with((31844, 31076, 7), (31930, 31076, 7))
+    assert walkpoints[-1] == (31890, 31076, 7)
+
+
+def test_should_not_keep_trapped_result_while_route_is_loading(mocker):
+    mocker.patch('src.gameplay.core.waypoint.walkableFloorsSqms', getWalkableFloorsSqms())
+    mocker.patch('src.gameplay.core.waypoint.getRoute', return_value=None)
+    isRegionsGraphLoadingSpy = mocker.patch('src.gameplay.core.waypoint.isRegionsGraphLoading', return_value=True)
+    planner = FloorWalkpointsPlanner((31930, 31076, 7))
+    assert planner.plan((31844, 31076, 7)) == []
+    assert planner.plan((31844, 31076, 7)) == []
+    assert planner.searches == 2
+    isRegionsGraphLoadingSpy.return_value = False
+    assert planner.plan((31844, 31076, 7)) == []
+    assert planner.plan((31844, 31076, 7)) == []
+    assert planner.searches == 3
@@ -0,0 +1,35 @@
+from src.gameplay import jitWarmup
+from src.gameplay.jitWarmup import getDummyImages, warmupJitKernels, warmupStatusBar
+from src.repositories.statusBar.core import getFilledBarPercentage
+
+
+def test_should_get_contiguous_cropped_and_read_only_dummy_images():
+    image, crop, readOnlyCrop = getDummyImages(4, 6)
+    assert image.shape == crop.shape == readOnlyCrop.shape == (4, 6)
+    assert image.flags['C_CONTIGUOUS']
+    assert not crop.flags['C_CONTIGUOUS']
+    assert crop.flags.writeable
+    assert not readOnlyCrop.flags.writeable
+
+
+def test_should_run_every_warmup_even_when_one_fails(mocker):
+    failingWarmup = mocker.Mock(side_effect=RuntimeError('boom'))
+    warmup = mocker.Mock()
+    logSpy = mocker.patch('src.gameplay.jitWarmup.log')
+    mocker.patch.object(jitWarmup, 'jitWarmups', [('failing', failingWarmup), ('ok', warmup)])
+    timings = warmupJitKernels()
+    assert set(timings) == {'failing', 'ok'}
+    warmup.assert_called_once()
+    logSpy.assert_any_call('warn', 'JIT warmup of failing failed: RuntimeError: boom')
+
+
+def test_should_warm_up_every_kernel(mocker):
+    logSpy = mocker.patch('src.gameplay.jitWarmup.log')
+    timings = warmupJitKernels()
+    assert set(timings) == {'battleList', 'gameWindow', 'statusBar', 'utils'}
+    assert all(call.args[0] != 'warn' for call in logSpy.call_args_list)
+
+
+def test_should_warm_up_status_bar_with_read_only_rows():
+    warmupStatusBar()
+    assert any(not signature[0].mutable and signature[0].ndim == 1 for signature in getFilledBarPercentage.signatures)
@@ -0,0 +1,42 @@
+import numpy as np
+from src.gameplay.threads import healing
+from src.gameplay.threads.healing import HealingThread, isHealingLoopActive
+
+
+class FakeUIContext:
+    def __init__(self, context):
+        self.context = context
+
+
+def test_should_not_tick_without_capture_frames(mocker):
+    mocker.patch('src.gameplay.threads.healing.peekLatestScreenshot', return_value=(0, None))
+    healingByPotionsSpy = mocker.patch('src.gameplay.threads.healing.healingByPotions')
+    assert HealingThread(FakeUIContext({})).tick({}) is False
+    healingByPotionsSpy.assert_not_called()
+
+
+def test_should_run_observers_on_healing_frame(mocker):
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    statusBar = {'hp': 100, 'hpPercentage': 20, 'mana': 50, 'manaPercentage': 90}
+    mocker.patch('src.gameplay.threads.healing.peekLatestScreenshot', return_value=(7, screenshot))
+    mocker.patch('src.gameplay.threads.healing.getHealingStatusBar', return_value=statusBar)
+    seen = []
+
+    def healingByPotions(context):
+        seen.append((context['ng_screenshot'], context['ng_statusBar'], context['healing']))
+        context['healCount'] = context['healCount'] + 1
+
+    mocker.patch('src.gameplay.threads.healing.healingByPotions', side_effect=healingByPotions)
+    mocker.patch('src.gameplay.threads.healing.healingByMana')
+    mocker.patch('src.gameplay.threads.healing.healingBySpells')
+    pilotScreenshot = np.ones((10, 10), dtype=np.uint8)
+    context = {'healing': {}, 'healCount': 0, 'ng_screenshot': pilotScreenshot, 'ng_statusBar': {'hpPercentage': 100}}
+    healing._healingLoop['lastTickAt'] = float('-inf')
+    assert isHealingLoopActive() is False
+    assert HealingThread(FakeUIContext(context)).tick(context) is True
+    assert seen == [(screenshot, statusBar, {})]
+    assert context['healCount'] == 1
+    assert context['ng_screenshot'] is pilotScreenshot
+    assert context['ng_statusBar'] == {'hpPercentage': 100}
+    assert isHealingLoopActive() is True
+    healing._healingLoop['lastTickAt'] = float('-inf')
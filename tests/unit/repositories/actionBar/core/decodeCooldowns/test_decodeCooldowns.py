@@ -0,0 +1,28 @@
+import pathlib
+import numpy as np
+from src.repositories.actionBar.config import images
+from src.repositories.actionBar.core import decodeCooldowns
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+listOfCooldownsImage = loadFromRGBToGray(f'{currentPath}/listOfCooldownsImage.png')
+
+
+def test_should_return_every_running_cooldown():
+    cooldowns = decodeCooldowns(listOfCooldownsImage)
+    assert set(cooldowns.keys()) == set(images['cooldowns'].keys())
+    assert [name for name, hasCooldown in cooldowns.items() if hasCooldown] == ['exori', 'support', 'utani hur']
+
+
+def test_should_ignore_icons_without_running_bar():
+    strip = listOfCooldownsImage.copy()
+    strip[20:22, 209:229] = 0
+    cooldowns = decodeCooldowns(strip)
+    assert cooldowns['exori'] is False
+    assert cooldowns['utani hur'] is True
+
+
+def test_should_return_no_cooldowns_when_strip_is_too_short():
+    cooldowns = decodeCooldowns(np.zeros((10, 100), dtype=np.uint8))
+    assert not any(cooldowns.values())
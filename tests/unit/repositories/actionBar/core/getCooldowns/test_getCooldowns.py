@@ -0,0 +1,28 @@
+import numpy as np
+from src.repositories.actionBar.core import getCooldowns, hasCooldownByName
+from src.utils.layout import beginFrame
+
+
+def test_should_return_None_when_getCooldownsImage_return_None(mocker):
+    mocker.patch('src.repositories.actionBar.extractors.getCooldownsImage', return_value=None)
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    assert getCooldowns(screenshot) is None
+    assert hasCooldownByName(screenshot, 'exori') is None
+
+
+def test_should_decode_cooldowns_once_per_frame(mocker):
+    getCooldownsImageSpy = mocker.patch(
+        'src.repositories.actionBar.extractors.getCooldownsImage', return_value=np.zeros((22, 100), dtype=np.uint8))
+    decodeCooldownsSpy = mocker.patch(
+        'src.repositories.actionBar.core.decodeCooldowns', return_value={'exori': True, 'utura': False})
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    assert hasCooldownByName(screenshot, 'exori') is True
+    assert hasCooldownByName(screenshot, 'utura') is False
+    assert getCooldowns(screenshot) == {'exori': True, 'utura': False}
+    assert getCooldownsImageSpy.call_count == 1
+    assert decodeCooldownsSpy.call_count == 1
+    beginFrame(screenshot)
+    getCooldowns(screenshot)
+    assert decodeCooldownsSpy.call_count == 2
+    beginFrame(None)
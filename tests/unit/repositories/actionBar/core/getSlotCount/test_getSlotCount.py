@@ -0,0 +1,82 @@
+import pathlib
+from src.repositories.actionBar import core as actionBarCore
+from src.repositories.actionBar.core import getSlotCount
+from src.utils.image import loadFromRGBToGray
+
+
+currentPath = pathlib.Path(__file__).parent.resolve()
+
+
+def test_should_return_1_when_slot_has_one_health_potion():
+    screenshotImage = loadFromRGBToGray(f'{currentPath}/healthPotionAvailable.png')
+    assert getSlotCount(screenshotImage, 1) == 1
+
+
+def test_should_return_100_when_slot_has_one_hundred_small_health_potions():
+    screenshotImage = loadFromRGBToGray(f'{currentPath}/smallHealthPotionAvailable.png')
+    assert getSlotCount(screenshotImage, 1) == 100
+
+
+def test_should_return_801_when_slot_has_eight_hundred_and_one_strong_mana_potions():
+    screenshotImage = loadFromRGBToGray(f'{currentPath}/strongManaPotionAvailable.png')
+    assert getSlotCount(screenshotImage, 1) == 801
+
+
+def test_should_return_cached_count_when_slot_did_not_change(mocker):
+    screenshotImage = loadFromRGBToGray(f'{currentPath}/smallHealthPotionAvailable.png')
+    assert getSlotCount(screenshotImage, 1) == 100
+    recognizeSlotDigitsSpy = mocker.patch('src.repositories.actionBar.core._recognizeSlotDigits')
+    assert getSlotCount(screenshotImage, 1) == 100
+    recognizeSlotDigitsSpy.assert_not_called()
+
+
+def test_should_return_counts_of_every_templated_digit():
+    screenshotImage = loadFromRGBToGray(f'{currentPath.parent}/hasSupportCooldown/withoutSupportCooldown.png')
+    assert getSlotCount(screenshotImage, 4) == 262
+    assert getSlotCount(screenshotImage, 6) == 126
+    screenshotImage = loadFromRGBToGray(f'{currentPath.parent.parent}/locators/getRightArrowsPosition/rightArrowsUnlocked.png')
+    assert getSlotCount(screenshotImage, 2) == 900
+    screenshotImage = loadFromRGBToGray(f'{currentPath.parents[2]}/radar/locators/getRadarToolsPos/screenshot.png')
+    assert getSlotCount(screenshotImage, 2) == 400
+
+
+def test_should_not_read_item_sprites_as_counts(mocker):
+    screenshotImage = loadFromRGBToGray(f'{currentPath.parent}/hasSupportCooldown/withoutSupportCooldown.png')
+    tesseractSpy = mocker.patch('src.repositories.actionBar.core._getSlotCountByTesseract')
+    assert getSlotCount(screenshotImage, 1) == 0
+    tesseractSpy.assert_not_called()
+
+
+def test_should_not_cache_count_read_by_tesseract_until_confirmed(mocker):
+    screenshotImage = loadFromRGBToGray(f'{currentPath.parent}/hasSupportCooldown/withoutSupportCooldown.png')
+    mocker.patch.dict('src.repositories.actionBar.core._slotsCountsCache', clear=True)
+    mocker.patch.dict('src.repositories.actionBar.core.digitsTemplates')
+    mocker.patch.dict('src.repositories.actionBar.core._digitsMasks')
+    del actionBarCore.digitsTemplates[1]
+    mocker.patch('src.repositories.actionBar.core.save')
+    tesseractSpy = mocker.patch('src.repositories.actionBar.core._getSlotCountByTesseract', return_value='')
+    assert getSlotCount(screenshotImage, 6) is None
+    # Does not end with the 26 read by the templates.
+    tesseractSpy.return_value = '120'
+    assert getSlotCount(screenshotImage, 6) == 120
+    tesseractSpy.return_value = '126'
+    assert getSlotCount(screenshotImage, 6) == 126
+    assert getSlotCount(screenshotImage, 6) == 126
+    assert tesseractSpy.call_count == 3
+
+
+def test_should_learn_glyphs_of_digits_confirmed_by_tesseract(mocker):
+    screenshotImage = loadFromRGBToGray(f'{currentPath.parent}/hasSupportCooldown/withoutSupportCooldown.png')
+    mocker.patch.dict('src.repositories.actionBar.core._slotsCountsCache', clear=True)
+    mocker.patch.dict('src.repositories.actionBar.core.digitsTemplates')
+    mocker.patch.dict('src.repositories.actionBar.core._digitsMasks')
+    del actionBarCore.digitsTemplates[1]
+    saveSpy = mocker.patch('src.repositories.actionBar.core.save')
+    tesseractSpy = mocker.patch('src.repositories.actionBar.core._getSlotCountByTesseract', return_value='126')
+    assert getSlotCount(screenshotImage, 6) == 126
+    saveSpy.assert_called_once_with(mocker.ANY, f'{actionBarCore.digitsGlyphsImagesPath}/1.png')
+    assert saveSpy.call_args[0][0].shape == (6, 5)
+    actionBarCore._slotsCountsCache.clear()
+    assert getSlotCount(screenshotImage, 6) == 126
+    assert getSlotCount(screenshotImage, 4) == 262
+    assert tesseractSpy.call_count == 1
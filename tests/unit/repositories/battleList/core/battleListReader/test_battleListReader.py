@@ -0,0 +1,50 @@
+import numpy as np
+from src.repositories.battleList.core import BattleListReader
+from src.repositories.battleList.typings import Creature
+
+
+def makeContent(slotsValues) -> np.ndarray:
+    return np.vstack([np.full((22, 156), value, dtype=np.uint8) for value in slotsValues] + [np.zeros((22, 156), dtype=np.uint8)])
+
+
+def fakeGetCreatures(slotContent):
+    value = int(slotContent[0, 0])
+    if value == 0:
+        return np.array([], dtype=Creature)
+    return np.array([(f'Creature {value}', value % 2 == 1)], dtype=Creature)
+
+
+def test_should_return_an_empty_array_when_content_is_none():
+    creatures = BattleListReader().read(None)
+    np.testing.assert_array_equal(creatures, np.array([], dtype=Creature))
+
+
+def test_should_decode_slots_until_the_first_empty_one(mocker):
+    mocker.patch('src.repositories.battleList.core.getCreatures', side_effect=fakeGetCreatures)
+    reader = BattleListReader()
+    creatures = reader.read(makeContent([2, 3, 5]))
+    expectedCreatures = np.array([('Creature 2', False), ('Creature 3', True), ('Creature 5', False)], dtype=Creature)
+    np.testing.assert_array_equal(creatures, expectedCreatures)
+    assert reader.decodedSlots == 4
+
+
+def test_should_only_decode_changed_slots(mocker):
+    getCreaturesSpy = mocker.patch('src.repositories.battleList.core.getCreatures', side_effect=fakeGetCreatures)
+    reader = BattleListReader()
+    reader.read(makeContent([2, 4, 6]))
+    getCreaturesSpy.reset_mock()
+    reader.read(makeContent([2, 4, 6]))
+    getCreaturesSpy.assert_not_called()
+    creatures = reader.read(makeContent([4, 6, 8]))
+    assert getCreaturesSpy.call_count == 1
+    assert int(getCreaturesSpy.call_args[0][0][0, 0]) == 8
+    np.testing.assert_array_equal(creatures['name'], ['Creature 4', 'Creature 6', 'Creature 8'])
+
+
+def test_should_decode_all_slots_again_when_width_changes(mocker):
+    getCreaturesSpy = mocker.patch('src.repositories.battleList.core.getCreatures', side_effect=fakeGetCreatures)
+    reader = BattleListReader()
+    reader.read(makeContent([2, 4]))
+    getCreaturesSpy.reset_mock()
+    reader.read(makeContent([2, 4])[:, :150])
+    assert getCreaturesSpy.call_count == 3
@@ -0,0 +1,61 @@
+import numpy as np
+from src.repositories.chat.core import LootMessagesReader, lootOfTextImg, nothingTextImg
+
+
+lineHeight = 14
+
+
+def makeLine(kind: str, seed: int = 0) -> np.ndarray:
+    line = np.full((lineHeight, 300), 40, dtype=np.uint8)
+    if kind == 'text':
+        line[3:10, 0:80] = np.random.default_rng(seed).integers(120, 200, (7, 80))
+        return line
+    line[1:12, 0:44] = lootOfTextImg
+    if kind == 'nothing':
+        line[1:12, 60:107] = nothingTextImg
+    else:
+        line[1:12, 50:60] = 100 + seed
+    return line
+
+
+def makeMessages(lines) -> np.ndarray:
+    return np.vstack(lines[-10:])
+
+
+def test_should_not_report_loot_already_in_chat():
+    reader = LootMessagesReader()
+    lines = [makeLine('text', i) for i in range(9)] + [makeLine('loot')]
+    assert reader.update(makeMessages(lines), 1.0) == []
+
+
+def test_should_report_appended_loot_lines_only():
+    reader = LootMessagesReader()
+    lines = [makeLine('text', i) for i in range(10)]
+    reader.update(makeMessages(lines), 1.0)
+    assert reader.update(makeMessages(lines), 2.0) == []
+    lines.append(makeLine('loot'))
+    events = reader.update(makeMessages(lines), 3.0)
+    assert [(event['timestamp'], event['y']) for event in events] == [(3.0, 9 * lineHeight + 1)]
+    lines.append(makeLine('nothing'))
+    assert reader.update(makeMessages(lines), 4.0) == []
+    lines.append(makeLine('loot'))
+    assert len(reader.update(makeMessages(lines), 5.0)) == 1
+    assert len(reader.events) == 2
+
+
+def test_should_only_scan_changed_rows():
+    reader = LootMessagesReader()
+    lines = [makeLine('text', i) for i in range(10)]
+    reader.update(makeMessages(lines), 1.0)
+    scannedRows = reader.scannedRows
+    lines.append(makeLine('text', 10))
+    reader.update(makeMessages(lines), 2.0)
+    assert reader.scannedRows - scannedRows < 3 * lineHeight
+
+
+def test_should_not_report_known_loot_when_panel_is_redrawn():
+    reader = LootMessagesReader()
+    lines = [makeLine('text', i) for i in range(9)] + [makeLine('loot')]
+    reader.update(makeMessages(lines), 1.0)
+    reader.update(np.full((10 * lineHeight, 300), 40, dtype=np.uint8), 2.0)
+    assert reader.update(makeMessages(lines), 3.0) == []
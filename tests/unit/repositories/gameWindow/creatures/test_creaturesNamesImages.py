@@ -0,0 +1,46 @@
+import numpy as np
+from src.repositories.gameWindow.creaturesNamesImages import CreaturesNamesImages, getScriptCreaturesNames
+
+
+def loadImage(name: str) -> np.ndarray:
+    if name == 'Missing':
+        raise FileNotFoundError(name)
+    return np.full((11, len(name)), 0, dtype=np.uint8)
+
+
+def test_should_load_names_on_demand_and_evict_least_recently_used(mocker):
+    loadImageSpy = mocker.Mock(side_effect=loadImage)
+    creaturesNamesImages = CreaturesNamesImages(loadImageSpy, {'Rat', 'Cave Rat', 'Troll', 'Missing'}, maxImages=2)
+    assert creaturesNamesImages.getLoadedNames() == ()
+    assert creaturesNamesImages.get('Rat').shape == (11, 3)
+    assert creaturesNamesImages.get('Cave Rat') is not None
+    assert creaturesNamesImages.get('Rat') is not None
+    assert creaturesNamesImages.get('Troll') is not None
+    assert creaturesNamesImages.getLoadedNames() == ('Rat', 'Troll')
+    assert creaturesNamesImages.get('Dragon') is None
+    assert creaturesNamesImages.get('Missing') is None
+    assert 'Missing' not in creaturesNamesImages
+    assert loadImageSpy.call_count == 4
+
+
+def test_should_never_evict_pinned_names():
+    creaturesNamesImages = CreaturesNamesImages(loadImage, {'Rat', 'Cave Rat', 'Troll', 'Dragon'}, maxImages=1)
+    creaturesNamesImages.pin(['Rat', 'Cave Rat', 'Unknown'])
+    creaturesNamesImages.get('Troll')
+    creaturesNamesImages.get('Dragon')
+    assert set(creaturesNamesImages.getLoadedNames()) == {'Rat', 'Cave Rat', 'Dragon'}
+    creaturesNamesImages.pin(['Troll'])
+    assert set(creaturesNamesImages.getLoadedNames()) == {'Troll', 'Dragon'}
+
+
+def test_should_get_script_creatures_names():
+    context = {
+        'ng_targeting': {'creatures': {'Rat': {'ignore': False}}},
+        'ignorable_creatures': ['Cave Rat'],
+        'ng_cave': {'waypoints': {'items': [
+            {'label': '', 'options': {}},
+            {'label': 'Troll', 'options': {'creatures': ['Dragon'], 'amount': 2}},
+        ]}},
+    }
+    assert getScriptCreaturesNames(context) == {'Rat', 'Cave Rat', 'Troll', 'Dragon'}
+    assert getScriptCreaturesNames({}) == set()
@@ -0,0 +1,32 @@
+import numpy as np
+from src.repositories.gameWindow.creatures import matchCreaturesNames, nonCreatureNamePixels
+
+
+def getNameImg(width, letters):
+    nameImg = np.full((11, width), 255, dtype=np.uint8)
+    for (y, x) in letters:
+        nameImg[y, x] = 0
+    return nameImg
+
+
+def test_should_match_every_bar_against_every_name():
+    gameWindowImage = np.full((60, 100), 5, dtype=np.uint8)
+    firstNameImg = getNameImg(20, [(2, 3), (5, 10), (8, 17)])
+    secondNameImg = getNameImg(20, [(1, 1), (6, 6)])
+    namesImgs = np.stack([firstNameImg, secondNameImg])
+    namesWidths = np.array([20, 20], dtype=np.int64)
+    creaturesBars = np.array([[10, 20], [60, 40]], dtype=np.int64)
+    # name centered over the first bar: x from 10 + 13 - 10, y from 20 - 13
+    gameWindowImage[7:18, 13:33][firstNameImg == 0] = 192
+    gameWindowImage[27:38, 64:84][secondNameImg == 0] = 0
+    matches = matchCreaturesNames(gameWindowImage, nonCreatureNamePixels, creaturesBars, namesImgs, namesWidths)
+    assert matches.tolist() == [[True, False], [False, True]]
+
+
+def test_should_match_name_shifted_one_pixel():
+    gameWindowImage = np.full((60, 100), 5, dtype=np.uint8)
+    nameImg = getNameImg(20, [(2, 3), (5, 10), (8, 17)])
+    gameWindowImage[7:18, 14:34][nameImg == 0] = 192
+    matches = matchCreaturesNames(gameWindowImage, nonCreatureNamePixels, np.array(
+        [[10, 20]], dtype=np.int64), nameImg[None, :, :], np.array([20], dtype=np.int64))
+    assert matches.tolist() == [[True]]
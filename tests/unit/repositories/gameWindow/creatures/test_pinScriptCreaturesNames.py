@@ -0,0 +1,17 @@
+from src.repositories.gameWindow.creatures import invalidateScriptCreaturesNames, pinScriptCreaturesNames
+
+
+def test_should_pin_script_creatures_only_after_an_invalidation(mocker):
+    mocker.patch.dict('src.repositories.gameWindow.creatures._pinnedCreaturesNames', {'version': 0, 'pinnedVersion': -1})
+    pinSpy = mocker.patch('src.repositories.gameWindow.creatures.creaturesNamesHashes.pin')
+    context = {'ignorable_creatures': ['Rat']}
+    pinScriptCreaturesNames(context)
+    pinScriptCreaturesNames(context)
+    pinSpy.assert_called_once_with({'Rat'})
+    context['ignorable_creatures'].append('Troll')
+    pinScriptCreaturesNames(context)
+    assert pinSpy.call_count == 1
+    invalidateScriptCreaturesNames()
+    pinScriptCreaturesNames(context)
+    assert pinSpy.call_count == 2
+    pinSpy.assert_called_with({'Rat', 'Troll'})
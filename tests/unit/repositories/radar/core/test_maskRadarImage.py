@@ -0,0 +1,14 @@
+import numpy as np
+from src.repositories.radar.core import maskRadarImage
+
+
+def test_should_mask_center_and_border_of_a_copy():
+    screenshot = np.zeros((120, 120), dtype=np.uint8)
+    screenshot.flags.writeable = False
+    radarImage = screenshot[4:114, 4:110]
+    maskedRadarImage = maskRadarImage(radarImage)
+    assert np.all(radarImage == 0)
+    assert np.all(maskedRadarImage[55 - 4:55 + 4, 53 - 4:53 + 4] == 128)
+    assert np.all(maskedRadarImage[:2, :] == 128)
+    assert np.all(maskedRadarImage[:, -2:] == 128)
+    assert maskedRadarImage[20, 20] == 0
@@ -0,0 +1,39 @@
+import numpy as np
+from src.repositories.radar.floorsMaps import WalkableFloorsSqms, buildFloorsMaps, getWalkableFloorSqms, loadFloorsMaps
+
+
+def getFloorsMaps(tmp_path):
+    floorsImgs = [np.full((4, 12), floor, dtype=np.uint8) for floor in range(3)]
+    floorsPathsImgs = [np.full((4, 12), 100, dtype=np.uint8) for _ in range(3)]
+    floorsPathsImgs[1][2, 9] = 105
+    floorsPathsImgs[2][0, 0] = 226
+    floorsPathsSqms = np.stack(floorsPathsImgs)
+    path = f'{tmp_path}/floorsMaps.v1'
+    buildFloorsMaps(floorsImgs, floorsPathsImgs, floorsPathsSqms, path)
+    return loadFloorsMaps(path), floorsImgs, floorsPathsImgs, floorsPathsSqms
+
+
+def test_should_load_memory_mapped_floors_maps(tmp_path):
+    floorsMaps, floorsImgs, _, floorsPathsSqms = getFloorsMaps(tmp_path)
+    assert isinstance(floorsMaps['imgs'], np.memmap)
+    assert np.array_equal(floorsMaps['imgs'], np.stack(floorsImgs))
+    assert np.array_equal(floorsMaps['frictions'], floorsPathsSqms)
+    assert floorsMaps['walkableBits'].shape == (3, 4, 2)
+
+
+def test_should_return_None_when_floors_maps_are_missing(tmp_path):
+    assert loadFloorsMaps(f'{tmp_path}/missing') is None
+
+
+def test_should_unpack_walkable_floors_sqms_like_the_array_it_replaces(tmp_path):
+    floorsMaps, _, floorsPathsImgs, _ = getFloorsMaps(tmp_path)
+    walkableFloorsSqms = WalkableFloorsSqms(floorsMaps['walkableBits'], 12, maxFloors=2)
+    expectedWalkableFloorsSqms = np.stack([getWalkableFloorSqms(floorPathsImg) for floorPathsImg in floorsPathsImgs])
+    assert len(walkableFloorsSqms) == 3
+    assert np.array_equal(walkableFloorsSqms[1], expectedWalkableFloorsSqms[1])
+    assert np.array_equal(walkableFloorsSqms[1][1:3, 8:11], expectedWalkableFloorsSqms[1, 1:3, 8:11])
+    assert walkableFloorsSqms[1, 2, 9] == 0
+    assert walkableFloorsSqms[2, 0, 0] == 0
+    assert walkableFloorsSqms[0, 0, 0] == 1
+    assert walkableFloorsSqms.getUnpackedFloors() == (2, 0)
+    assert walkableFloorsSqms[1].flags.writeable == False
@@ -0,0 +1,59 @@
+import threading
+import numpy as np
+from src.repositories.radar import regions
+from src.repositories.radar.regions import RegionsGraph, accessPointPixelColor, buildRegionsGraph, getRoute, isRegionsGraphLoading, resetRegionsGraph
+
+
+def getCoordinate(x, y, z):
+    return (31744 + x, 30976 + y, z)
+
+
+def getRegionsGraph():
+    walkableFloorsSqms = np.zeros((2, 64, 96), dtype=np.uint8)
+    floorsImgs = [np.zeros((64, 96), dtype=np.uint8), np.zeros((64, 96), dtype=np.uint8)]
+    walkableFloorsSqms[0, 5:11, 0:96] = 1
+    walkableFloorsSqms[1, 5:13, 85:96] = 1
+    walkableFloorsSqms[1, 40:50, 0:10] = 1
+    floorsImgs[0][8, 90] = accessPointPixelColor
+    floorsImgs[1][8, 90] = accessPointPixelColor
+    return RegionsGraph(buildRegionsGraph(walkableFloorsSqms, floorsImgs), walkableFloorsSqms)
+
+
+def test_should_return_goal_when_it_is_in_the_same_region():
+    regionsGraph = getRegionsGraph()
+    assert regionsGraph.getRoute(getCoordinate(2, 7, 0), getCoordinate(20, 9, 0)) == [getCoordinate(20, 9, 0)]
+
+
+def test_should_cross_sectors_and_floors():
+    regionsGraph = getRegionsGraph()
+    route = regionsGraph.getRoute(getCoordinate(2, 7, 0), getCoordinate(93, 11, 1))
+    assert route[-3:] == [getCoordinate(90, 8, 0), getCoordinate(90, 8, 1), getCoordinate(93, 11, 1)]
+    assert [checkpoint[0] for checkpoint in route[:-3]] == [32 + 31744, 64 + 31744]
+    assert [checkpoint[2] for checkpoint in route[:-3]] == [0, 0]
+
+
+def test_should_return_None_when_goal_is_unreachable():
+    regionsGraph = getRegionsGraph()
+    assert regionsGraph.getRoute(getCoordinate(2, 7, 0), getCoordinate(5, 45, 1)) is None
+    assert regionsGraph.getRoute(getCoordinate(2, 30, 0), getCoordinate(20, 9, 0)) is None
+
+
+def test_should_load_regions_graph_in_background(mocker):
+    loaded = threading.Event()
+    regionsGraph = getRegionsGraph()
+
+    def loadRegionsGraph(path):
+        loaded.wait(1.0)
+        return regionsGraph
+    mocker.patch('src.repositories.radar.regions.loadRegionsGraph', side_effect=loadRegionsGraph)
+    resetRegionsGraph()
+    try:
+        assert getRoute(getCoordinate(2, 7, 0), getCoordinate(20, 9, 0)) is None
+        assert isRegionsGraphLoading() == True
+        loaded.set()
+        regions._regionsGraph['loader'].join(1.0)
+        assert isRegionsGraphLoading() == False
+        assert getRoute(getCoordinate(2, 7, 0), getCoordinate(20, 9, 0)) == [getCoordinate(20, 9, 0)]
+        assert regions.loadRegionsGraph.call_count == 1
+    finally:
+        resetRegionsGraph()
@@ -0,0 +1,29 @@
+import numpy as np
+from src.repositories.radar.tilesIndex import buildFloorTilesIndex, getCandidatesPositions, makePaletteLut
+
+
+palette = np.array([0, 60, 76, 93, 102, 111, 120, 136, 153, 207, 213, 255], dtype=np.uint8)
+floorImg = np.random.default_rng(7).choice(palette, size=(256, 320)).astype(np.uint8)
+lut = makePaletteLut(palette)
+index = buildFloorTilesIndex(floorImg, lut)
+
+
+def test_should_return_crop_position_as_best_candidate():
+    radarImage = floorImg[37:146, 101:207].copy()
+    candidates = getCandidatesPositions(radarImage, lut, index)
+    assert candidates[0][:2] == (101, 37)
+
+
+def test_should_ignore_masked_pixels_and_small_noise():
+    radarImage = floorImg[100:209, 50:156].copy()
+    ignoreMask = np.zeros(radarImage.shape, dtype=bool)
+    ignoreMask[50:58, 49:57] = True
+    radarImage[ignoreMask] = 128
+    radarImage = np.clip(radarImage.astype(np.int16) + 1, 0, 255).astype(np.uint8)
+    candidates = getCandidatesPositions(radarImage, lut, index, ignoreMask=ignoreMask)
+    assert candidates[0][:2] == (50, 100)
+
+
+def test_should_return_empty_list_when_crop_is_not_in_floor():
+    radarImage = np.full((109, 106), 255, dtype=np.uint8)
+    assert getCandidatesPositions(radarImage, lut, index) == []
@@ -0,0 +1,60 @@
+import os
+import numpy as np
+from src.utils import assets
+from src.utils.assets import buildAssetsBundle, getAssetKey, getSourceStamp, loadAssetsBundle
+
+
+def createSource(tmp_path, name: str, content: bytes = b'png') -> str:
+    path = tmp_path / 'src' / 'images' / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_should_get_asset_key_only_for_templates_under_src(mocker, tmp_path):
+    mocker.patch.object(assets, 'rootPath', tmp_path)
+    assert getAssetKey(str(tmp_path / 'src' / 'images' / 'a.png')) == 'src/images/a.png'
+    assert getAssetKey(str(tmp_path / 'debug' / 'screenshot.png')) is None
+    assert getAssetKey(str(tmp_path / 'src' / 'repositories' / 'radar' / 'images' / 'floor-7.png')) is None
+
+
+def test_should_load_bundled_images_while_sources_are_unchanged(mocker, tmp_path):
+    mocker.patch.object(assets, 'rootPath', tmp_path)
+    firstPath = createSource(tmp_path, 'first.png')
+    secondPath = createSource(tmp_path, 'second.png')
+    first = np.arange(6, dtype=np.uint8).reshape(2, 3)
+    second = np.full((4, 1), 9, dtype=np.uint8)
+    bundlePath = str(tmp_path / 'npys' / 'assets')
+    buildAssetsBundle({
+        getAssetKey(firstPath): (first, getSourceStamp(firstPath)),
+        getAssetKey(secondPath): (second, getSourceStamp(secondPath)),
+    }, bundlePath)
+    bundle = loadAssetsBundle(bundlePath)
+    assert bundle is not None
+    image = bundle.getImage('src/images/first.png', getSourceStamp(firstPath))
+    assert np.array_equal(image, first)
+    assert type(image) is np.ndarray
+    assert np.array_equal(bundle.getImage('src/images/second.png', getSourceStamp(secondPath)), second)
+    createSource(tmp_path, 'second.png', b'changed png')
+    assert bundle.getImage('src/images/second.png', getSourceStamp(secondPath)) is None
+    assert bundle.getImage('src/images/missing.png', (0, 0)) is None
+
+
+def test_should_rebuild_bundle_with_decoded_images(mocker, tmp_path):
+    mocker.patch.object(assets, 'rootPath', tmp_path)
+    bundlePath = str(tmp_path / 'npys' / 'assets')
+    mocker.patch.dict(assets._assets, {'enabled': True, 'bundle': None, 'loaded': True, 'decoded': {}})
+    keptPath = createSource(tmp_path, 'kept.png')
+    kept = np.full((2, 2), 1, dtype=np.uint8)
+    buildAssetsBundle({getAssetKey(keptPath): (kept, getSourceStamp(keptPath))}, bundlePath)
+    oldDataFile = loadAssetsBundle(bundlePath).dataFile
+    assets._assets['bundle'] = loadAssetsBundle(bundlePath)
+    assert assets.rebuildAssetsBundleIfStale(bundlePath) is False
+    newPath = createSource(tmp_path, 'new.png')
+    new = np.full((1, 3), 2, dtype=np.uint8)
+    assets.recordDecodedImage(newPath, new)
+    assert assets.rebuildAssetsBundleIfStale(bundlePath) is True
+    bundle = loadAssetsBundle(bundlePath)
+    assert np.array_equal(bundle.getImage('src/images/kept.png', getSourceStamp(keptPath)), kept)
+    assert np.array_equal(bundle.getImage('src/images/new.png', getSourceStamp(newPath)), new)
+    assert not os.path.exists(oldDataFile) or os.name == 'nt'
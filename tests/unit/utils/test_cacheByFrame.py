@@ -0,0 +1,89 @@
+import threading
+import numpy as np
+from src.utils import core
+from src.utils.core import cacheByFrame, cacheObjectPosition
+from src.utils.layout import beginFrame
+
+
+def test_should_call_once_per_frame_and_arguments(mocker):
+    reader = mocker.Mock(side_effect=lambda screenshot, slot: slot * 2)
+    cachedReader = cacheByFrame(reader)
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    assert cachedReader(screenshot, 1) == 2
+    assert cachedReader(screenshot, 1) == 2
+    assert cachedReader(screenshot, 2) == 4
+    assert reader.call_count == 2
+    beginFrame(screenshot)
+    assert cachedReader(screenshot, 1) == 2
+    assert reader.call_count == 3
+    beginFrame(None)
+
+
+def test_should_call_through_when_screenshot_is_not_current_frame(mocker):
+    reader = mocker.Mock(return_value=None)
+    cachedReader = cacheByFrame(reader)
+    currentScreenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(currentScreenshot)
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    cachedReader(screenshot)
+    cachedReader(screenshot)
+    assert reader.call_count == 2
+    beginFrame(None)
+
+
+def test_should_call_through_when_arguments_are_unhashable(mocker):
+    reader = mocker.Mock(return_value=1)
+    cachedReader = cacheByFrame(reader)
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    cachedReader(screenshot, [1, 2])
+    cachedReader(screenshot, [1, 2])
+    assert reader.call_count == 2
+    beginFrame(None)
+
+
+def test_should_not_share_results_between_threads(mocker):
+    reader = mocker.Mock(return_value=1)
+    cachedReader = cacheByFrame(reader)
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    cachedReader(screenshot, 1)
+    thread = threading.Thread(target=cachedReader, args=(screenshot, 1))
+    thread.start()
+    thread.join()
+    cachedReader(screenshot, 1)
+    assert reader.call_count == 2
+    beginFrame(None)
+
+
+def test_should_drop_results_on_reset(mocker):
+    reader = mocker.Mock(return_value=1)
+    cachedReader = cacheByFrame(reader)
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    cachedReader(screenshot)
+    cachedReader.reset_cache()
+    cachedReader(screenshot)
+    assert reader.call_count == 2
+    beginFrame(None)
+
+
+def test_should_verify_cached_object_position_once_per_frame(mocker):
+    screenshot = np.random.default_rng(0).integers(0, 256, (20, 20), dtype=np.uint8)
+    locate = mocker.Mock(return_value=(2, 3, 4, 5))
+    hashSpy = mocker.spy(core, 'hashit')
+    cachedLocate = cacheObjectPosition(locate)
+    beginFrame(screenshot)
+    assert cachedLocate(screenshot) == (2, 3, 4, 5)
+    assert cachedLocate(screenshot) == (2, 3, 4, 5)
+    assert locate.call_count == 1
+    assert hashSpy.call_count == 1
+    beginFrame(screenshot)
+    assert cachedLocate(screenshot) == (2, 3, 4, 5)
+    assert locate.call_count == 1
+    assert hashSpy.call_count == 2
+    cachedLocate.reset_cache()
+    assert cachedLocate(screenshot) == (2, 3, 4, 5)
+    assert locate.call_count == 2
+    beginFrame(None)
@@ -0,0 +1,83 @@
+import numpy as np
+from src.utils.capture import CaptureThread, LatestFrameRing
+
+
+def test_should_return_no_frame_when_nothing_was_published():
+    ring = LatestFrameRing()
+    assert ring.latest() == (0, None)
+
+
+def test_should_return_latest_published_frame_with_its_seq():
+    ring = LatestFrameRing()
+    ring.publish(np.full((2, 2), 1, dtype=np.uint8))
+    ring.publish(np.full((2, 2), 2, dtype=np.uint8))
+    seq, frame = ring.latest()
+    assert seq == 2
+    assert np.all(frame == 2)
+
+
+def test_should_not_overwrite_frame_held_by_reader():
+    ring = LatestFrameRing(3)
+    ring.publish(np.full((2, 2), 1, dtype=np.uint8))
+    _, frame = ring.latest()
+    for value in range(2, 10):
+        ring.publish(np.full((2, 2), value, dtype=np.uint8))
+    assert np.all(frame == 1)
+    seq, latestFrame = ring.latest()
+    assert seq == 9
+    assert np.all(latestFrame == 9)
+
+
+
+def test_should_read_again_when_a_frame_is_published_while_marking_the_slot():
+    ring = LatestFrameRing(3)
+    ring.publish(np.full((2, 2), 1, dtype=np.uint8))
+
+    class PublishingReaderSlots(list):
+        published = False
+
+        def __setitem__(self, index, slot):
+            super().__setitem__(index, slot)
+            if not self.published:
+                # The writer published between the read and the mark.
+                self.published = True
+                ring.publish(np.full((2, 2), 2, dtype=np.uint8))
+
+    ring._readerSlots = PublishingReaderSlots(ring._readerSlots)
+    seq, frame = ring.latest()
+    assert seq == 2
+    assert np.all(frame == 2)
+    assert ring._readerSlots[0] == ring._published[1]
+
+def test_should_reuse_preallocated_buffers():
+    ring = LatestFrameRing(3)
+    buffers = []
+    for value in range(6):
+        ring.publish(np.full((2, 2), value, dtype=np.uint8))
+        buffers.append(id(ring.latest()[1]))
+    assert len(set(buffers)) == 3
+
+
+def test_should_publish_frames_grabbed_by_capture_thread():
+    frames = iter([np.full((2, 2), value, dtype=np.uint8) for value in range(1, 4)])
+    captureThread = CaptureThread(lambda: next(frames, None))
+    captureThread.start()
+    try:
+        seq, frame = captureThread.waitForFrame(2, timeout=2.0)
+    finally:
+        captureThread.stop()
+    assert seq >= 3
+    assert np.all(frame == 3)
+
+
+def test_should_not_overwrite_frames_held_by_any_reader():
+    ring = LatestFrameRing(3, readers=2)
+    assert ring.size == 4
+    ring.publish(np.full((2, 2), 1, dtype=np.uint8))
+    _, pilotFrame = ring.latest(0)
+    ring.publish(np.full((2, 2), 2, dtype=np.uint8))
+    _, healingFrame = ring.latest(1)
+    for value in range(3, 10):
+        ring.publish(np.full((2, 2), value, dtype=np.uint8))
+    assert np.all(pilotFrame == 1)
+    assert np.all(healingFrame == 2)
@@ -0,0 +1,53 @@
+import threading
+import time
+import numpy as np
+from src.utils.core import getScreenshot, setCaptureRoi
+
+
+frame = np.random.default_rng(0).integers(1, 256, (60, 80, 4), dtype=np.uint8)
+
+
+def test_should_convert_only_the_region(mocker):
+    camera = mocker.patch('src.utils.core.camera')
+    camera.grab.return_value = frame
+    setCaptureRoi(None)
+    screenshot = getScreenshot(region=(10, 5, 70, 55))
+    assert screenshot.shape == (50, 60)
+    assert camera.grab.call_count == 1
+
+
+def test_should_convert_only_roi_regions(mocker):
+    camera = mocker.patch('src.utils.core.camera')
+    camera.grab.return_value = frame
+    setCaptureRoi(None)
+    fullScreenshot = getScreenshot(region=(10, 5, 70, 55)).copy()
+    setCaptureRoi([(0, 0, 10, 10), (20, 30, 15, 5)])
+    screenshot = getScreenshot(region=(10, 5, 70, 55))
+    setCaptureRoi(None)
+    assert screenshot.shape == fullScreenshot.shape
+    assert np.array_equal(screenshot[0:10, 0:10], fullScreenshot[0:10, 0:10])
+    assert np.array_equal(screenshot[30:35, 20:35], fullScreenshot[30:35, 20:35])
+    assert int(screenshot[40:, :].max()) == 0
+
+
+def test_should_serialize_grabs_of_every_thread(mocker):
+    camera = mocker.patch('src.utils.core.camera')
+    grabbing = []
+    overlaps = []
+
+    def grab():
+        overlaps.append(len(grabbing))
+        grabbing.append(True)
+        time.sleep(0.01)
+        grabbing.pop()
+        return frame
+
+    camera.grab.side_effect = grab
+    setCaptureRoi(None)
+    threads = [threading.Thread(target=getScreenshot, kwargs={'region': (10, 5, 70, 55)}) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert camera.grab.call_count == 4
+    assert overlaps == [0, 0, 0, 0]
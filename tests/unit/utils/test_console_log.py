@@ -0,0 +1,19 @@
+from src.utils import console_log
+from src.utils.console_log import is_log_due, log_throttled
+
+
+def test_should_be_due_once_per_interval(mocker):
+    mocker.patch.dict(console_log._last_by_key, clear=True)
+    mocker.patch('src.utils.console_log.time.time', side_effect=[100.0, 101.0, 102.5])
+    assert is_log_due('status', 2.0) is True
+    assert is_log_due('status', 2.0) is False
+    assert is_log_due('status', 2.0) is True
+
+
+def test_should_log_throttled_messages_once_per_interval(mocker):
+    mocker.patch.dict(console_log._last_by_key, clear=True)
+    mocker.patch('src.utils.console_log.time.time', side_effect=[100.0, 101.0])
+    logSpy = mocker.patch('src.utils.console_log.log')
+    log_throttled('status', 'info', 'first', 2.0)
+    log_throttled('status', 'info', 'second', 2.0)
+    logSpy.assert_called_once_with('info', 'first')
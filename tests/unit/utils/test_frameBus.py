@@ -0,0 +1,90 @@
+import os
+import numpy as np
+from src.utils import frameBus
+from src.utils.frameBus import FrameBusPublisher, SharedFrameRing, closeFrameBusReaders, parseClient, readFrameBus
+
+
+def getClient(name: str) -> str:
+    return f'test_{os.getpid()}_{name}'
+
+
+def test_should_read_published_frames_from_attached_ring():
+    writer = SharedFrameRing.create(getClient('ring'), 8, 4)
+    reader = SharedFrameRing.attach(getClient('ring'))
+    try:
+        assert reader.latest() == (0, None)
+        writer.publish(np.full((4, 8), 1, dtype=np.uint8))
+        writer.publish(np.full((2, 3), 2, dtype=np.uint8))
+        seq, frame = reader.latest()
+        assert seq == 2
+        assert frame.shape == (2, 3)
+        assert np.all(frame == 2)
+        assert np.shares_memory(frame, reader.slots[0]) or np.shares_memory(frame, reader.slots[1]) or np.shares_memory(frame, reader.slots[2])
+        assert not frame.flags.writeable
+        del frame
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_should_not_overwrite_frame_held_by_reader():
+    writer = SharedFrameRing.create(getClient('held'), 4, 4)
+    reader = SharedFrameRing.attach(getClient('held'))
+    try:
+        writer.publish(np.full((4, 4), 1, dtype=np.uint8))
+        _, frame = reader.latest()
+        for value in range(2, 10):
+            writer.publish(np.full((4, 4), value, dtype=np.uint8))
+        assert np.all(frame == 1)
+        seq, latestFrame = reader.latest()
+        assert seq == 9
+        assert np.all(latestFrame == 9)
+        del frame, latestFrame
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_should_publish_requested_region_of_each_client():
+    fullFrame = np.arange(40 * 60, dtype=np.uint32).reshape(40, 60).astype(np.uint8)
+    rings = {
+        'main': SharedFrameRing.create(getClient('main'), 20, 10),
+        'alt': SharedFrameRing.create(getClient('alt'), 20, 10),
+    }
+    publisher = FrameBusPublisher(rings, lambda: fullFrame)
+    try:
+        assert publisher.publishFrame(fullFrame) == 0
+        rings['main'].setRequest((5, 7, 20, 10))
+        rings['alt'].setRequest((30, 20, 10, 5))
+        assert publisher.publishFrame(fullFrame) == 2
+        assert np.array_equal(rings['main'].latest()[1], fullFrame[7:17, 5:25])
+        assert np.array_equal(rings['alt'].latest()[1], fullFrame[20:25, 30:40])
+    finally:
+        publisher.close()
+
+
+def test_should_read_frame_bus_region_and_fall_back_without_publisher():
+    client = getClient('bus')
+    frameBus.attachRetryInterval = 0.0
+    try:
+        assert readFrameBus(client, (0, 0, 4, 2), wait=0.0) == (0, None)
+        ring = SharedFrameRing.create(client, 8, 8)
+        fullFrame = np.arange(64, dtype=np.uint8).reshape(8, 8)
+        publisher = FrameBusPublisher({'bus': ring}, lambda: fullFrame)
+        try:
+            # The first read registers the region: no frame for it yet.
+            assert readFrameBus(client, (2, 3, 4, 2), wait=0.0) == (0, None)
+            publisher.publishFrame(fullFrame)
+            seq, frame = readFrameBus(client, (2, 3, 4, 2), wait=0.0)
+            assert seq == 1
+            assert np.array_equal(frame, fullFrame[3:5, 2:6])
+            del frame
+        finally:
+            closeFrameBusReaders()
+            publisher.close()
+    finally:
+        frameBus.attachRetryInterval = 2.0
+
+
+def test_should_parse_client_argument():
+    assert parseClient('main:1920x1080') == ('main', 1920, 1080)
@@ -0,0 +1,45 @@
+import threading
+import time
+from src.utils.inputQueue import InputQueue, normalPriority, urgentPriority
+
+
+def waitForWaiters(queue: InputQueue, count: int) -> None:
+    deadline = time.perf_counter() + 2.0
+    while queue.getWaitingCount() < count and time.perf_counter() < deadline:
+        time.sleep(0.001)
+
+
+def test_should_send_urgent_input_before_queued_normal_input():
+    queue = InputQueue()
+    sent = []
+
+    def send(name: str, priority: int) -> None:
+        with queue.hold(priority):
+            sent.append(name)
+
+    with queue.hold():
+        cavebot = threading.Thread(target=send, args=('cavebot', normalPriority))
+        cavebot.start()
+        waitForWaiters(queue, 1)
+        healing = threading.Thread(target=send, args=('healing', urgentPriority))
+        healing.start()
+        waitForWaiters(queue, 2)
+    cavebot.join(2.0)
+    healing.join(2.0)
+    assert sent == ['healing', 'cavebot']
+
+
+def test_should_be_reentrant_for_the_holding_thread():
+    queue = InputQueue()
+    with queue.hold():
+        with queue.hold():
+            pass
+        assert queue._owner == threading.get_ident()
+    assert queue._owner is None
+
+
+def test_should_use_thread_priority_by_default():
+    queue = InputQueue()
+    assert queue.getThreadPriority() == normalPriority
+    queue.setThreadPriority(urgentPriority)
+    assert queue.getThreadPriority() == urgentPriority
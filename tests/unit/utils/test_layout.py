@@ -0,0 +1,66 @@
+import numpy as np
+from src.utils.layout import beginFrame, getCaptureRegions, getCurrentFrameSeq, getFrameSeq, getRelayoutAnchors, isCurrentFrame, recordAnchorStatus, registerAnchor, resetLayout, setCaptureGeometry, setCaptureRegion
+
+
+def test_should_increment_frame_seq_when_beginning_a_frame():
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    seq = getFrameSeq()
+    assert beginFrame(screenshot) == seq + 1
+    assert getFrameSeq() == seq + 1
+
+
+def test_should_recognize_current_frame():
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    otherScreenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    assert isCurrentFrame(screenshot) == True
+    assert isCurrentFrame(otherScreenshot) == False
+    assert isCurrentFrame(None) == False
+
+
+def test_should_return_seq_of_current_frame_only():
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    seq = beginFrame(screenshot)
+    assert getCurrentFrameSeq(screenshot) == seq
+    assert getCurrentFrameSeq(np.zeros((10, 10), dtype=np.uint8)) is None
+    beginFrame(None)
+    assert getCurrentFrameSeq(screenshot) is None
+
+
+def test_should_return_anchors_relayouted_in_current_frame():
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    recordAnchorStatus('verifiedAnchor', True, (0, 0, 1, 1))
+    recordAnchorStatus('relayoutAnchor', False, (1, 1, 1, 1))
+    assert getRelayoutAnchors() == ['relayoutAnchor']
+    beginFrame(screenshot)
+    assert getRelayoutAnchors() == []
+
+
+def test_should_return_recent_capture_regions_and_anchors():
+    resetLayout()
+    screenshot = np.zeros((10, 10), dtype=np.uint8)
+    beginFrame(screenshot)
+    setCaptureRegion('radar', (1, 2, 3, 4))
+    recordAnchorStatus('anchor', True, (5, 6, 7, 8))
+    assert sorted(getCaptureRegions(maxAge=2)) == [(1, 2, 3, 4), (5, 6, 7, 8)]
+    beginFrame(screenshot)
+    setCaptureRegion('gameWindow', (0, 0, 5, 5))
+    beginFrame(screenshot)
+    assert getCaptureRegions(maxAge=2) == [(0, 0, 5, 5)]
+    resetLayout()
+    assert getCaptureRegions() == []
+
+
+def test_should_reset_layout_only_when_capture_geometry_changes(mocker):
+    resetCache = mocker.Mock()
+    mocker.patch.dict('src.utils.layout._anchors')
+    registerAnchor('testAnchor', mocker.Mock(reset_cache=resetCache))
+    setCaptureGeometry((1, (800, 600), 0))
+    resetCache.reset_mock()
+    assert setCaptureGeometry((1, (800, 600), 0)) == False
+    resetCache.assert_not_called()
+    assert setCaptureGeometry((1, (1024, 768), 0)) == True
+    resetCache.assert_called_once()
+    assert setCaptureGeometry((1, (1024, 768), 0)) == False
+    resetCache.assert_called_once()
@@ -0,0 +1,48 @@
+import cv2
+import numpy as np
+from src.utils import core
+from src.utils.core import getScaledTemplate, locateAnyMultiScale, locateMultiScale
+
+
+rng = np.random.default_rng(0)
+template = cv2.resize(rng.integers(0, 256, (6, 8), dtype=np.uint8), (32, 24), interpolation=cv2.INTER_NEAREST)
+otherTemplate = cv2.resize(rng.integers(0, 256, (6, 8), dtype=np.uint8), (32, 24), interpolation=cv2.INTER_NEAREST)
+
+
+def makeScreenshot(img: np.ndarray, x: int, y: int) -> np.ndarray:
+    screenshot = rng.integers(0, 256, (120, 160), dtype=np.uint8)
+    screenshot[y:y + img.shape[0], x:x + img.shape[1]] = img
+    return screenshot
+
+
+def test_should_locate_scaled_template():
+    scaled = getScaledTemplate(template, 1.25)
+    screenshot = makeScreenshot(scaled, 30, 40)
+    assert locateMultiScale(screenshot, template, scales=(0.9, 1.0, 1.25)) == (30, 40, 40, 30)
+
+
+def test_should_return_index_of_matched_template():
+    screenshot = makeScreenshot(otherTemplate, 70, 10)
+    assert locateAnyMultiScale(screenshot, [template, otherTemplate], scales=(1.0, 1.1)) == (1, (70, 10, 32, 24))
+
+
+def test_should_return_none_below_confidence():
+    screenshot = rng.integers(0, 256, (120, 160), dtype=np.uint8)
+    assert locateAnyMultiScale(screenshot, [template, otherTemplate], confidence=0.9) is None
+
+
+def test_should_cache_scaled_templates():
+    assert getScaledTemplate(template, 0.9) is getScaledTemplate(template, 0.9)
+    assert getScaledTemplate(template, 1.0) is template
+    uncached = rng.integers(0, 256, (10, 10), dtype=np.uint8)
+    assert getScaledTemplate(uncached, 0.9, cache=False) is not getScaledTemplate(uncached, 0.9, cache=False)
+
+
+def test_should_stop_at_the_first_confident_match(mocker):
+    screenshot = makeScreenshot(template, 5, 5)
+    matchTemplateSpy = mocker.spy(core.cv2, 'matchTemplate')
+    assert locateAnyMultiScale(screenshot, [template, otherTemplate], scales=(0.8, 0.9, 1.0, 1.1)) == (0, (5, 5, 32, 24))
+    assert matchTemplateSpy.call_count == 1
+    matchTemplateSpy.reset_mock()
+    assert locateAnyMultiScale(screenshot, [template, otherTemplate], scales=(0.8, 0.9, 1.0, 1.1), stopConfidence=None) == (0, (5, 5, 32, 24))
+    assert matchTemplateSpy.call_count == 8
@@ -0,0 +1,28 @@
+import cv2
+import numpy as np
+from src.utils import core
+from src.utils.obsws import ObsRequestError, ObsScreenshotClient
+
+
+frame = np.random.default_rng(0).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+
+
+def test_should_decode_bmp_and_png_to_the_same_gray_image():
+    bmp = core._decode_obs_image(cv2.imencode('.bmp', frame)[1].tobytes())
+    png = core._decode_obs_image(cv2.imencode('.png', frame)[1].tobytes())
+    np.testing.assert_array_equal(bmp, cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+    np.testing.assert_array_equal(png, bmp)
+
+
+def test_should_fall_back_to_png_when_obs_rejects_the_format(mocker, monkeypatch):
+    monkeypatch.setenv('FENRIL_OBS_SOURCE', 'tibia')
+    client = mocker.Mock(spec=ObsScreenshotClient)
+    client.getSourceScreenshot.side_effect = [
+        ObsRequestError('GetSourceScreenshot', 400), cv2.imencode('.png', frame)[1].tobytes()]
+    mocker.patch.object(core, '_obs_client', client)
+    mocker.patch.dict(core._CAPTURE_CFG, {'obs_image_format': 'bmp', 'obs_retry_on_none': True})
+    mocker.patch('src.utils.core.time.sleep')
+    screenshot = core._grab_obs_source_gray()
+    np.testing.assert_array_equal(screenshot, cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+    assert [call[0][0]['imageFormat'] for call in client.getSourceScreenshot.call_args_list] == ['bmp', 'png']
+    assert core._CAPTURE_CFG['obs_image_format'] == 'png'
@@ -0,0 +1,59 @@
+import base64
+import json
+import pytest
+from src.utils.obsws import ObsRequestError, ObsScreenshotClient, parseScreenshotResponse
+
+
+imageData = bytes(range(256)) * 4
+
+
+def makeResponse(prefix: str = 'data:image/bmp;base64,', result: bool = True, requestId: str = '1') -> bytes:
+    response = {'op': 7, 'd': {'requestType': 'GetSourceScreenshot', 'requestId': requestId, 'requestStatus': {'result': result, 'code': 100 if result else 400}}}
+    if result:
+        response['d']['responseData'] = {'imageData': prefix + base64.b64encode(imageData).decode()}
+    return json.dumps(response).encode()
+
+
+def test_should_decode_image_data_with_data_uri_prefix():
+    message = parseScreenshotResponse(makeResponse())
+    assert message['d']['responseData']['imageData'] == imageData
+    assert message['d']['requestStatus']['result'] is True
+
+
+def test_should_decode_image_data_without_prefix():
+    message = parseScreenshotResponse(makeResponse(prefix=''))
+    assert message['d']['responseData']['imageData'] == imageData
+
+
+def test_should_parse_messages_without_image_data():
+    message = parseScreenshotResponse(makeResponse(result=False))
+    assert message['d']['requestStatus']['result'] is False
+
+
+def test_should_skip_other_messages_and_return_image_bytes(mocker):
+    client = ObsScreenshotClient()
+    client.ws = mocker.Mock()
+    client.ws.recv_data.side_effect = [(1, b'{"op": 5, "d": {}}'), (1, makeResponse(requestId='1'))]
+    assert client.getSourceScreenshot({'sourceName': 'tibia'}) == imageData
+    sent = json.loads(client.ws.send.call_args[0][0])
+    assert sent['op'] == 6
+    assert sent['d']['requestData'] == {'sourceName': 'tibia'}
+
+
+def test_should_raise_request_error_when_obs_rejects_the_request(mocker):
+    client = ObsScreenshotClient()
+    client.ws = mocker.Mock()
+    client.ws.recv_data.return_value = (1, makeResponse(result=False))
+    with pytest.raises(ObsRequestError):
+        client.getSourceScreenshot({'sourceName': 'tibia'})
+    assert client.ws is not None
+
+
+def test_should_drop_the_connection_when_receiving_fails(mocker):
+    client = ObsScreenshotClient()
+    ws = client.ws = mocker.Mock()
+    ws.recv_data.side_effect = ConnectionError('closed')
+    with pytest.raises(ConnectionError):
+        client.getSourceScreenshot({'sourceName': 'tibia'})
+    ws.close.assert_called_once()
+    assert client.ws is None
@@ -0,0 +1,39 @@
+import json
+from src.utils.profiler import LatencyHistogram, TickProfiler, getBucketIndex, getBucketUpperBound
+
+
+def test_should_keep_bucket_upper_bound_above_recorded_value():
+    for seconds in [0.000001, 0.00005, 0.0012, 0.045, 0.3, 2.5]:
+        index = getBucketIndex(seconds)
+        assert getBucketUpperBound(index) >= seconds
+        assert getBucketUpperBound(index) <= seconds * 1.1
+
+
+def test_should_return_percentiles():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.001)
+    for _ in range(10):
+        histogram.record(0.020)
+    assert 0.001 <= histogram.getPercentile(50) <= 0.0011
+    assert 0.020 <= histogram.getPercentile(95) <= 0.022
+    assert histogram.getPercentile(99) == histogram.max
+    assert histogram.toDict()['count'] == 100
+
+
+def test_should_not_record_when_disabled():
+    profiler = TickProfiler()
+    assert profiler.run('middleware.radar', lambda context: context + 1, 1) == 2
+    assert profiler.histograms == {}
+
+
+def test_should_record_run_durations_and_dump_them(tmp_path):
+    profiler = TickProfiler(enabled=True)
+    profiler.run('middleware.radar', lambda: None)
+    profiler.record('tick', 0.040)
+    assert profiler.histograms['middleware.radar'].count == 1
+    assert profiler.getSummary(only=['tick']) == 'tick=40.0/40.0/40.0ms'
+    path = f'{tmp_path}/profile.json'
+    profiler.dumpJson(path)
+    with open(path) as file:
+        assert json.load(file)['tick']['p95_ms'] == 40.0
@@ -0,0 +1,56 @@
+import copy
+import pickle
+from src.utils import runtime_settings
+from src.utils.runtime_settings import RuntimeSettings, get_bool, get_float, get_int, get_str
+
+
+def test_should_resolve_settings_from_context_then_env(monkeypatch):
+    monkeypatch.setenv('FENRIL_TEST_INTERVAL_S', '0.5')
+    context = {'ng_runtime': RuntimeSettings({'enabled': 'yes', 'count': '3.0', 'name': 7})}
+    assert get_bool(context, 'ng_runtime.enabled', env_var='FENRIL_TEST_ENABLED') is True
+    assert get_int(context, 'ng_runtime.count', default=0) == 3
+    assert get_str(context, 'ng_runtime.name') == '7'
+    assert get_float(context, 'ng_runtime.interval_s', env_var='FENRIL_TEST_INTERVAL_S', default=1.0) == 0.5
+    assert get_float({}, 'ng_runtime.interval_s', default=1.0) == 1.0
+
+
+def test_should_reuse_resolved_settings_until_ng_runtime_changes(mocker):
+    context = {'ng_runtime': RuntimeSettings({'enabled': False})}
+    getBoolSpy = mocker.spy(runtime_settings, '_get_bool')
+    assert get_bool(context, 'ng_runtime.enabled', env_var='FENRIL_TEST_ENABLED') is False
+    assert get_bool(context, 'ng_runtime.enabled', env_var='FENRIL_TEST_ENABLED') is False
+    assert getBoolSpy.call_count == 1
+    context['ng_runtime']['enabled'] = True
+    assert get_bool(context, 'ng_runtime.enabled', env_var='FENRIL_TEST_ENABLED') is True
+    context['ng_runtime'].setdefault('enabled', False)
+    assert get_bool(context, 'ng_runtime.enabled', env_var='FENRIL_TEST_ENABLED') is True
+    assert getBoolSpy.call_count == 2
+    context['ng_runtime'].pop('enabled')
+    assert get_bool(context, 'ng_runtime.enabled', default=True) is True
+    assert getBoolSpy.call_count == 3
+
+
+def test_should_resolve_env_again_when_ng_runtime_changes(monkeypatch):
+    context = {'ng_runtime': RuntimeSettings()}
+    monkeypatch.setenv('FENRIL_TEST_COUNT', '1')
+    assert get_int(context, 'ng_runtime.count', env_var='FENRIL_TEST_COUNT', default=0) == 1
+    monkeypatch.setenv('FENRIL_TEST_COUNT', '2')
+    assert get_int(context, 'ng_runtime.count', env_var='FENRIL_TEST_COUNT', default=0) == 1
+    context['ng_runtime'].update({'other': True})
+    assert get_int(context, 'ng_runtime.count', env_var='FENRIL_TEST_COUNT', default=0) == 2
+
+
+def test_should_not_keep_nested_settings(mocker):
+    context = {'ng_runtime': RuntimeSettings({'task_timeouts': {'refill': 10}})}
+    assert get_float(context, 'ng_runtime.task_timeouts.refill', default=0.0) == 10.0
+    context['ng_runtime']['task_timeouts']['refill'] = 20
+    assert get_float(context, 'ng_runtime.task_timeouts.refill', default=0.0) == 20.0
+
+
+def test_should_copy_and_pickle_runtime_settings():
+    settings = RuntimeSettings({'enabled': True})
+    for copiedSettings in (copy.deepcopy(settings), pickle.loads(pickle.dumps(settings))):
+        assert isinstance(copiedSettings, RuntimeSettings)
+        assert copiedSettings == {'enabled': True}
+        copiedSettings['enabled'] = False
+        assert copiedSettings.version == 1
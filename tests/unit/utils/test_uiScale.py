@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+from src.utils import uiScale
+from src.utils.core import getScaledTemplate
+from src.utils.uiScale import configureUiScale, getScalesToTry, getUiScale, locateAtUiScale, resetUiScale, setUiScale
+
+
+rng = np.random.default_rng(0)
+template = cv2.resize(rng.integers(0, 256, (6, 8), dtype=np.uint8), (32, 24), interpolation=cv2.INTER_NEAREST)
+scales = (0.9, 1.0, 1.1, 1.25)
+
+
+def makeScreenshot(img: np.ndarray, x: int, y: int) -> np.ndarray:
+    screenshot = rng.integers(0, 256, (120, 160), dtype=np.uint8)
+    screenshot[y:y + img.shape[0], x:x + img.shape[1]] = img
+    return screenshot
+
+
+def setup_function():
+    resetUiScale()
+    configureUiScale(enabled=True)
+    uiScale._uiScale['persist'] = None
+
+
+def test_should_learn_scale_from_anchor_sweep():
+    screenshot = makeScreenshot(getScaledTemplate(template, 1.25), 30, 40)
+    assert getScalesToTry(scales) == scales
+    assert locateAtUiScale(screenshot, template, ((scales, 0.9),)) == (30, 40, 40, 30)
+    assert getUiScale() == 1.25
+    assert getScalesToTry(scales) == (1.25,)
+
+
+def test_should_try_learned_scale_only_once_known(mocker):
+    setUiScale(1.1)
+    locateMultiScaleSpy = mocker.patch('src.utils.uiScale.locateMultiScale', return_value=(1, 2, 35, 26))
+    assert locateAtUiScale(np.zeros((10, 10), dtype=np.uint8), template, ((scales, 0.9),)) == (1, 2, 35, 26)
+    locateMultiScaleSpy.assert_called_once_with(mocker.ANY, template, confidence=0.9, scales=(1.1,))
+
+
+def test_should_sweep_again_and_relearn_when_anchor_misses():
+    setUiScale(0.9)
+    screenshot = makeScreenshot(getScaledTemplate(template, 1.25), 30, 40)
+    assert locateAtUiScale(screenshot, template, ((scales, 0.9),)) == (30, 40, 40, 30)
+    assert getUiScale() == 1.25
+
+
+def test_should_learn_scale_of_sweep_instead_of_bbox_ratio():
+    screenshot = makeScreenshot(getScaledTemplate(template, 0.95), 30, 40)
+    assert locateAtUiScale(screenshot, template, (((0.9, 0.95, 1.0), 0.9),)) == (30, 40, 30, 23)
+    assert getUiScale() == 0.95
+
+
+def test_should_not_learn_scale_when_several_scales_give_the_match_size():
+    icon = cv2.resize(rng.integers(0, 256, (4, 4), dtype=np.uint8), (11, 11), interpolation=cv2.INTER_NEAREST)
+    screenshot = makeScreenshot(getScaledTemplate(icon, 0.95), 30, 40)
+    assert locateAtUiScale(screenshot, icon, (((0.9, 0.95, 1.0), 0.9),)) == (30, 40, 10, 10)
+    assert getUiScale() is None
+
+
+def test_should_sweep_presence_checks_without_learning():
+    setUiScale(0.9)
+    screenshot = makeScreenshot(getScaledTemplate(template, 1.25), 30, 40)
+    assert locateAtUiScale(screenshot, template, ((scales, 0.9),), anchor=False) == (30, 40, 40, 30)
+    assert getUiScale() == 0.9
+
+
+def test_should_persist_only_changed_scales():
+    persistSpy = []
+    configureUiScale(scale=1.1, persist=persistSpy.append)
+    setUiScale(1.105)
+    assert persistSpy == []
+    setUiScale(1.2)
+    assert persistSpy == [1.2]
+
+
+def test_should_ignore_learned_scale_when_disabled():
+    setUiScale(1.1)
+    configureUiScale(enabled=False)
+    assert getUiScale() is None
+    assert getScalesToTry(scales) == scales